@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, ClassVar, Dict, List, Optional, Union
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Union
 
 from pyscrew.utils import get_logger, resolve_scenario_name
 
@@ -41,6 +41,7 @@ class PipelineKeys:
     # System keys
     CACHE_DIR: ClassVar[str] = "cache_dir"
     FORCE_DOWNLOAD: ClassVar[str] = "force_download"
+    N_JOBS: ClassVar[str] = "n_jobs"
 
 
 class PipelineOptions:
@@ -48,19 +49,37 @@ class PipelineOptions:
 
     MEASUREMENTS: List[str] = ["torque", "angle", "gradient", "time"]
     POSITIONS: List[str] = ["left", "right", "both"]
-    OUTPUT_FORMATS: List[str] = ["numpy", "dataframe", "tensor", "list"]
+    OUTPUT_FORMATS: List[str] = [
+        "numpy",
+        "dataframe",
+        "tensor",
+        "list",
+        "arrow",
+        "polars",
+    ]
     DUPLICATE_METHODS: List[str] = ["first", "last", "mean"]
     MISSING_METHODS: List[str] = ["mean", "zero"]
     PADDING_POSITIONS: List[str] = ["pre", "post"]
     CUTOFF_POSITIONS: List[str] = ["pre", "post"]
 
+    # Frozen sets for O(1) membership checks (lists are kept for error messages)
+    _SETS: ClassVar[Dict[str, FrozenSet[str]]] = {
+        "MEASUREMENTS": frozenset(MEASUREMENTS),
+        "POSITIONS": frozenset(POSITIONS),
+        "OUTPUT_FORMATS": frozenset(OUTPUT_FORMATS),
+        "DUPLICATE_METHODS": frozenset(DUPLICATE_METHODS),
+        "MISSING_METHODS": frozenset(MISSING_METHODS),
+        "PADDING_POSITIONS": frozenset(PADDING_POSITIONS),
+        "CUTOFF_POSITIONS": frozenset(CUTOFF_POSITIONS),
+    }
+
     @classmethod
     def validate_option(cls, option_name: str, value: Any) -> bool:
         """Validate if a value is a valid option for the given option type."""
-        options_list = getattr(cls, option_name.upper(), None)
-        if options_list is None:
+        options_set = cls._SETS.get(option_name.upper())
+        if options_set is None:
             return True  # No validation if the option list doesn't exist
-        return value in options_list
+        return value in options_set
 
 
 class PipelineConfig:
@@ -70,6 +89,28 @@ class PipelineConfig:
     Keys = PipelineKeys
     Options = PipelineOptions
 
+    # Fixed attribute layout: smaller instances and faster attribute access
+    __slots__ = (
+        "scenario_name",
+        "scenario_long_name",
+        "scenario_full_name",
+        "scenario_classes",
+        "measurements",
+        "screw_phases",
+        "screw_cycles",
+        "screw_positions",
+        "handle_duplicates",
+        "handle_missings",
+        "target_length",
+        "padding_value",
+        "padding_position",
+        "cutoff_position",
+        "output_format",
+        "cache_dir",
+        "force_download",
+        "n_jobs",
+    )
+
     def __init__(
         self,
         scenario_name: str,
@@ -87,6 +128,8 @@ class PipelineConfig:
         output_format: str = "numpy",
         cache_dir: Optional[Path] = None,
         force_download: bool = False,
+        n_jobs: Optional[int] = None,
+        validate: bool = True,
     ):
         """
         Initialize pipeline configuration.
@@ -104,9 +147,14 @@ class PipelineConfig:
             padding_value: Value to use for padding shorter sequences
             padding_position: Position to add padding (pre, post)
             cutoff_position: Position to truncate longer sequences (pre, post)
-            output_format: Output format (numpy, dataframe, tensor, list)
+            output_format: Output format (numpy, dataframe, tensor, list, arrow, polars)
             cache_dir: Directory for caching downloaded data
             force_download: Force re-download even if cached
+            n_jobs: Number of worker processes for parsing the JSON files
+                (None uses the PYSCREW_N_JOBS environment variable, default 1)
+            validate: Whether to validate the settings. Only disable this for
+                known-good inputs, i.e. settings taken from another config's
+                to_dict() output (see from_dict())
         """
         # Resolve the scenario name to standardized format
         short_name, long_name, full_name = resolve_scenario_name(scenario_name)
@@ -122,16 +170,67 @@ class PipelineConfig:
 
         # Filtering settings
         self.scenario_classes = scenario_classes
-        self.measurements = self._validate_measurements(measurements)
-        self.screw_phases = self._validate_phases(screw_phases)
+        self.measurements = measurements
+        self.screw_phases = screw_phases
         self.screw_cycles = screw_cycles
-        self.screw_positions = self._validate_option("POSITIONS", screw_positions)
+        self.screw_positions = screw_positions
+
+        # Processing settings
+        self.handle_duplicates = handle_duplicates
+        self.handle_missings: Union[str, float] = handle_missings
+        self.target_length = target_length
+        self.padding_value = padding_value
+        self.padding_position = padding_position
+        self.cutoff_position = cutoff_position
+        self.output_format = output_format
+
+        # System settings
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.force_download = force_download
+        self.n_jobs = n_jobs
+
+        if validate:
+            self._validate_settings()
+
+    @classmethod
+    def from_dict(cls, config_dict: Dict[str, Any]) -> "PipelineConfig":
+        """
+        Recreate a configuration from the output of to_dict().
+
+        The settings were validated when the original config was created, so
+        they are passed to the constructor with validation disabled.
+
+        Args:
+            config_dict: Nested dictionary as produced by to_dict()
+
+        Returns:
+            New PipelineConfig instance with the stored settings
+        """
+        return cls(
+            config_dict[cls.Keys.SCENARIO][cls.Keys.SCENARIO_NAME],
+            **config_dict[cls.Keys.FILTERING],
+            **config_dict[cls.Keys.PROCESSING],
+            **config_dict[cls.Keys.SYSTEM],
+            validate=False,
+        )
+
+    def _validate_settings(self) -> None:
+        """
+        Validate and normalize all filtering and processing settings.
+
+        Raises:
+            ValueError: If any setting has an invalid value
+        """
+        # Filtering settings
+        self.measurements = self._validate_measurements(self.measurements)
+        self.screw_phases = self._validate_phases(self.screw_phases)
+        self.screw_positions = self._validate_option("POSITIONS", self.screw_positions)
 
         # Processing settings
         self.handle_duplicates = self._validate_option(
-            "DUPLICATE_METHODS", handle_duplicates
+            "DUPLICATE_METHODS", self.handle_duplicates
         )
-        self.handle_missings = self._validate_missing_method(handle_missings)
+        self.handle_missings = self._validate_missing_method(self.handle_missings)
 
         # Validate missing/duplicate dependency
         if self.handle_missings is not None and self.handle_duplicates is None:
@@ -140,19 +239,23 @@ class PipelineConfig:
                 "Please set handle_duplicates to a valid method when using handle_missings."
             )
 
-        self.target_length = target_length
-        self.padding_value = padding_value
         self.padding_position = self._validate_option(
-            "PADDING_POSITIONS", padding_position
+            "PADDING_POSITIONS", self.padding_position
         )
         self.cutoff_position = self._validate_option(
-            "CUTOFF_POSITIONS", cutoff_position
+            "CUTOFF_POSITIONS", self.cutoff_position
         )
-        self.output_format = self._validate_option("OUTPUT_FORMATS", output_format)
+        self.output_format = self._validate_option("OUTPUT_FORMATS", self.output_format)
 
         # System settings
-        self.cache_dir = Path(cache_dir) if cache_dir else None
-        self.force_download = force_download
+        if self.n_jobs is not None and (
+            not isinstance(self.n_jobs, int)
+            or isinstance(self.n_jobs, bool)
+            or self.n_jobs < 1
+        ):
+            raise ValueError(
+                f"Invalid n_jobs: {self.n_jobs}. Must be a positive integer or None."
+            )
 
     def _validate_measurements(
         self, measurements: Optional[List[str]]
@@ -161,7 +264,8 @@ class PipelineConfig:
         if measurements is None:
             return None
 
-        invalid = [m for m in measurements if m not in self.Options.MEASUREMENTS]
+        valid = self.Options._SETS["MEASUREMENTS"]
+        invalid = [m for m in measurements if m not in valid]
         if invalid:
             raise ValueError(
                 f"Invalid measurements: {invalid}. Valid options are {self.Options.MEASUREMENTS}"
@@ -182,11 +286,17 @@ class PipelineConfig:
 
     def _validate_option(self, option_type: str, value: str) -> str:
         """Validate option against allowed values."""
-        options_list = getattr(self.Options, option_type, None)
-        if options_list is None:
+        options_set = self.Options._SETS.get(option_type)
+        if options_set is None:
             return value
 
-        if value not in options_list:
+        try:
+            is_valid = value in options_set
+        except TypeError:  # Unhashable values (e.g. lists) are never valid
+            is_valid = False
+
+        if not is_valid:
+            options_list = getattr(self.Options, option_type)
             raise ValueError(
                 f"Invalid {option_type.lower()}: {value}. Valid options are {options_list}"
             )
@@ -197,7 +307,7 @@ class PipelineConfig:
         if value is None:
             return None
 
-        if value in self.Options.MISSING_METHODS:
+        if value in self.Options._SETS["MISSING_METHODS"]:
             return value
 
         try:
@@ -235,6 +345,7 @@ class PipelineConfig:
             self.Keys.SYSTEM: {
                 self.Keys.CACHE_DIR: str(self.cache_dir) if self.cache_dir else None,
                 self.Keys.FORCE_DOWNLOAD: self.force_download,
+                self.Keys.N_JOBS: self.n_jobs,
             },
         }
 
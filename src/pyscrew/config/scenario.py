@@ -1,9 +1,30 @@
+import copy
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import ClassVar, Dict, List
 
 import yaml
 
+# Prefer the libyaml-backed C loader when available, pure-Python loader otherwise
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+
+@lru_cache(maxsize=8)
+def _parse_config(config_path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a scenario YAML file, memoized per process.
+
+    The file's modification time and size are part of the cache key, so an
+    edited file is parsed again.
+    """
+    with open(config_path, "r") as f:
+        config: dict = yaml.load(f, Loader=YamlLoader)
+    return config
+
 
 @dataclass
 class ScenarioKeys:
@@ -37,6 +58,24 @@ class ScenarioConfig:
     # Class-level access to keys
     Keys = ScenarioKeys
 
+    # Fixed attribute layout: smaller instances and faster attribute access
+    __slots__ = (
+        "scenario_id",
+        "config_dir",
+        "config_path",
+        "cache_dir",
+        "force_download",
+        "names",
+        "classes",
+        "data",
+        "metadata",
+        "_class_counts",
+        "_class_conditions",
+        "_class_descriptions",
+        "_class_ids",
+        "_total_observations",
+    )
+
     def __init__(
         self,
         scenario_id: str,
@@ -79,13 +118,17 @@ class ScenarioConfig:
     def load_config(self) -> None:
         """Load the scenario configuration from YAML file."""
 
-        if not self.config_path.exists():
+        try:
+            stat = self.config_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Scenario config file not found: {self.config_path}"
-            )
+            ) from None
 
-        with open(self.config_path, "r") as f:
-            config = yaml.safe_load(f)
+        # Copy the cached parse, so instances never share mutable dicts
+        config = copy.deepcopy(
+            _parse_config(str(self.config_path), stat.st_mtime_ns, stat.st_size)
+        )
 
         # Update fields with loaded config
         self.names = config[self.Keys.NAMES]
@@ -93,6 +136,19 @@ class ScenarioConfig:
         self.data = config[self.Keys.DATA]
         self.metadata = config[self.Keys.METADATA]
 
+        # Precompute derived class information once per load
+        self._class_counts = {
+            name: info[self.Keys.COUNT] for name, info in self.classes.items()
+        }
+        self._class_conditions = {
+            name: info[self.Keys.CONDITION] for name, info in self.classes.items()
+        }
+        self._class_descriptions = {
+            name: info[self.Keys.DESCRIPTION] for name, info in self.classes.items()
+        }
+        self._class_ids = [name.partition("_")[0] for name in self.classes]
+        self._total_observations: int = sum(self._class_counts.values())
+
     def get_name(self, name_type: str = "full") -> str:
         """
         Get the scenario name based on the specified type.
@@ -113,10 +169,7 @@ class ScenarioConfig:
 
     def get_class_counts(self) -> Dict[str, int]:
         """Get dictionary of class counts."""
-        return {
-            class_name: class_info[self.Keys.COUNT]
-            for class_name, class_info in self.classes.items()
-        }
+        return self._class_counts
 
     def get_class_conditions(self) -> Dict[str, str]:
         """Get dictionary of class conditions.
@@ -124,25 +177,19 @@ class ScenarioConfig:
         Returns:
             Dictionary mapping class names to their condition values ('normal' by default)
         """
-        return {
-            class_name: class_info[self.Keys.CONDITION]
-            for class_name, class_info in self.classes.items()
-        }
+        return self._class_conditions
 
     def get_class_descriptions(self) -> Dict[str, str]:
         """Get dictionary of class descriptions."""
-        return {
-            class_name: class_info[self.Keys.DESCRIPTION]
-            for class_name, class_info in self.classes.items()
-        }
+        return self._class_descriptions
 
     def get_total_observations(self) -> int:
         """Get the total number of observations across all classes."""
-        return sum(class_info[self.Keys.COUNT] for class_info in self.classes.values())
+        return self._total_observations
 
     def get_class_ids(self) -> List[str]:
         """Get list of class IDs (numeric part only)."""
-        return [name.split("_")[0] for name in self.classes.keys()]
+        return self._class_ids
 
     def get_dataset_filename(self) -> str:
         """Get the dataset filename from the data section."""
@@ -165,7 +212,7 @@ class ScenarioConfig:
 
     def get_force_download(self) -> bool:
         """Get whether to force re-download even if cached."""
-        return self.force_download if hasattr(self, "force_download") else False
+        return self.force_download
 
     def __str__(self) -> str:
         """String representation of the scenario configuration."""
@@ -7,10 +7,13 @@ files and CSV label files.
 """
 
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from json.decoder import JSONDecodeError
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional, Set, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Union
 
+import numpy as np
 import pandas as pd
 
 from pyscrew.config import PipelineConfig
@@ -19,9 +22,60 @@ from pyscrew.utils.logger import get_logger
 from .fields import CsvFields, JsonFields
 from .run import ScrewRun
 
+# orjson is an optional, faster drop-in for parsing the measurement files
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = get_logger(__name__)
 
 
+def _read_n_jobs_env() -> int:
+    """
+    Read the default number of JSON parsing processes from PYSCREW_N_JOBS.
+
+    Invalid values fall back to 1 (sequential) with a warning, so a
+    malformed environment variable cannot break importing pyscrew.
+    """
+    value = os.environ.get("PYSCREW_N_JOBS", "1")
+    try:
+        n_jobs = int(value)
+    except ValueError:
+        n_jobs = 0
+    if n_jobs < 1:
+        logger.warning(
+            f"Invalid PYSCREW_N_JOBS value '{value}', parsing JSON files sequentially"
+        )
+        return 1
+    return n_jobs
+
+
+# Default number of worker processes for parsing JSON files (1 = sequential)
+DEFAULT_N_JOBS = _read_n_jobs_env()
+
+# Minimum number of files per worker before a process pool pays off
+MIN_FILES_PER_JOB = 64
+
+
+def _read_json_file(json_file: Path) -> Dict[str, Any]:
+    """
+    Read and parse a single JSON measurement file.
+
+    Defined at module level so it can be dispatched to worker processes.
+    The file is read in a single call and parsed from bytes, using orjson
+    if it is installed.
+
+    Raises:
+        ValueError: If the file does not contain valid JSON
+    """
+    try:
+        data: Dict[str, Any] = _json_loads(json_file.read_bytes())
+    except JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in {json_file.name}: {str(e)}")
+    return data
+
+
 class ScrewDataset:
     """
     Collection of screw runs loaded from specified files.
@@ -36,6 +90,8 @@ class ScrewDataset:
         scenario_classes: Optional list of class labels to include
         screw_cycles: Optional list of workpiece usage counts to include
         screw_positions: Optional specific workpiece location to filter by ("left", "right", or "both")
+        n_jobs: Number of worker processes used to parse the JSON files. Defaults
+            to the PYSCREW_N_JOBS environment variable (1, i.e. sequential)
 
     Attributes:
         data_path: Path to data directory
@@ -77,6 +133,7 @@ class ScrewDataset:
         scenario_classes: Optional[List[str]] = None,
         screw_cycles: Optional[List[int]] = None,
         screw_positions: Optional[str] = None,
+        n_jobs: Optional[int] = None,
     ) -> None:
         # Initialize paths and validate
         self.data_path = Path(data_path)
@@ -88,6 +145,7 @@ class ScrewDataset:
         self.scenario_classes = scenario_classes
         self.screw_cycles = screw_cycles
         self.screw_positions = screw_positions
+        self.n_jobs = DEFAULT_N_JOBS if n_jobs is None else n_jobs
 
         # Will be populated by pipeline transformer
         self.processed_data: Dict[str, List[List[float]]] = {}
@@ -115,6 +173,7 @@ class ScrewDataset:
             scenario_classes=config.scenario_classes,
             screw_cycles=config.screw_cycles,
             screw_positions=config.screw_positions,
+            n_jobs=config.n_jobs,
         )
 
     def _load_labels(self) -> pd.DataFrame:
@@ -134,18 +193,20 @@ class ScrewDataset:
         if not labels_path.exists():
             raise FileNotFoundError(f"Labels file not found: {labels_path}")
 
+        # Columns with only a few distinct values are read as categoricals,
+        # which store one small integer code per row instead of a string
         df = pd.read_csv(
             labels_path,
             dtype={
                 CsvFields.RUN_ID: int,
                 CsvFields.FILE_NAME: str,
-                CsvFields.CLASS_VALUE: str,
+                CsvFields.CLASS_VALUE: "category",
                 CsvFields.WORKPIECE_ID: str,
                 CsvFields.WORKPIECE_DATE: str,
                 CsvFields.WORKPIECE_USAGE: int,
-                CsvFields.WORKPIECE_RESULT: str,
-                CsvFields.WORKPIECE_LOCATION: str,
-                CsvFields.SCENARIO_CONDITION: str,
+                CsvFields.WORKPIECE_RESULT: "category",
+                CsvFields.WORKPIECE_LOCATION: "category",
+                CsvFields.SCENARIO_CONDITION: "category",
                 CsvFields.SCENARIO_EXCEPTION: int,
             },
         )
@@ -170,18 +231,14 @@ class ScrewDataset:
         """
         df = self.labels_df
 
-        # Get full ranges if filters are None
-        scenario_classes = (
-            self.scenario_classes or df[CsvFields.CLASS_VALUE].unique().tolist()
-        )
-        screw_cycles = (
-            self.screw_cycles or df[CsvFields.WORKPIECE_USAGE].unique().tolist()
-        )
-
-        # Apply filters
-        mask = df[CsvFields.CLASS_VALUE].isin(scenario_classes) & df[
-            CsvFields.WORKPIECE_USAGE
-        ].isin(screw_cycles)
+        # Only apply filters that are set, since a None filter includes all values.
+        # The mask is a plain boolean array, so combining the filters involves
+        # no index alignment
+        mask = np.ones(len(df), dtype=bool)
+        if self.scenario_classes:
+            mask &= df[CsvFields.CLASS_VALUE].isin(self.scenario_classes).to_numpy()
+        if self.screw_cycles:
+            mask &= df[CsvFields.WORKPIECE_USAGE].isin(self.screw_cycles).to_numpy()
 
         # Handle position filtering
         if self.screw_positions is not None:
@@ -193,9 +250,11 @@ class ScrewDataset:
                 )
 
             if self.screw_positions != "both":
-                mask &= df[CsvFields.WORKPIECE_LOCATION] == self.screw_positions
+                mask &= (
+                    df[CsvFields.WORKPIECE_LOCATION] == self.screw_positions
+                ).to_numpy()
 
-        filtered_files = df[mask].index.tolist()
+        filtered_files = df.index[mask].tolist()
         logger.info(f"Selected {len(filtered_files)} files")
         return filtered_files
 
@@ -225,29 +284,43 @@ class ScrewDataset:
         """
         runs = []
 
+        # Convert the label rows of the selected files to plain dictionaries
+        # once, so the per-file lookups below do not go through pandas
+        label_rows = self.labels_df.loc[self.file_names].to_dict(orient="index")
+
+        # Resolve the JSON path for each file from its class subdirectory.
+        # Each class directory is listed once, instead of checking every
+        # file for existence separately
+        json_files = []
+        class_dir_entries: Dict[str, Set[str]] = {}
         for file_name in self.file_names:
-            # Get the class value for this file from the labels DataFrame
-            class_value = str(self.labels_df.loc[file_name, CsvFields.CLASS_VALUE])
+            # Get the class value for this file from the label data
+            class_value = str(label_rows[file_name][CsvFields.CLASS_VALUE])
 
             # Construct path including class subdirectory
             json_file = self.json_path / class_value / file_name
 
-            if not json_file.exists():
+            if class_value not in class_dir_entries:
+                try:
+                    class_dir_entries[class_value] = set(
+                        os.listdir(self.json_path / class_value)
+                    )
+                except (FileNotFoundError, NotADirectoryError):
+                    class_dir_entries[class_value] = set()
+
+            if file_name not in class_dir_entries[class_value]:
                 raise FileNotFoundError(
                     f"File not found: {json_file}\n"
                     f"Expected file in class directory: {class_value}"
                 )
+            json_files.append(json_file)
 
+        for file_name, json_data in zip(
+            self.file_names, self._parse_json_files(json_files), strict=True
+        ):
             try:
-                # Load JSON data
-                with open(json_file, "r") as f:
-                    try:
-                        json_data = json.load(f)
-                    except JSONDecodeError as e:
-                        raise ValueError(f"Invalid JSON in {file_name}: {str(e)}")
-
-                # Create label data dictionary from DataFrame row
-                row = self.labels_df.loc[file_name]
+                # Create label data dictionary from the label row
+                row = label_rows[file_name]
                 label_data = {
                     CsvFields.RUN_ID: row[CsvFields.RUN_ID],
                     CsvFields.FILE_NAME: file_name,
@@ -270,6 +343,38 @@ class ScrewDataset:
         logger.info(f"Successfully loaded {len(runs)} screw runs")
         return runs
 
+    def _parse_json_files(self, json_files: List[Path]) -> Iterator[Dict[str, Any]]:
+        """
+        Parse JSON measurement files, in parallel if configured.
+
+        Parsing is CPU-bound and holds the GIL, so worker processes are used
+        instead of threads. Small datasets are parsed sequentially, since the
+        process start-up would outweigh the gain.
+
+        Sequential parsing is lazy, so each parsed dictionary can be released
+        as soon as its ScrewRun has been built. The process pool submits all
+        files up front, so parsed files that arrive before they are consumed
+        are held in memory until then.
+
+        Args:
+            json_files: Paths of the JSON files to parse
+
+        Yields:
+            Parsed JSON dictionaries in input order
+
+        Raises:
+            ValueError: If a file does not contain valid JSON
+        """
+        n_jobs = min(self.n_jobs, len(json_files) // MIN_FILES_PER_JOB)
+        if n_jobs <= 1:
+            yield from map(_read_json_file, json_files)
+            return
+
+        logger.info(f"Parsing {len(json_files)} JSON files with {n_jobs} processes")
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            chunksize = max(1, len(json_files) // (n_jobs * 4))
+            yield from executor.map(_read_json_file, json_files, chunksize=chunksize)
+
     def get_values(self, measurement_name: str) -> List[List[float]]:
         """
         Retrieve measurement values for all runs across the dataset.
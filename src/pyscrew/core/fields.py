@@ -12,6 +12,8 @@ and processed output data.
 """
 
 from dataclasses import dataclass
+from types import MappingProxyType
+from typing import ClassVar, Mapping
 
 
 @dataclass
@@ -188,6 +190,10 @@ class OutputFields:
         WORKPIECE_RESULT: Result from screw program ("OK"/"NOK")
         SCENARIO_CONDITION: Experimental condition ("normal" or "faulty")
         SCENARIO_EXCEPTION: Flag for experimental issues (0 for "no issues")
+
+        # Lookup tables
+        MEASUREMENT_FIELDS: Maps measurement names ("time", "torque", "angle",
+            "gradient") as passed to get_data() to their output field names
     """
 
     # Transformed measurement fields (from JSON)
@@ -206,3 +212,13 @@ class OutputFields:
     WORKPIECE_RESULT: str = "workpiece_result"
     SCENARIO_CONDITION: str = "scenario_condition"
     SCENARIO_EXCEPTION: str = "scenario_exception"
+
+    # Measurement names as used by PipelineConfig.measurements
+    MEASUREMENT_FIELDS: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            "time": TIME_VALUES,
+            "torque": TORQUE_VALUES,
+            "angle": ANGLE_VALUES,
+            "gradient": GRADIENT_VALUES,
+        }
+    )
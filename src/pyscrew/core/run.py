@@ -66,6 +66,20 @@ class ScrewRun:
         >>> run = ScrewRun(json_data, label_data)
     """
 
+    # Runs are created once per file, so they do not carry an instance dict
+    __slots__ = (
+        "id",
+        "date",
+        "workpiece_id",
+        "workpiece_result",
+        "class_value",
+        "workpiece_usage",
+        "workpiece_location",
+        "scenario_condition",
+        "scenario_exception",
+        "steps",
+    )
+
     def __init__(self, json_data: Dict[str, Any], label_data: Dict[str, Any]):
         try:
             # Set ID from label data
@@ -6,10 +6,22 @@ a multi-step screw operation. Each step contains measurement data (time,
 torque, angle, gradient) and metadata describing the step's properties.
 """
 
-from typing import Any, Dict, List
+from typing import Any, ClassVar, Dict, List
 
 from .fields import JsonFields
 
+# Field names are resolved once at import instead of through the nested
+# JsonFields classes for every step, since steps are created in large numbers
+_NAME = JsonFields.Step.NAME
+_STEP_TYPE = JsonFields.Step.STEP_TYPE
+_WORKPIECE_RESULT = JsonFields.Step.WORKPIECE_RESULT
+_QUALITY_CODE = JsonFields.Step.QUALITY_CODE
+_GRAPH = JsonFields.Step.GRAPH
+_TIME = JsonFields.Measurements.TIME
+_TORQUE = JsonFields.Measurements.TORQUE
+_ANGLE = JsonFields.Measurements.ANGLE
+_GRADIENT = JsonFields.Measurements.GRADIENT
+
 
 class ScrewStep:
     """
@@ -54,6 +66,27 @@ class ScrewStep:
         >>> step = ScrewStep(step_data, step_number=0)
     """
 
+    # Steps are created in large numbers, so they do not carry an instance dict
+    __slots__ = (
+        "step_number",
+        "name",
+        "step_type",
+        "workpiece_result",
+        "quality_code",
+        "time",
+        "torque",
+        "angle",
+        "gradient",
+    )
+
+    # Maps measurement names to the attributes holding their values
+    _MEASUREMENT_ATTRS: ClassVar[Dict[str, str]] = {
+        _TIME: "time",
+        _TORQUE: "torque",
+        _ANGLE: "angle",
+        _GRADIENT: "gradient",
+    }
+
     def __init__(
         self,
         step_data: Dict[str, Any],
@@ -63,16 +96,16 @@ class ScrewStep:
             # Step metadata
             self.step_number = step_number
             # Use direct dictionary access to raise KeyError if missing
-            self.name = step_data[JsonFields.Step.NAME]
-            self.step_type = step_data[JsonFields.Step.STEP_TYPE]
-            self.workpiece_result = step_data[JsonFields.Step.WORKPIECE_RESULT]
-            self.quality_code = step_data[JsonFields.Step.QUALITY_CODE]
+            self.name = step_data[_NAME]
+            self.step_type = step_data[_STEP_TYPE]
+            self.workpiece_result = step_data[_WORKPIECE_RESULT]
+            self.quality_code = step_data[_QUALITY_CODE]
             # Get measurement data as lists from "graph" in the json file
-            graph_data = step_data[JsonFields.Step.GRAPH]
-            self.time = graph_data[JsonFields.Measurements.TIME]
-            self.torque = graph_data[JsonFields.Measurements.TORQUE]
-            self.angle = graph_data[JsonFields.Measurements.ANGLE]
-            self.gradient = graph_data[JsonFields.Measurements.GRADIENT]
+            graph_data = step_data[_GRAPH]
+            self.time = graph_data[_TIME]
+            self.torque = graph_data[_TORQUE]
+            self.angle = graph_data[_ANGLE]
+            self.gradient = graph_data[_GRADIENT]
 
         except KeyError as e:
             raise ValueError(f"Required field missing in step data: {str(e)}")
@@ -106,20 +139,15 @@ class ScrewStep:
             >>> print(time_values[:3])  # First three time points
             [0.0, 0.0012, 0.0024]
         """
-        measurement_map = {
-            JsonFields.Measurements.TIME: self.time,
-            JsonFields.Measurements.TORQUE: self.torque,
-            JsonFields.Measurements.ANGLE: self.angle,
-            JsonFields.Measurements.GRADIENT: self.gradient,
-        }
-        if measurement_name not in measurement_map:
-            valid_names = list(measurement_map.keys())
+        attr = self._MEASUREMENT_ATTRS.get(measurement_name)
+        if attr is None:
+            valid_names = list(self._MEASUREMENT_ATTRS.keys())
             raise ValueError(
                 f"Invalid measurement name: {measurement_name}. "
                 f"Must be one of: {valid_names}"
             )
 
-        return measurement_map[measurement_name]
+        return getattr(self, attr)
 
     def __len__(self) -> int:
         """Return the number of measurement points in this step."""
@@ -1,13 +1,51 @@
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from pyscrew.config import PipelineConfig, ScenarioConfig
-from pyscrew.pipeline import load_data, process_data, validate_data
 from pyscrew.utils import get_logger, resolve_scenario_name
 
 logger = get_logger(__name__)
 
 
+# Scenario IDs listed by list_scenarios(), one YAML file each
+_LISTED_SCENARIOS = ("s01", "s02", "s03", "s04", "s05", "s06")
+
+
+@lru_cache(maxsize=None)
+def _scenario_row(scenario_id: str) -> Tuple[str, int, int, str]:
+    """
+    Collect the table row shown by list_scenarios() for one scenario.
+
+    The scenario YAML files ship with the package, so each row is computed
+    once per process and reused by later calls. Failures raise and are not
+    cached, so a config that could not be loaded is retried on the next call.
+
+    Args:
+        scenario_id: Short scenario name, e.g. "s01"
+
+    Returns:
+        Tuple of (long_name, class_count, total_observations, description)
+    """
+    # Load the scenario config
+    scenario_config = ScenarioConfig(scenario_id)
+
+    # Get scenario details
+    long_name = scenario_config.get_name("long")
+    class_count = len(scenario_config.classes)
+    total_observations = scenario_config.get_total_observations()
+
+    # Get first sentence of description (truncated if needed)
+    full_desc = scenario_config.metadata.get("description", "")
+    desc_first_sentence = full_desc.split(".")[0]
+    if len(desc_first_sentence) > 50:
+        description = desc_first_sentence[:83] + "..."
+    else:
+        description = desc_first_sentence
+
+    return long_name, class_count, total_observations, description
+
+
 def list_scenarios() -> None:
     """
     List all available scenarios and their descriptions.
@@ -15,7 +53,6 @@ def list_scenarios() -> None:
     Returns:
         Dictionary mapping scenario IDs to their descriptions.
     """
-
     # Get the directory where scenario YAML files are stored
     scenarios_dir = Path(__file__).parent / "scenarios"
 
@@ -27,34 +64,22 @@ def list_scenarios() -> None:
     print("-" * 135)
 
     # Loop through the six scenario files (s01.yml to s06.yml)
-    for scenario_id in ["s01", "s02", "s03", "s04", "s05", "s06"]:
-        config_path = scenarios_dir / f"{scenario_id}.yml"
-
-        if config_path.exists():
-            try:
-                # Load the scenario config
-                scenario_config = ScenarioConfig(scenario_id)
-
-                # Get scenario details
-                long_name = scenario_config.get_name("long")
-                class_count = len(scenario_config.classes)
-                total_observations = scenario_config.get_total_observations()
-
-                # Get first sentence of description (truncated if needed)
-                full_desc = scenario_config.metadata.get("description", "")
-                desc_first_sentence = full_desc.split(".")[0]
-                if len(desc_first_sentence) > 50:
-                    description = desc_first_sentence[:83] + "..."
-                else:
-                    description = desc_first_sentence
-
-                # Print row with formatted columns
-                print(
-                    f"{scenario_id:<6} {long_name:<25} {class_count:<10} {total_observations:<15} {description[13:]}"
-                )
-
-            except Exception as e:
-                print(f"{scenario_id:<6} {'ERROR: Could not load configuration':<80}")
+    for scenario_id in _LISTED_SCENARIOS:
+        if not (scenarios_dir / f"{scenario_id}.yml").exists():
+            continue
+
+        try:
+            long_name, class_count, total_observations, description = _scenario_row(
+                scenario_id
+            )
+        except Exception:
+            print(f"{scenario_id:<6} {'ERROR: Could not load configuration':<80}")
+            continue
+
+        # Print row with formatted columns
+        print(
+            f"{scenario_id:<6} {long_name:<25} {class_count:<10} {total_observations:<15} {description[13:]}"
+        )
 
     print("=" * 135)
     print(
@@ -82,6 +107,7 @@ def get_data(
     # System options
     cache_dir: Optional[Union[str, Path]] = None,
     force_download: bool = False,
+    n_jobs: Optional[int] = None,
 ) -> Dict[str, List[float]]:
     """
     Load and process screw driving data from a specific scenario.
@@ -108,10 +134,16 @@ def get_data(
             parameter supports tilde expansion (e.g., "~/my_cache") which will be automatically expanded to the
             user's home directory.
         force_download: Force re-download even if cached
+        n_jobs: Number of worker processes for parsing the JSON files. None uses the PYSCREW_N_JOBS
+            environment variable (default: 1, i.e. sequential)
 
     Returns:
         Processed data in the requested format
     """
+    # Import the pipeline lazily: it pulls in scikit-learn, pandas and numpy,
+    # which are not needed to import pyscrew or to call list_scenarios()
+    from pyscrew.pipeline import load_data, process_data, validate_data
+
     # Resolve scenario name to standardized identifiers
     short_name, long_name, full_name = resolve_scenario_name(scenario)
 
@@ -157,6 +189,7 @@ def get_data(
         output_format=output_format,
         cache_dir=cache_path,
         force_download=force_download,
+        n_jobs=n_jobs,
     )
 
     try:
@@ -168,9 +201,11 @@ def get_data(
         logger.debug("Processing raw data")
         data = process_data(pipeline_config)
 
-        # Step 3: Validate processed data
-        logger.debug("Validating processed data")
-        validate_data(data, pipeline_config)
+        # Step 3: Validate processed data (other output formats were
+        # validated on the lists, before conversion)
+        if pipeline_config.output_format == "list":
+            logger.debug("Validating processed data")
+            validate_data(data, pipeline_config)
 
         return data
 
@@ -180,9 +215,7 @@ def get_data(
 
 
 if __name__ == "__main__":
-
     for s in ["s01", "s02", "s03", "s04", "s05", "s06"]:
-
         list_scenarios()
 
         data = get_data(scenario=s)
@@ -1,3 +1,17 @@
+"""
+Data pipeline for the PyScrew package.
+
+This module provides the three stages used by get_data():
+loading (download and extraction), processing (transformer pipeline)
+and validating (checks on the processed output).
+"""
+
 from .loading import load_data
 from .processing import process_data
 from .validating import validate_data
+
+__all__ = [
+    "load_data",
+    "process_data",
+    "validate_data",
+]
@@ -22,14 +22,25 @@ The module maintains a two-tier cache structure:
 """
 
 import hashlib
+import json
+import mmap
 import os
+import re
 import shutil
+import stat
+import sys
+import threading
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Callable, ClassVar, List, Optional, Set, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
 
 from pyscrew.config import ScenarioConfig
 from pyscrew.utils.logger import get_logger
@@ -37,6 +48,54 @@ from pyscrew.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _create_session() -> requests.Session:
+    """Create a pooled HTTP session that retries transient connection failures."""
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504))
+    session.mount("https://", HTTPAdapter(pool_maxsize=4, max_retries=retries))
+
+    # Archives are already compressed, so transfer encodings only cost CPU
+    session.headers["Accept-Encoding"] = "identity"
+    return session
+
+
+# Shared session so repeated downloads reuse pooled connections
+_SESSION = _create_session()
+
+
+# Archive member names that are absolute (Unix root, backslash root or
+# Windows drive) or contain a ".." component under either separator
+_BAD_PATH_RE = re.compile(r"^(?:[\\/]|[A-Za-z]:)|(?:^|[\\/])\.\.(?:[\\/]|$)")
+
+
+def _new_md5() -> "hashlib._Hash":
+    """
+    Create an MD5 hash object for integrity checks.
+
+    MD5 is only used to compare archives against the checksums published on
+    Zenodo, so it is flagged as not security-relevant. This keeps it usable
+    on FIPS-restricted OpenSSL builds.
+    """
+    return hashlib.md5(usedforsecurity=False)
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """
+    Reserve disk space for a file of the given size.
+
+    posix_fallocate allocates the blocks up front (where the platform and file
+    system support it), which avoids fragmentation and repeated metadata
+    updates while the file grows. Elsewhere the file is only extended.
+    """
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+            return
+        except OSError:
+            pass  # Unsupported by the file system
+    os.ftruncate(fd, size)
+
+
 class SecurityError(Exception):
     """Raised when security violations occur during archive extraction, such as path traversal attempts."""
 
@@ -87,11 +146,45 @@ class DataLoader:
         - Safe archive extraction
     """
 
-    # Using a small chunk size (2MB) optimizes both download speed and memory usage
+    # Using a small chunk size (2MB) optimizes both copy speed and memory usage
     # Small chunks = more iterations and overhead
-    # Large chunks = more memory usage and potential timeout issues
+    # Large chunks = more memory usage
     CHUNK_SIZE = 2 * 1024 * 1024
 
+    # Downloads read the response in blocks of the same size as the copy
+    # chunks; smaller reads would add per-chunk overhead on fast links
+    # (checksums are computed by hashlib.file_digest with its own buffer)
+    DOWNLOAD_CHUNK_SIZE = CHUNK_SIZE
+
+    # Cached archives below this size are hashed through a read-only mmap
+    MMAP_HASH_MAX_SIZE = 2 * 1024**3
+
+    # Upper bound for threads used to verify archive members
+    MAX_WORKERS = 8
+
+    # Archives of at least this size are downloaded as parallel range requests
+    PARALLEL_DOWNLOAD_MIN_SIZE = 64 * 1024 * 1024
+    PARALLEL_DOWNLOAD_WORKERS = 4
+
+    # Download progress is reported in steps of this many bytes
+    PROGRESS_UPDATE_SIZE = 8 * 1024 * 1024
+
+    # Connect and read timeouts in seconds; the read timeout applies per socket read
+    REQUEST_TIMEOUT = (10, 60)
+
+    # Marker file with the checksum of the archive an extraction came from
+    EXTRACTION_MARKER = ".md5"
+
+    # Suffix of directories that extractions are written to before renaming
+    PARTIAL_SUFFIX = ".partial-"
+
+    # Partial directories untouched for this many seconds are considered
+    # abandoned; younger ones may belong to an extraction in another process
+    PARTIAL_MAX_AGE = 6 * 60 * 60
+
+    # Cache directories already created by any loader in this process
+    _ensured_dirs: ClassVar[Set[Path]] = set()
+
     def __init__(
         self,
         scenario_config: ScenarioConfig,
@@ -106,6 +199,7 @@ class DataLoader:
         self.scenario_config = scenario_config
         self.download_url = self.scenario_config.get_download_url()
         self.file_name = self.scenario_config.get_dataset_filename()
+        self.md5_checksum = self.scenario_config.get_md5_checksum()
 
         # Get the already-resolved cache_dir from scenario_config
         self.cache_dir = self.scenario_config.cache_dir
@@ -138,6 +232,12 @@ class DataLoader:
         - Network interruptions
         - Incomplete transfers
 
+        The member CRC check only runs if the scenario config provides no
+        MD5 checksum. An archive that matches the published MD5 is identical
+        to the original byte for byte, so all member CRCs are intact as well
+        and decompressing the whole archive again adds no assurance (members
+        are still CRC-checked as a side effect of extraction).
+
         Args:
             force: If True, force new download even if files exist
 
@@ -150,8 +250,14 @@ class DataLoader:
             ExtractionError: If archive verification fails
         """
         try:
-            # Download file if needed or if force=True
+            # Download file if needed or if force=True; this verifies the MD5
             archive_path = self._download_file(force=force)
+            if self.md5_checksum:
+                logger.debug(
+                    "Skipping archive verification for '%s' (MD5 verified)",
+                    archive_path.name,
+                )
+                return archive_path
 
             # Verify archive integrity with retry mechanism
             try:
@@ -161,7 +267,7 @@ class DataLoader:
                     f"Archive verification failed for '{archive_path.name}'. The file may be corrupted."
                 )
                 # Remove potentially corrupted file
-                archive_path.unlink()
+                self._remove_archive(archive_path)
 
                 # Implement single retry unless force was specified
                 if not force:
@@ -188,6 +294,10 @@ class DataLoader:
             └── scenario_name/  # e.g., s01_thread-degradation/
                 └── json/  # Contains all JSON data files
 
+        Archives are extracted into a temporary sibling directory that is
+        renamed into place once complete, so partial extractions are never
+        picked up by later calls.
+
         Args:
             force: If True, force re-extraction even if files exist,
                 ignoring and overwriting any existing data
@@ -205,7 +315,6 @@ class DataLoader:
         logger.info(
             f"Beginning data extraction for scenario '{self.file_name}' (force={force})"
         )
-        archive_path = self.get_data(force=force)
 
         # Get scenario name without extension
         scenario_name = Path(self.file_name).stem
@@ -214,32 +323,66 @@ class DataLoader:
         data_path = self.data_cache / scenario_name
         json_path = data_path / "json"
 
-        # Check if json directory already exists and has content
-        if not force and json_path.exists() and any(json_path.iterdir()):
+        # Existing extracted data is used without touching the archive, so the
+        # checksum and CRC verification only run when extraction is needed
+        if not force and self._has_entries(json_path):
+            marker = self._read_extraction_marker(data_path)
+            if marker == self.md5_checksum:
+                logger.info(
+                    f"Using verified extracted data for scenario '{scenario_name}' at: {json_path}"
+                )
+                return data_path
+            if marker is None:
+                # Extracted before markers were written; adopt it as it is
+                logger.info(
+                    f"Using existing extracted data for scenario '{scenario_name}' at: {json_path}"
+                )
+                self._write_extraction_marker(data_path)
+                return data_path
+            # The data came from a different archive (e.g. an older version)
             logger.info(
-                f"Using existing extracted data for scenario '{scenario_name}' at: {json_path}"
+                f"Extracted data for scenario '{scenario_name}' is outdated, re-extracting"
             )
-            return data_path
 
-        try:
-            # Clean up existing scenario directory if it exists
-            if data_path.exists():
-                self._clean_directory(data_path)
+        archive_path = self.get_data(force=force)
 
-            # Create scenario directory
-            data_path.mkdir(parents=True, exist_ok=True)
+        # Leftovers of interrupted extractions are never consumed; remove them
+        self._sweep_partial_extractions(scenario_name)
+
+        # Extract next to the final location and rename once complete, so an
+        # interrupted run never leaves a partial data directory behind
+        partial_path = data_path.with_name(
+            f"{scenario_name}{self.PARTIAL_SUFFIX}{os.urandom(4).hex()}"
+        )
+        try:
+            partial_path.mkdir(parents=True)
 
             logger.info(
                 f"Extracting archive '{archive_path.name}' to directory: {data_path}"
             )
-            self._extract_archive(archive_path, data_path)
+            self._extract_archive(archive_path, partial_path)
 
             # Verify json directory exists after extraction
-            if not json_path.exists():
+            if not (partial_path / "json").exists():
                 raise ExtractionError(
                     f"Expected json directory not found in extracted data for '{scenario_name}'"
                 )
 
+            # Record which archive the data was extracted from
+            self._write_extraction_marker(partial_path)
+
+            # Move outdated data aside (directories cannot be replaced while
+            # non-empty) and delete it once the new data is in place
+            stale_path = None
+            if data_path.exists():
+                stale_path = data_path.with_name(
+                    f"{scenario_name}{self.PARTIAL_SUFFIX}{os.urandom(4).hex()}"
+                )
+                os.replace(data_path, stale_path)
+            os.replace(partial_path, data_path)
+            if stale_path is not None:
+                self._clean_directory(stale_path)
+
             logger.info(
                 f"Extraction of '{archive_path.name}' completed successfully to: {data_path}"
             )
@@ -247,11 +390,28 @@ class DataLoader:
 
         except Exception as e:
             logger.error(f"Failed to extract dataset '{scenario_name}': {str(e)}")
-            if data_path.exists():
-                # Clean up on failure
-                self._clean_directory(data_path)
+            # Clean up on failure
+            self._clean_directory(partial_path)
             raise
 
+    def _sweep_partial_extractions(self, scenario_name: str) -> None:
+        """
+        Remove abandoned partial extraction directories of a scenario.
+
+        Only directories older than PARTIAL_MAX_AGE are removed, so an
+        extraction of the same scenario running in another process keeps its
+        directory. Younger leftovers are removed by a later sweep.
+        """
+        cutoff = time.time() - self.PARTIAL_MAX_AGE
+        for leftover in self.data_cache.glob(f"{scenario_name}{self.PARTIAL_SUFFIX}*"):
+            try:
+                if leftover.stat().st_mtime > cutoff:
+                    continue
+            except FileNotFoundError:
+                continue  # Removed by another process in the meantime
+            logger.debug("Removing leftover partial extraction '%s'", leftover)
+            self._clean_directory(leftover)
+
     def _create_secure_directory(self, path: Path, mode: int = 0o750) -> None:
         """
         Create a directory with secure permissions.
@@ -260,21 +420,59 @@ class DataLoader:
         - Owner: read/write/execute (7)
         - Group: read/execute (5)
         - Others: no permissions (0)
+
+        Directories are only created once per process; later loaders for the
+        same cache skip the mkdir/chmod system calls. Existing directories
+        are only chmod-ed if their permissions differ.
+        """
+        if path in self._ensured_dirs and path.is_dir():
+            return
+
+        try:
+            dir_stat = os.stat(path)
+        except FileNotFoundError:
+            dir_stat = None
+
+        if dir_stat is None or not stat.S_ISDIR(dir_stat.st_mode):
+            logger.debug(f"Creating directory '{path}' with permissions {oct(mode)}")
+            os.makedirs(path, exist_ok=True)
+            path.chmod(mode)
+        elif stat.S_IMODE(dir_stat.st_mode) != mode:
+            path.chmod(mode)
+        self._ensured_dirs.add(path)
+
+    def _has_entries(self, path: Path) -> bool:
         """
-        logger.debug(f"Creating directory '{path}' with permissions {oct(mode)}")
-        path.mkdir(parents=True, exist_ok=True)
-        path.chmod(mode)
+        Check if a directory exists and contains at least one entry.
 
-    def _check_file_exists(self, file_path: Path) -> bool:
+        Uses os.scandir to stop at the first entry instead of building Path
+        objects for the whole directory listing.
         """
-        Check if a file exists and is not empty.
-        Empty files could indicate interrupted downloads or extraction.
+        try:
+            with os.scandir(path) as entries:
+                return next(entries, None) is not None
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+
+    def _read_extraction_marker(self, data_path: Path) -> Optional[str]:
         """
-        exists = file_path.exists() and file_path.stat().st_size > 0
-        logger.debug(
-            f"File existence check: '{file_path.name}' exists={exists}, size={file_path.stat().st_size if exists else 0:,} bytes"
-        )
-        return exists
+        Get the checksum of the archive a directory was extracted from.
+
+        The marker file stores the MD5 checksum of the archive the data was
+        extracted from, so a changed checksum in the scenario config (i.e. a
+        new dataset version) invalidates the extracted data.
+
+        Returns:
+            Recorded MD5 hex digest, or None if the directory has no marker
+        """
+        try:
+            return (data_path / self.EXTRACTION_MARKER).read_text().strip()
+        except OSError:
+            return None
+
+    def _write_extraction_marker(self, data_path: Path) -> None:
+        """Write the archive checksum marker after a successful extraction."""
+        (data_path / self.EXTRACTION_MARKER).write_text(self.md5_checksum)
 
     def _get_archive_path(self) -> Path:
         """Get the full path for the archive file in cache."""
@@ -284,31 +482,108 @@ class DataLoader:
         """
         Calculate MD5 hash of a file using streaming.
 
-        Uses chunked reading to handle large files efficiently:
+        Files up to MMAP_HASH_MAX_SIZE are mapped read-only and hashed as a
+        single buffer, so pages go from the page cache straight to the hasher.
+        Other files use hashlib.file_digest to handle them efficiently:
         - Prevents loading entire file into memory
-        - Maintains consistent memory usage regardless of file size
-        - Allows for progress monitoring if needed
+        - Reads into a reused buffer in C, without a Python-level chunk loop
+        - Releases the GIL while hashing
         """
         logger.debug(f"Beginning MD5 calculation for '{file_path.name}'")
-        md5_hash = hashlib.md5()
 
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b""):
-                md5_hash.update(chunk)
+        with open(file_path, "rb", buffering=0) as f:
+            file_size = os.fstat(f.fileno()).st_size
+            # Empty files cannot be mapped
+            if 0 < file_size < self.MMAP_HASH_MAX_SIZE:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Ask for aggressive readahead where the platform supports it
+                    if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    md5_hash = _new_md5()
+                    md5_hash.update(mm)
+                    return md5_hash.hexdigest()
+            return hashlib.file_digest(f, _new_md5).hexdigest()
+
+    def _get_checksum_cache_path(self, file_path: Path) -> Path:
+        """Get the path of the checksum sidecar next to an archive."""
+        return file_path.with_name(f"{file_path.name}.md5.json")
+
+    def _read_cached_checksum(self, file_path: Path) -> Optional[str]:
+        """
+        Get the MD5 recorded for an archive, if the archive is unchanged.
+
+        The sidecar stores the archive's size and modification time next to
+        its hash. Any change to the file invalidates the cached value.
+
+        Returns:
+            Cached MD5 hex digest, or None if no valid entry exists
+        """
+        try:
+            file_stat = file_path.stat()
+            with open(self._get_checksum_cache_path(file_path), "r") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if (
+            isinstance(cached, dict)
+            and cached.get("size") == file_stat.st_size
+            and cached.get("mtime_ns") == file_stat.st_mtime_ns
+        ):
+            return cached.get("md5")
+        return None
+
+    def _write_cached_checksum(self, file_path: Path, md5: str) -> None:
+        """
+        Record the verified MD5 of an archive in its checksum sidecar.
+
+        The sidecar is written to a temporary file and moved into place atomically.
+        Failures are ignored, since the sidecar is only an optimization.
+        """
+        cache_path = self._get_checksum_cache_path(file_path)
+        temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            file_stat = file_path.stat()
+            with open(temp_path, "w") as f:
+                json.dump(
+                    {
+                        "size": file_stat.st_size,
+                        "mtime_ns": file_stat.st_mtime_ns,
+                        "md5": md5,
+                    },
+                    f,
+                )
+            os.replace(temp_path, cache_path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
 
-        return md5_hash.hexdigest()
+    def _remove_archive(self, archive_path: Path) -> None:
+        """Delete an archive together with its checksum sidecar."""
+        archive_path.unlink(missing_ok=True)
+        self._get_checksum_cache_path(archive_path).unlink(missing_ok=True)
 
     def _verify_checksum(self, file_path: Path) -> bool:
-        """Verify the MD5 checksum of downloaded file."""
+        """
+        Verify the MD5 checksum of downloaded file.
+
+        The archive is only hashed if its checksum sidecar is missing or
+        outdated; a successful verification refreshes the sidecar.
+        """
         logger.info(f"Verifying MD5 checksum for '{file_path.name}'...")
-        calculated_hash = self._calculate_md5(file_path)
+        calculated_hash = self._read_cached_checksum(file_path)
+        is_cached = calculated_hash is not None
+        if not is_cached:
+            calculated_hash = self._calculate_md5(file_path)
 
-        if calculated_hash != self.scenario_config.get_md5_checksum():
+        if calculated_hash != self.md5_checksum:
             logger.error("Checksum verification failed!")
-            logger.error(f"Expected: {self.scenario_config.get_md5_checksum()}")
+            logger.error(f"Expected: {self.md5_checksum}")
             logger.error(f"Got: {calculated_hash}")
             raise ChecksumError(f"File checksum mismatch for {file_path}")
 
+        if not is_cached:
+            self._write_cached_checksum(file_path, calculated_hash)
+
         logger.info(
             f"Checksum verification successful for '{file_path.name}' (MD5: {calculated_hash})"
         )
@@ -320,11 +595,18 @@ class DataLoader:
 
         The download process:
         1. Check if file exists and has valid checksum (unless force=True)
-        2. Download to temporary file with progress bar
-        3. Set secure permissions
-        4. Verify checksum
+        2. Download to temporary file with progress bar, hashing chunks inline
+        3. Verify checksum of the streamed bytes
+        4. Set secure permissions
         5. Move to final location
 
+        The MD5 digest is updated with each chunk as it is written, so no
+        second read pass over the (potentially large) archive is needed.
+        Interrupted downloads leave a '.part' file behind, which is resumed
+        with an HTTP range request on the next attempt (unless force=True).
+        Large archives are fetched as parallel range requests if the server
+        supports them (see _download_file_parallel).
+
         Args:
             force: If True, force new download even if file exists
 
@@ -350,99 +632,307 @@ class DataLoader:
                     f"Existing file '{archive_path.name}' failed checksum verification"
                 )
                 logger.info(f"Will download fresh copy of '{self.file_name}'")
-                archive_path.unlink()
+                self._remove_archive(archive_path)
 
         logger.info(
             f"Downloading dataset '{self.file_name}' from Zenodo URL: {self.download_url}"
         )
-        try:
-            # Start streaming download
-            response = requests.get(self.download_url, stream=True)
-            response.raise_for_status()
-
-            total_size = int(response.headers.get("content-length", 0))
+        # Use partial file for atomic operation; it survives interrupted downloads
+        temp_path = archive_path.with_suffix(".part")
+        if force:
+            temp_path.unlink(missing_ok=True)
 
-            # Use temporary file for atomic operation
-            temp_path = archive_path.with_suffix(".tmp")
-
-            with open(temp_path, "wb") as f:
-                with tqdm(
-                    total=total_size,
-                    unit="iB",
-                    unit_scale=True,
-                    desc="Downloading",
-                    leave=False,
-                ) as pbar:
-                    for data in response.iter_content(self.CHUNK_SIZE):
-                        size = f.write(data)
-                        pbar.update(size)
+        try:
+            # Resume an interrupted download via an HTTP range request
+            try:
+                resume_from = temp_path.stat().st_size
+            except FileNotFoundError:
+                resume_from = 0
+
+            # Large fresh downloads are split into ranges fetched concurrently
+            total_size = 0 if resume_from else self._get_parallel_download_size()
+            md5_hash = None
+            if total_size:
+                md5_hash = self._download_file_parallel(temp_path, total_size)
+            if md5_hash is None:
+                md5_hash, total_size = self._download_stream(temp_path, resume_from)
+
+            # Verify checksum before the file is moved into the cache
+            calculated_hash = md5_hash.hexdigest()
+            if calculated_hash != self.md5_checksum:
+                logger.error("Checksum verification failed!")
+                logger.error(f"Expected: {self.md5_checksum}")
+                logger.error(f"Got: {calculated_hash}")
+                temp_path.unlink(missing_ok=True)
+                raise ChecksumError(f"File checksum mismatch for {self.file_name}")
 
             # Set secure permissions before moving to final location
             # Owner: rw, Group: r, Others: none
             temp_path.chmod(0o640)
 
-            # Atomic move to final location
-            if archive_path.exists():
-                archive_path.unlink()  # Required for Windows
-            temp_path.rename(archive_path)
+            # Atomic move to final location (replace also overwrites on Windows)
+            temp_path.replace(archive_path)
+
+            # The streamed hash is already verified, so record it for later runs
+            self._write_cached_checksum(archive_path, calculated_hash)
 
             logger.info(
-                f"Download of '{self.file_name}' completed ({total_size:,} bytes). Beginning checksum verification..."
+                f"Download of '{self.file_name}' completed ({total_size:,} bytes, MD5: {calculated_hash})"
             )
-            self._verify_checksum(archive_path)
             return archive_path
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, Urllib3HTTPError) as e:
             logger.error(
                 f"Network error while downloading '{self.file_name}': {str(e)}"
             )
-            if archive_path.exists():
-                archive_path.unlink()
+            self._remove_archive(archive_path)
             raise DownloadError(f"Failed to download {self.file_name}: {str(e)}") from e
         except Exception as e:
             logger.error(
                 f"Unexpected error during download of '{self.file_name}': {str(e)}"
             )
-            if archive_path.exists():
-                archive_path.unlink()
+            self._remove_archive(archive_path)
+            raise
+
+    def _download_stream(
+        self, temp_path: Path, resume_from: int
+    ) -> Tuple["hashlib._Hash", int]:
+        """
+        Download the archive over a single connection, hashing chunks inline.
+
+        Args:
+            temp_path: Partial file to write to
+            resume_from: Number of bytes already in temp_path to resume after
+
+        Returns:
+            Tuple of (MD5 hash object of the complete file, total size in bytes)
+        """
+        # Hash while streaming to avoid a second pass over the file
+        md5_hash = _new_md5()
+        headers = {"Range": f"bytes={resume_from}-"} if resume_from else {}
+
+        # Start streaming download
+        response = _SESSION.get(
+            self.download_url,
+            stream=True,
+            headers=headers,
+            timeout=self.REQUEST_TIMEOUT,
+        )
+        if resume_from and response.status_code == 416:
+            # The partial file is not shorter than the archive (e.g. a killed
+            # preallocated download), so it cannot be resumed
+            response.close()
+            logger.info(
+                f"Partial download of '{self.file_name}' is unusable, restarting"
+            )
+            temp_path.unlink(missing_ok=True)
+            return self._download_stream(temp_path, 0)
+        response.raise_for_status()
+
+        if resume_from and response.status_code == 206:
+            logger.info(
+                f"Resuming download of '{self.file_name}' at {resume_from:,} bytes"
+            )
+            # Seed the hash with the bytes already on disk
+            with open(temp_path, "rb", buffering=0) as f:
+                md5_hash = hashlib.file_digest(f, _new_md5)
+            mode = "ab"
+        else:
+            # Server ignored the range (or nothing to resume): start over
+            resume_from = 0
+            mode = "wb"
+
+        total_size = resume_from + int(response.headers.get("content-length", 0))
+
+        # Read straight from the urllib3 stream to skip the per-chunk
+        # iterator layers of iter_content. Chunks are written unbuffered, as
+        # they are far larger than any intermediate buffer would be
+        with response, open(temp_path, mode, buffering=0) as f:
+            preallocated = mode == "wb" and total_size > 0
+            if preallocated:
+                _preallocate(f.fileno(), total_size)
+            # Progress is reported in coarse steps and mininterval throttles
+            # the terminal refreshes on fast links; non-TTY runs skip the bar
+            with tqdm(
+                total=total_size,
+                initial=resume_from,
+                unit="iB",
+                unit_scale=True,
+                desc="Downloading",
+                leave=False,
+                mininterval=0.5,
+                disable=None,
+            ) as pbar:
+                pending = 0
+                try:
+                    while data := response.raw.read(
+                        self.DOWNLOAD_CHUNK_SIZE, decode_content=True
+                    ):
+                        md5_hash.update(data)
+                        pending += f.write(data)
+                        if pending >= self.PROGRESS_UPDATE_SIZE:
+                            pbar.update(pending)
+                            pending = 0
+                finally:
+                    pbar.update(pending)
+                    # Drop reserved but unwritten space, so an interrupted
+                    # download can be resumed from what actually arrived
+                    if preallocated:
+                        f.truncate(f.tell())
+
+        return md5_hash, total_size
+
+    def _get_parallel_download_size(self) -> int:
+        """
+        Check whether the archive can be downloaded in parallel ranges.
+
+        Returns:
+            Size of the archive in bytes if the server supports range requests
+            and the archive is large enough to benefit, otherwise 0
+        """
+        try:
+            response = _SESSION.head(
+                self.download_url, allow_redirects=True, timeout=self.REQUEST_TIMEOUT
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Range support check failed, using a single stream: {e}")
+            return 0
+
+        if response.headers.get("accept-ranges", "").lower() != "bytes":
+            return 0
+        size = int(response.headers.get("content-length", 0))
+        return size if size >= self.PARALLEL_DOWNLOAD_MIN_SIZE else 0
+
+    def _download_file_parallel(
+        self, temp_path: Path, total_size: int
+    ) -> Optional["hashlib._Hash"]:
+        """
+        Download the archive as concurrent HTTP range requests.
+
+        The partial file is preallocated and every worker writes its range
+        through its own file handle, so no data is buffered in memory. The
+        MD5 is computed in one pass after all ranges are written.
+
+        Args:
+            temp_path: Partial file to write to
+            total_size: Size of the archive in bytes
+
+        Returns:
+            MD5 hash object of the downloaded file, or None if the server did
+            not honour the range requests (the caller then uses one stream)
+        """
+        workers = self.PARALLEL_DOWNLOAD_WORKERS
+        range_size = -(-total_size // workers)
+        ranges = [
+            (start, min(start + range_size, total_size) - 1)
+            for start in range(0, total_size, range_size)
+        ]
+        logger.info(f"Downloading '{self.file_name}' in {len(ranges)} parallel ranges")
+
+        # Preallocate so each worker can write its range in place
+        with open(temp_path, "wb", buffering=0) as f:
+            _preallocate(f.fileno(), total_size)
+
+        lock = threading.Lock()
+
+        def fetch_range(start: int, end: int, pbar: tqdm) -> bool:
+            response = _SESSION.get(
+                self.download_url,
+                stream=True,
+                headers={"Range": f"bytes={start}-{end}"},
+                timeout=self.REQUEST_TIMEOUT,
+            )
+            with response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    return False
+                pending = 0
+                with open(temp_path, "r+b", buffering=0) as f:
+                    f.seek(start)
+                    while data := response.raw.read(
+                        self.DOWNLOAD_CHUNK_SIZE, decode_content=True
+                    ):
+                        pending += f.write(data)
+                        if pending >= self.PROGRESS_UPDATE_SIZE:
+                            with lock:
+                                pbar.update(pending)
+                            pending = 0
+                with lock:
+                    pbar.update(pending)
+            return True
+
+        try:
+            with tqdm(
+                total=total_size,
+                unit="iB",
+                unit_scale=True,
+                desc="Downloading",
+                leave=False,
+                mininterval=0.5,
+                disable=None,
+            ) as pbar, ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [
+                    executor.submit(fetch_range, start, end, pbar)
+                    for start, end in ranges
+                ]
+                # Re-raises the first exception of any worker
+                honoured = all([future.result() for future in futures])
+        except BaseException:
+            # A preallocated file cannot be resumed, so never leave it behind
+            temp_path.unlink(missing_ok=True)
             raise
 
+        if not honoured:
+            logger.info("Server ignored the range requests, using a single stream")
+            temp_path.unlink(missing_ok=True)
+            return None
+
+        with open(temp_path, "rb", buffering=0) as f:
+            return hashlib.file_digest(f, _new_md5)
+
     def _clean_directory(self, path: Path):
         """
         Recursively remove a directory and all its contents.
         Handles Windows file locking and permission issues.
+
+        A single rmtree call is used; entries that fail to be removed (e.g.
+        read-only files on Windows) are made writable and removed again by
+        the error handler instead of walking the tree a second time.
         """
         if not path.exists():
             return
 
+        def _retry_writable(
+            func: Callable[..., object], failed_path: str, _exc: BaseException | tuple
+        ) -> None:
+            os.chmod(failed_path, stat.S_IWRITE)
+            func(failed_path)
+
         try:
-            shutil.rmtree(path, ignore_errors=False)
+            # 'onerror' is deprecated in favour of 'onexc' since Python 3.12
+            if sys.version_info >= (3, 12):
+                shutil.rmtree(path, onexc=_retry_writable)
+            else:
+                shutil.rmtree(path, onerror=_retry_writable)
         except Exception as e:
-            logger.warning(
-                f"Unable to remove directory '{path}' (will try manual removal): {e}"
-            )
-            # If rmtree fails, try manual removal
-            try:
-                for item in path.iterdir():
-                    if item.is_file():
-                        item.unlink(missing_ok=True)
-                    elif item.is_dir():
-                        self._clean_directory(item)
-                path.rmdir()
-            except Exception as e:
-                logger.error(
-                    f"Failed to clean directory '{path}'. Manual removal unsuccessful: {e}"
-                )
+            logger.error(f"Failed to clean directory '{path}': {e}")
 
     def _verify_archive(self, archive_path: Path) -> bool:
         """
         Verify the integrity of the downloaded ZIP archive.
 
-        Uses built-in testzip() to check CRC32 checksums, which:
+        Checks the CRC32 checksum of every member, which:
         - Streams through archive contents instead of loading entirely
         - Maintains constant memory usage regardless of archive size
         - Prevents potential out-of-memory issues with large archives
 
+        Members are split across a thread pool. Decompression and CRC32
+        computation run in zlib and release the GIL, so the check scales
+        with the number of cores. A ZipFile handle is not safe to share
+        between threads, so every worker opens its own; the first batch is
+        checked by the calling thread on the handle that listed the members.
+
         Args:
             archive_path: Path to the archive file
 
@@ -454,9 +944,15 @@ class DataLoader:
         """
         try:
             with zipfile.ZipFile(archive_path, "r") as zip:
-                # testzip() returns None if all CRC32 checksums match
-                if zip.testzip() is not None:
-                    raise ExtractionError("ZIP archive is corrupted")
+                members = [info for info in zip.infolist() if not info.is_dir()]
+                bad_members = self._run_batches(
+                    archive_path, zip, members, self._check_members
+                )
+
+            # Report a corrupted member, like ZipFile.testzip()
+            bad_member = next((name for name in bad_members if name), None)
+            if bad_member is not None:
+                raise ExtractionError(f"ZIP archive is corrupted: {bad_member}")
             return True
         except Exception as e:
             logger.error(
@@ -464,16 +960,78 @@ class DataLoader:
             )
             raise ExtractionError(f"Archive verification failed: {str(e)}") from e
 
+    def _run_batches(
+        self,
+        archive_path: Path,
+        zip: zipfile.ZipFile,
+        members: List[zipfile.ZipInfo],
+        func: Callable[..., Any],
+        *args: Any,
+    ) -> List[Any]:
+        """
+        Process archive members in parallel batches.
+
+        The members are split evenly into one batch per worker. The calling
+        thread processes the first batch on the already opened handle, while
+        the remaining batches run on a thread pool with their own handles.
+
+        Args:
+            archive_path: Path to the archive file
+            zip: Open handle of the archive, used by the calling thread only
+            members: Members to process
+            func: Called as func(zip, batch, *args) for every batch
+            *args: Additional arguments for func
+
+        Returns:
+            Results of func, in batch order
+
+        Raises:
+            Exception: The first exception raised for any batch
+        """
+        # Spread the members evenly across the workers
+        workers = max(1, min(os.cpu_count() or 1, self.MAX_WORKERS, len(members)))
+        batches = [members[i::workers] for i in range(workers)]
+
+        def run_with_own_handle(batch: List[zipfile.ZipInfo]) -> Any:
+            with zipfile.ZipFile(archive_path, "r") as worker_zip:
+                return func(worker_zip, batch, *args)
+
+        with ThreadPoolExecutor(max_workers=max(1, workers - 1)) as executor:
+            futures = [executor.submit(run_with_own_handle, b) for b in batches[1:]]
+            first = func(zip, batches[0], *args)
+            # Re-raises the first exception of any worker
+            return [first] + [future.result() for future in futures]
+
+    def _check_members(
+        self, zip: zipfile.ZipFile, members: List[zipfile.ZipInfo]
+    ) -> Optional[str]:
+        """
+        Read members of an archive to the end, which validates their CRC32.
+
+        Args:
+            zip: Open handle of the archive
+            members: Members to check
+
+        Returns:
+            Name of the first corrupted member, or None if all are intact
+        """
+        for info in members:
+            try:
+                with zip.open(info) as f:
+                    while f.read(self.CHUNK_SIZE):
+                        pass
+            except zipfile.BadZipFile:
+                return info.filename
+        return None
+
     def _check_path_traversal(self, path: Union[str, Path]) -> bool:
         """Check if a path attempts directory traversal."""
-        path_str = str(Path(path))
-        normalized = os.path.normpath(path_str)
+        # One compiled match per member instead of a Path/normpath roundtrip
+        return not _BAD_PATH_RE.search(str(path))
 
-        # Check for absolute paths (both Unix and Windows)
-        if os.path.isabs(path_str):
-            return False
-
-        return not (path_str != normalized or ".." in normalized.split(os.sep))
+    def _is_junk_member(self, name: str) -> bool:
+        """Check if an archive member is OS metadata that is never used."""
+        return name.startswith("__MACOSX/") or name.rpartition("/")[2] == ".DS_Store"
 
     def _extract_archive(self, archive_path: Path, extract_to: Path) -> None:
         """
@@ -488,6 +1046,12 @@ class DataLoader:
             - Pre-validates all paths
             - Atomic operation (all or nothing)
 
+        Parent directories are collected during validation and created once,
+        so the extraction workers only stream member contents to disk instead
+        of re-checking the directory tree for every file. Directory entries
+        and OS metadata (__MACOSX/, .DS_Store) are not extracted. Members are
+        extracted in parallel batches (see _run_batches).
+
         Args:
             archive_path: Path to the ZIP archive
             extract_to: Destination directory
@@ -498,20 +1062,80 @@ class DataLoader:
         """
         try:
             with zipfile.ZipFile(archive_path, "r") as zip:
+                members = []
+                directories = set()
+
                 # Validate all paths before extraction begins
-                for zip_info in zip.filelist:
+                for zip_info in zip.infolist():
                     if not self._check_path_traversal(zip_info.filename):
                         raise SecurityError(
                             f"Path traversal attempt detected: {zip_info.filename}"
                         )
+                    if zip_info.is_dir() or self._is_junk_member(zip_info.filename):
+                        continue
+                    members.append(zip_info)
+                    directories.add((extract_to / zip_info.filename).parent)
 
-                # All paths validated, proceed with extraction
-                zip.extractall(path=extract_to)
+                # All paths validated, create each directory exactly once
+                # (serially, so the workers below never race on mkdir)
+                for directory in sorted(directories):
+                    directory.mkdir(parents=True, exist_ok=True)
+
+                lock = threading.Lock()
+                with tqdm(
+                    total=len(members),
+                    desc="Extracting",
+                    unit="files",
+                    leave=False,
+                    disable=None,
+                ) as pbar:
+                    self._run_batches(
+                        archive_path,
+                        zip,
+                        members,
+                        self._extract_members,
+                        extract_to,
+                        pbar,
+                        lock,
+                    )
         except (SecurityError, ExtractionError):
             raise
         except Exception as e:
             raise ExtractionError(f"Failed to extract {archive_path}: {str(e)}") from e
 
+    def _extract_members(
+        self,
+        zip: zipfile.ZipFile,
+        members: List[zipfile.ZipInfo],
+        extract_to: Path,
+        pbar: tqdm,
+        lock: threading.Lock,
+    ) -> None:
+        """
+        Extract a batch of validated archive members.
+
+        Decompression in zlib releases the GIL, so batches running on
+        separate handles are extracted concurrently.
+
+        Args:
+            zip: Open handle of the archive
+            members: Members to extract
+            extract_to: Destination directory (parent directories must exist)
+            pbar: Shared progress bar
+            lock: Lock guarding progress bar updates
+        """
+        for zip_info in members:
+            # The unbuffered target and a size-bounded copy buffer avoid
+            # copying each (small) JSON file through several buffers
+            with zip.open(zip_info) as src, open(
+                extract_to / zip_info.filename, "wb", buffering=0
+            ) as dst:
+                shutil.copyfileobj(
+                    src, dst, max(1, min(zip_info.file_size, self.CHUNK_SIZE))
+                )
+            with lock:
+                pbar.update(1)
+
 
 def load_data(scenario_config: ScenarioConfig) -> None:
     """
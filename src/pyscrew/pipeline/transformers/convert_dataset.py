@@ -3,23 +3,26 @@ Dataset conversion for final output formats.
 
 This module provides transformer implementations for converting processed
 screw dataset measurements into different output formats. It supports
-conversion to various formats like lists, numpy arrays, and pandas DataFrames.
+conversion to various formats like lists, numpy arrays, pandas DataFrames,
+Apache Arrow tables and Polars DataFrames.
 
 Key Features:
-    - Multiple output format options (list, numpy, dataframe)
+    - Multiple output format options (list, numpy, dataframe, arrow, polars)
     - Metadata preservation
     - Measurement selection
     - Format-specific optimizations
     - Detailed validation and logging
 """
 
-import copy
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Set
 
+import numpy as np
+import pandas as pd
 from sklearn.base import BaseEstimator, TransformerMixin
 
 from pyscrew.config import PipelineConfig
 from pyscrew.core import OutputFields, ScrewDataset
+from pyscrew.pipeline.validating import validate_data
 from pyscrew.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -41,7 +44,7 @@ class DatasetConversionTransformer(BaseEstimator, TransformerMixin):
     Args:
         config: PipelineConfig object containing processing settings
             The relevant fields are:
-            - output_format: Target format for conversion ('list', 'numpy', 'dataframe')
+            - output_format: Target format for conversion ('list', 'numpy', 'dataframe', 'arrow', 'polars')
             - measurements: List of measurements to include (None means all)
 
     Attributes:
@@ -94,27 +97,36 @@ class DatasetConversionTransformer(BaseEstimator, TransformerMixin):
             ValueError: If format is invalid
             ConversionError: If required dependencies are missing
         """
-        if self.config.output_format not in ["list", "numpy", "dataframe", "tensor"]:
+        if self.config.output_format not in [
+            "list",
+            "numpy",
+            "dataframe",
+            "tensor",
+            "arrow",
+            "polars",
+        ]:
             raise ValueError(
                 f"Invalid output format: {self.config.output_format}. "
-                f"Must be one of: list, numpy, dataframe, tensor"
+                f"Must be one of: list, numpy, dataframe, tensor, arrow, polars"
             )
 
-        # Check for required dependencies based on format
-        if self.config.output_format == "numpy":
+        # Check for optional dependencies based on format
+        # (NumPy and pandas are core dependencies and imported at module level)
+        if self.config.output_format == "arrow":
             try:
-                import numpy as np  # noqa
+                import pyarrow as pa  # noqa
             except ImportError:
                 raise ConversionError(
-                    "NumPy is required for 'numpy' output format but not installed"
+                    "PyArrow is required for 'arrow' output format but not installed "
+                    "(install it with 'pip install pyscrew[arrow]')"
                 )
-        elif self.config.output_format == "dataframe":
+        elif self.config.output_format == "polars":
             try:
-                import numpy as np  # noqa
-                import pandas as pd  # noqa
+                import polars as pl  # noqa
             except ImportError:
                 raise ConversionError(
-                    "Pandas and NumPy are required for 'dataframe' output format but not installed"
+                    "Polars is required for 'polars' output format but not installed "
+                    "(install it with 'pip install pyscrew[polars]')"
                 )
             """ 
             elif self.config.output_format == "tensor":
@@ -127,6 +139,43 @@ class DatasetConversionTransformer(BaseEstimator, TransformerMixin):
             """
         return self
 
+    def _select_fields(self, processed_data: Dict[str, Any]) -> Optional[Set[str]]:
+        """Resolve the requested measurements to the set of fields to keep.
+
+        The selection is computed once per transform, so filtering the data
+        is a single set lookup per field.
+
+        Args:
+            processed_data: Processed data of the dataset
+
+        Returns:
+            Set of field names to keep, or None to keep all fields
+        """
+        if not self.config.measurements:
+            return None
+
+        fields_to_keep = set()
+        for field in self.config.measurements:
+            mapped_field = self.outputs.MEASUREMENT_FIELDS.get(field)
+            if mapped_field in processed_data:
+                fields_to_keep.add(mapped_field)
+            else:
+                logger.warning(f"Requested measurement '{field}' not found in dataset")
+
+        # Always preserve metadata fields
+        fields_to_keep.update(
+            (
+                self.outputs.CLASS_VALUES,
+                self.outputs.STEP_VALUES,
+                self.outputs.WORKPIECE_LOCATION,
+                self.outputs.WORKPIECE_USAGE,
+                self.outputs.WORKPIECE_RESULT,
+                self.outputs.SCENARIO_CONDITION,
+                self.outputs.SCENARIO_EXCEPTION,
+            )
+        )
+        return fields_to_keep
+
     def transform(self, dataset: ScrewDataset) -> ScrewDataset:
         """Transform the dataset to the requested output format.
 
@@ -144,61 +193,29 @@ class DatasetConversionTransformer(BaseEstimator, TransformerMixin):
             logger.info("Output format is 'list' - keeping the default format")
             return dataset
 
-        try:
-            # Make a copy to avoid modifying the original
-            processed_data = copy.deepcopy(dataset.processed_data)
-
-            # Filter measurements if specified
-            if self.config.measurements:
-                # Map from user input names to output field names
-                measurements_map = {
-                    "time": self.outputs.TIME_VALUES,
-                    "torque": self.outputs.TORQUE_VALUES,
-                    "angle": self.outputs.ANGLE_VALUES,
-                    "gradient": self.outputs.GRADIENT_VALUES,
-                }
-
-                fields_to_keep = []
-                for field in self.config.measurements:
-                    mapped_field = measurements_map.get(field)
-                    if mapped_field in processed_data:
-                        fields_to_keep.append(mapped_field)
-                    else:
-                        logger.warning(
-                            f"Requested measurement '{field}' not found in dataset"
-                        )
-
-                # Always preserve metadata fields
-                metadata_fields = [
-                    self.outputs.CLASS_VALUES,
-                    self.outputs.STEP_VALUES,
-                    self.outputs.WORKPIECE_LOCATION,
-                    self.outputs.WORKPIECE_USAGE,
-                    self.outputs.WORKPIECE_RESULT,
-                    self.outputs.SCENARIO_CONDITION,
-                    self.outputs.SCENARIO_EXCEPTION,
-                ]
-
-                for field in metadata_fields:
-                    if field in processed_data:
-                        fields_to_keep.append(field)
+        # The checks of validate_data work on the lists, so converted outputs
+        # are validated here, before the lists are replaced
+        validate_data(dataset.processed_data, self.config)
 
-                # Filter to keep only requested measurements and metadata
-                processed_data = {
-                    k: v for k, v in processed_data.items() if k in fields_to_keep
-                }
+        try:
+            # Shallow selection of the fields to convert: every converter
+            # builds new containers from the values and never mutates them,
+            # so the original lists do not need to be copied. Metadata is
+            # split off and the data points are counted in the same pass
+            fields_to_keep = self._select_fields(dataset.processed_data)
+            metadata: Any = None  # a dict, stored among the value lists
+            processed_data = {}
+            data_points = 0
+            for k, v in dataset.processed_data.items():
+                if k == "metadata":
+                    metadata = v
+                elif fields_to_keep is None or k in fields_to_keep:
+                    processed_data[k] = v
+                    if k == self.outputs.TIME_VALUES:
+                        data_points = sum(map(len, v))
 
             self._conversion_stats["measurements_included"] = len(processed_data)
-
-            # Count total data points
-            if self.outputs.TIME_VALUES in processed_data:
-                for time_series in processed_data[self.outputs.TIME_VALUES]:
-                    self._conversion_stats["data_points_processed"] += len(time_series)
-
-            # Extract metadata if present
-            metadata = None
-            if "metadata" in processed_data:
-                metadata = processed_data.pop("metadata")
+            self._conversion_stats["data_points_processed"] = data_points
 
             # Convert to requested format
             converted_data = self._convert_to_format(
@@ -207,7 +224,15 @@ class DatasetConversionTransformer(BaseEstimator, TransformerMixin):
 
             # Add metadata back if requested
             if self.include_metadata and metadata:
-                if self.config.output_format == "dataframe":
+                if self.config.output_format == "arrow":
+                    # For Arrow, store as schema metadata (bytes key/value pairs)
+                    converted_data = converted_data.replace_schema_metadata(
+                        {str(k): str(v) for k, v in metadata.items()}
+                    )
+                elif self.config.output_format == "polars":
+                    # Polars DataFrames have no attribute store for metadata
+                    logger.debug("Metadata is not attached to Polars output")
+                elif self.config.output_format == "dataframe":
                     # For DataFrame, add as attributes
                     converted_data.attrs = metadata
                 else:
@@ -247,11 +272,26 @@ class DatasetConversionTransformer(BaseEstimator, TransformerMixin):
 
         elif format_name == "numpy":
             try:
-                import numpy as np
+                series_fields = {
+                    self.outputs.TIME_VALUES,
+                    self.outputs.TORQUE_VALUES,
+                    self.outputs.ANGLE_VALUES,
+                    self.outputs.GRADIENT_VALUES,
+                    self.outputs.STEP_VALUES,
+                }
 
                 # Convert all values to numpy arrays
                 numpy_data = {}
                 for key, value in data.items():
+                    if key in series_fields and value:
+                        lengths = set(map(len, value))
+                        if len(lengths) > 1:
+                            # Stacking requires equal lengths (see target_length)
+                            raise ConversionError(
+                                f"Series of '{key}' differ in length "
+                                f"({min(lengths)} to {max(lengths)} values)"
+                            )
+                    # Equal-length series become one 2-D array
                     numpy_data[key] = np.array(value)
 
                 logger.info(f"Converted data to NumPy arrays")
@@ -264,12 +304,7 @@ class DatasetConversionTransformer(BaseEstimator, TransformerMixin):
 
         elif format_name == "dataframe":
             try:
-                import numpy as np
-                import pandas as pd
-
                 # For DataFrame, we need to restructure the data
-                # First, check if all series have the same length
-                series_lengths = {}
                 non_metadata_fields = [
                     self.outputs.TIME_VALUES,
                     self.outputs.TORQUE_VALUES,
@@ -278,23 +313,6 @@ class DatasetConversionTransformer(BaseEstimator, TransformerMixin):
                     self.outputs.STEP_VALUES,
                 ]
 
-                for key, series_list in data.items():
-                    if key in non_metadata_fields:  # Skip metadata fields
-                        series_lengths[key] = [len(series) for series in series_list]
-
-                # Check if all measurements have the same structure
-                keys = list(series_lengths.keys())
-                if keys and not all(
-                    series_lengths[keys[0]] == series_lengths[key] for key in keys[1:]
-                ):
-                    logger.warning(
-                        "Measurements have different lengths, DataFrame creation may not be ideal"
-                    )
-
-                # Create a DataFrame with multiindex
-                # Level 0: Series index, Level 1: Measurement type
-                dfs = []
-
                 # Get number of series
                 if self.outputs.TIME_VALUES in data:
                     num_series = len(data[self.outputs.TIME_VALUES])
@@ -311,57 +329,143 @@ class DatasetConversionTransformer(BaseEstimator, TransformerMixin):
                         )
                         return pd.DataFrame()
 
-                # Process each series
-                for i in range(num_series):
-                    series_data = {}
+                if num_series == 0:
+                    logger.warning("No data to convert to DataFrame")
+                    return pd.DataFrame()
 
-                    # Add measurement data
-                    for key in non_metadata_fields:
-                        if key in data and i < len(data[key]):
-                            series_data[key] = data[key][i]
-                        else:
-                            # Skip fields not present or series indices out of range
-                            pass
-
-                    # Create DataFrame for this series
-                    if series_data:
-                        df = pd.DataFrame(series_data)
-
-                        # Add metadata fields if available
-                        metadata_fields = [
-                            self.outputs.CLASS_VALUES,
-                            self.outputs.WORKPIECE_LOCATION,
-                            self.outputs.WORKPIECE_USAGE,
-                            self.outputs.WORKPIECE_RESULT,
-                            self.outputs.SCENARIO_CONDITION,
-                            self.outputs.SCENARIO_EXCEPTION,
-                        ]
-
-                        for field in metadata_fields:
-                            if field in data and i < len(data[field]):
-                                field_name = field.split("_")[0]  # Extract base name
-                                df[field_name] = data[field][i]
-
-                        # Add series index
-                        df["series"] = i
-                        dfs.append(df)
-
-                # Combine all series
-                if dfs:
-                    combined_df = pd.concat(dfs, ignore_index=True)
-                    logger.info(
-                        f"Converted data to DataFrame with {len(combined_df):,} rows"
+                # Build one long column per measurement instead of one
+                # DataFrame per series: all series of a measurement are
+                # concatenated into a single array. Rows are only aligned if
+                # all measurements of a series have the same length
+                columns = {}
+                series_lengths: Optional[np.ndarray] = None
+                for key in non_metadata_fields:
+                    if key not in data:
+                        continue
+                    series_list = data[key][:num_series]
+                    if len(series_list) < num_series:
+                        raise ValueError(
+                            f"Field '{key}' has {len(series_list)} series, expected {num_series}"
+                        )
+                    key_lengths = np.fromiter(
+                        map(len, series_list), dtype=np.int64, count=num_series
                     )
-                    return combined_df
-                else:
-                    logger.warning("No data to convert to DataFrame")
+                    if series_lengths is None:
+                        series_lengths = key_lengths
+                    elif not np.array_equal(series_lengths, key_lengths):
+                        logger.warning(
+                            "Measurements have different lengths, DataFrame creation may not be ideal"
+                        )
+                        raise ValueError(
+                            f"Series of '{key}' differ in length from other measurements"
+                        )
+                    columns[key] = np.concatenate(
+                        [np.asarray(series) for series in series_list]
+                    )
+
+                if series_lengths is None:
+                    logger.warning("No measurements to convert to DataFrame")
                     return pd.DataFrame()
 
+                # Repeat the per-series metadata for each row of its series
+                metadata_fields = [
+                    self.outputs.CLASS_VALUES,
+                    self.outputs.WORKPIECE_LOCATION,
+                    self.outputs.WORKPIECE_USAGE,
+                    self.outputs.WORKPIECE_RESULT,
+                    self.outputs.SCENARIO_CONDITION,
+                    self.outputs.SCENARIO_EXCEPTION,
+                ]
+                for field in metadata_fields:
+                    if field in data and len(data[field]) >= num_series:
+                        field_name = field.split("_")[0]  # Extract base name
+                        values = np.asarray(data[field][:num_series], dtype=object)
+                        columns[field_name] = pd.Series(
+                            np.repeat(values, series_lengths)
+                        ).infer_objects()
+
+                # Add series index
+                columns["series"] = np.repeat(np.arange(num_series), series_lengths)
+
+                # The columns are freshly built arrays, so pandas can adopt
+                # them instead of copying each one again
+                combined_df = pd.DataFrame(columns, copy=False)
+                logger.info(
+                    f"Converted data to DataFrame with {len(combined_df):,} rows"
+                )
+                return combined_df
+
             except Exception as e:
                 raise ConversionError(
                     f"Failed to convert to DataFrame format: {str(e)}"
                 ) from e
 
+        elif format_name == "arrow":
+            try:
+                import pyarrow as pa
+
+                # One row per run; measurements become list<double> columns,
+                # which store all samples in a single contiguous buffer
+                # (float64, so no precision is lost against the list output)
+                measurement_fields = [
+                    self.outputs.TIME_VALUES,
+                    self.outputs.TORQUE_VALUES,
+                    self.outputs.ANGLE_VALUES,
+                    self.outputs.GRADIENT_VALUES,
+                ]
+
+                arrow_columns = {}
+                for key, value in data.items():
+                    if key in measurement_fields:
+                        arrow_columns[key] = pa.array(
+                            value, type=pa.list_(pa.float64())
+                        )
+                    else:
+                        arrow_columns[key] = pa.array(value)
+
+                table = pa.table(arrow_columns)
+                logger.info(
+                    f"Converted data to Arrow table with {table.num_rows:,} rows"
+                )
+                return table
+
+            except Exception as e:
+                raise ConversionError(
+                    f"Failed to convert to Arrow format: {str(e)}"
+                ) from e
+
+        elif format_name == "polars":
+            try:
+                import polars as pl
+
+                # One row per run; measurements become List(Float64) columns
+                measurement_fields = [
+                    self.outputs.TIME_VALUES,
+                    self.outputs.TORQUE_VALUES,
+                    self.outputs.ANGLE_VALUES,
+                    self.outputs.GRADIENT_VALUES,
+                ]
+
+                polars_columns = []
+                for key, value in data.items():
+                    if key in measurement_fields:
+                        polars_columns.append(
+                            pl.Series(key, value, dtype=pl.List(pl.Float64))
+                        )
+                    else:
+                        polars_columns.append(pl.Series(key, value))
+
+                df = pl.DataFrame(polars_columns)
+                logger.info(
+                    f"Converted data to Polars DataFrame with {df.height:,} rows"
+                )
+                return df
+
+            except Exception as e:
+                raise ConversionError(
+                    f"Failed to convert to Polars format: {str(e)}"
+                ) from e
+
             """
             elif format_name == "tensor":
                 try:
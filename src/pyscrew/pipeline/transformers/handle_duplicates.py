@@ -14,7 +14,7 @@ Key Features:
 """
 
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
 
 import numpy as np
 from numpy.typing import NDArray
@@ -128,13 +128,20 @@ class HandleDuplicatesTransformer(BaseEstimator, TransformerMixin):
                 f"Inconsistent array lengths: {[len(arr) for arr in arrays]}"
             )
 
-        # Check for NaN/inf values
+        # Check for NaN/inf values. Integer arrays are always finite, and for
+        # floats min/max propagate NaN and expose inf without a boolean mask
         for arr_name, arr in zip(
             ["time", "torque", "angle", "gradient", "steps"],
             arrays,
             strict=False,
         ):
-            if not np.isfinite(arr).all():
+            if arr.dtype.kind in "biu" or arr.size == 0:
+                continue
+            if arr.dtype.kind == "f":
+                is_finite = np.isfinite(arr.min()) and np.isfinite(arr.max())
+            else:
+                is_finite = np.isfinite(arr).all()
+            if not is_finite:
                 raise DuplicateProcessingError(
                     f"Found NaN or infinite values in {arr_name}"
                 )
@@ -146,6 +153,7 @@ class HandleDuplicatesTransformer(BaseEstimator, TransformerMixin):
         angle: NDArray[np.float64],
         gradient: NDArray[np.float64],
         steps: NDArray[np.float64],
+        process_method: Optional[Callable[..., Dict[str, List[float]]]] = None,
     ) -> Dict[str, List[float]]:
         """Process a single measurement series.
 
@@ -155,6 +163,8 @@ class HandleDuplicatesTransformer(BaseEstimator, TransformerMixin):
             angle: Angle measurements
             gradient: Gradient measurements
             steps: Step indicators
+            process_method: Method handling series with duplicates, as returned
+                by _get_process_method (resolved from the config if None)
 
         Returns:
             Dictionary containing processed measurements
@@ -165,98 +175,222 @@ class HandleDuplicatesTransformer(BaseEstimator, TransformerMixin):
         try:
             self._validate_arrays(time, torque, angle, gradient, steps)
 
-            if self.config.handle_duplicates == "first":
-                _, unique_indices = np.unique(time, return_index=True)
-                mask = np.isin(np.arange(len(time)), unique_indices)
-            elif self.config.handle_duplicates == "last":
-                _, unique_indices = np.unique(time[::-1], return_index=True)
-                mask = np.isin(np.arange(len(time)), len(time) - 1 - unique_indices)
-            else:  # mean method
-                unique_times, inverse_indices, counts = np.unique(
-                    time, return_inverse=True, return_counts=True
-                )
+            # Most series are strictly increasing in time and have no duplicates
+            if len(time) < 2 or (time[1:] > time[:-1]).all():
+                return self._process_unique(time, torque, angle, gradient, steps)
 
-                # Track duplicate statistics
-                for i in range(len(unique_times)):
-                    if counts[i] > 1:
-                        idx = np.where(inverse_indices == i)[0]
-                        duplicates_removed = counts[i] - 1
-                        self._stats.total_removed += duplicates_removed
-
-                        # Check if all values at these indices are identical
-                        all_match = (
-                            len(np.unique(torque[idx])) == 1
-                            and len(np.unique(angle[idx])) == 1
-                            and len(np.unique(gradient[idx])) == 1
-                        )
-
-                        if all_match:
-                            self._stats.total_true_duplicates += duplicates_removed
-                        else:
-                            self._stats.total_value_differences += duplicates_removed
-
-                # Calculate means for each unique time
-                mean_values = {
-                    self.outputs.TIME_VALUES: unique_times,
-                    self.outputs.TORQUE_VALUES: np.zeros_like(unique_times),
-                    self.outputs.ANGLE_VALUES: np.zeros_like(unique_times),
-                    self.outputs.GRADIENT_VALUES: np.zeros_like(unique_times),
-                    self.outputs.STEP_VALUES: np.zeros_like(unique_times),
-                }
-
-                # Calculate means for each measurement type
-                for i in range(len(unique_times)):
-                    idx = inverse_indices == i
-                    mean_values[self.outputs.TORQUE_VALUES][i] = np.mean(torque[idx])
-                    mean_values[self.outputs.ANGLE_VALUES][i] = np.mean(angle[idx])
-                    mean_values[self.outputs.GRADIENT_VALUES][i] = np.mean(
-                        gradient[idx]
-                    )
-                    mean_values[self.outputs.STEP_VALUES][i] = np.mean(steps[idx])
-
-                return {k: v.tolist() for k, v in mean_values.items()}
-
-            # For first/last methods
-            if self.config.handle_duplicates in ["first", "last"]:
-                duplicate_indices = np.where(~mask)[0]
-                series_true_duplicates = 0
-                series_value_differences = 0
-
-                for dup_idx in duplicate_indices:
-                    # Find the kept index
-                    kept_idx = (
-                        np.where(mask[: dup_idx + 1])[0][-1]
-                        if self.config.handle_duplicates == "first"
-                        else np.where(mask[dup_idx:])[0][0] + dup_idx
-                    )
-
-                    # Check for true duplicates
-                    matches = [
-                        torque[kept_idx] == torque[dup_idx],
-                        angle[kept_idx] == angle[dup_idx],
-                        gradient[kept_idx] == gradient[dup_idx],
-                    ]
-
-                    if all(matches):
-                        series_true_duplicates += 1
-                    else:
-                        series_value_differences += 1
-
-                self._stats.total_true_duplicates += series_true_duplicates
-                self._stats.total_value_differences += series_value_differences
-                self._stats.total_removed += len(duplicate_indices)
-
-                return {
-                    self.outputs.TIME_VALUES: time[mask].tolist(),
-                    self.outputs.TORQUE_VALUES: torque[mask].tolist(),
-                    self.outputs.ANGLE_VALUES: angle[mask].tolist(),
-                    self.outputs.GRADIENT_VALUES: gradient[mask].tolist(),
-                    self.outputs.STEP_VALUES: steps[mask].tolist(),
-                }
+            if process_method is None:
+                process_method = self._get_process_method()
+            return process_method(time, torque, angle, gradient, steps)
 
         except Exception as e:
             raise DuplicateProcessingError(f"Failed to process series: {str(e)}") from e
 
+    def _get_process_method(self) -> Callable[..., Dict[str, List[float]]]:
+        """Resolve the configured handling method to its implementation once.
+
+        Returns:
+            Bound method processing a series that contains duplicates
+        """
+        return {
+            "mean": self._process_mean,
+            "first": self._process_first,
+            "last": self._process_last,
+        }[self.config.handle_duplicates]
+
+    def _process_first(
+        self,
+        time: NDArray[np.float64],
+        torque: NDArray[np.float64],
+        angle: NDArray[np.float64],
+        gradient: NDArray[np.float64],
+        steps: NDArray[np.float64],
+    ) -> Dict[str, List[float]]:
+        """Keep the first occurrence of each time point."""
+        return self._process_kept(time, torque, angle, gradient, steps, False)
+
+    def _process_last(
+        self,
+        time: NDArray[np.float64],
+        torque: NDArray[np.float64],
+        angle: NDArray[np.float64],
+        gradient: NDArray[np.float64],
+        steps: NDArray[np.float64],
+    ) -> Dict[str, List[float]]:
+        """Keep the last occurrence of each time point."""
+        return self._process_kept(time, torque, angle, gradient, steps, True)
+
+    def _process_kept(
+        self,
+        time: NDArray[np.float64],
+        torque: NDArray[np.float64],
+        angle: NDArray[np.float64],
+        gradient: NDArray[np.float64],
+        steps: NDArray[np.float64],
+        keep_last: bool,
+    ) -> Dict[str, List[float]]:
+        """Keep one occurrence of each time point and drop the others.
+
+        Args:
+            time: Time measurements
+            torque: Torque measurements
+            angle: Angle measurements
+            gradient: Gradient measurements
+            steps: Step indicators
+            keep_last: Whether to keep the last instead of the first occurrence
+
+        Returns:
+            Dictionary containing the kept measurements
+        """
+        # Mark the kept occurrence of each unique time point
+        n = len(time)
+        mask = np.zeros(n, dtype=bool)
+        if keep_last:
+            _, unique_indices = np.unique(time[::-1], return_index=True)
+            mask[n - 1 - unique_indices] = True
+        else:
+            _, unique_indices = np.unique(time, return_index=True)
+            mask[unique_indices] = True
+
+        # Compare each removed point against its kept counterpart: the
+        # nearest kept point before it (first) or after it (last). The
+        # number of kept points up to a removed point indexes the kept
+        # positions directly, so no per-point position array is needed
+        duplicate_indices = np.flatnonzero(~mask)
+        kept_before = np.cumsum(mask)[duplicate_indices]
+        if not keep_last:
+            kept_before -= 1
+        kept_indices = np.flatnonzero(mask)[kept_before]
+        matches = (
+            (torque[kept_indices] == torque[duplicate_indices])
+            & (angle[kept_indices] == angle[duplicate_indices])
+            & (gradient[kept_indices] == gradient[duplicate_indices])
+        )
+        series_true_duplicates = int(np.count_nonzero(matches))
+
+        self._stats.total_true_duplicates += series_true_duplicates
+        self._stats.total_value_differences += (
+            len(duplicate_indices) - series_true_duplicates
+        )
+        self._stats.total_removed += len(duplicate_indices)
+
+        return {
+            self.outputs.TIME_VALUES: time[mask].tolist(),
+            self.outputs.TORQUE_VALUES: torque[mask].tolist(),
+            self.outputs.ANGLE_VALUES: angle[mask].tolist(),
+            self.outputs.GRADIENT_VALUES: gradient[mask].tolist(),
+            self.outputs.STEP_VALUES: steps[mask].tolist(),
+        }
+
+    def _process_unique(
+        self,
+        time: NDArray[np.float64],
+        torque: NDArray[np.float64],
+        angle: NDArray[np.float64],
+        gradient: NDArray[np.float64],
+        steps: NDArray[np.float64],
+    ) -> Dict[str, List[float]]:
+        """Return a series without duplicates unchanged.
+
+        The mean method always yields float values, so other measurements are
+        cast accordingly to match the output of a full mean computation.
+
+        Args:
+            time: Time measurements (strictly increasing)
+            torque: Torque measurements
+            angle: Angle measurements
+            gradient: Gradient measurements
+            steps: Step indicators
+
+        Returns:
+            Dictionary containing the unchanged measurements
+        """
+        if self.config.handle_duplicates == "mean":
+            torque, angle, gradient, steps = (
+                np.asarray(values, dtype=np.float64)
+                for values in (torque, angle, gradient, steps)
+            )
+
+        return {
+            self.outputs.TIME_VALUES: time.tolist(),
+            self.outputs.TORQUE_VALUES: torque.tolist(),
+            self.outputs.ANGLE_VALUES: angle.tolist(),
+            self.outputs.GRADIENT_VALUES: gradient.tolist(),
+            self.outputs.STEP_VALUES: steps.tolist(),
+        }
+
+    def _process_mean(
+        self,
+        time: NDArray[np.float64],
+        torque: NDArray[np.float64],
+        angle: NDArray[np.float64],
+        gradient: NDArray[np.float64],
+        steps: NDArray[np.float64],
+    ) -> Dict[str, List[float]]:
+        """Average all measurements that share a time point.
+
+        Points are sorted by time once; groups are the runs of equal values
+        in the sorted times (found with np.diff). Group sums are computed
+        with np.bincount and group extrema with ufunc.reduceat, so each
+        series is processed in a fixed number of array operations instead
+        of one Python iteration per unique time.
+
+        Args:
+            time: Time measurements
+            torque: Torque measurements
+            angle: Angle measurements
+            gradient: Gradient measurements
+            steps: Step indicators
+
+        Returns:
+            Dictionary containing averaged measurements
+        """
+        # Sort points by time so every group forms a contiguous block
+        order = np.argsort(time, kind="stable")
+        sorted_times = time[order]
+        is_start = np.empty(len(time), dtype=bool)
+        is_start[:1] = True
+        np.not_equal(sorted_times[1:], sorted_times[:-1], out=is_start[1:])
+
+        starts = np.flatnonzero(is_start)
+        unique_times = sorted_times[starts]
+        counts = np.diff(np.append(starts, len(time)))
+        inverse_indices = np.empty(len(time), dtype=np.intp)
+        inverse_indices[order] = np.cumsum(is_start) - 1
+
+        # Track duplicate statistics for groups with more than one point
+        duplicated = counts > 1
+        if duplicated.any():
+            # A group is a true duplicate if min == max for every measurement.
+            # The measurements are stacked as columns, so each extremum is a
+            # single reduction over all of them
+            grouped = np.column_stack((torque, angle, gradient))[order]
+            all_match = (
+                np.minimum.reduceat(grouped, starts, axis=0)
+                == np.maximum.reduceat(grouped, starts, axis=0)
+            ).all(axis=1)
+
+            removed = counts - 1
+            self._stats.total_removed += int(removed.sum())
+            self._stats.total_true_duplicates += int(removed[all_match].sum())
+            self._stats.total_value_differences += int(removed[~all_match].sum())
+
+        # Calculate means for each measurement type
+        def group_mean(values: NDArray[np.float64]) -> List[float]:
+            sums = np.bincount(
+                inverse_indices, weights=values, minlength=len(unique_times)
+            )
+            means: List[float] = (sums / counts).tolist()
+            return means
+
+        return {
+            self.outputs.TIME_VALUES: unique_times.tolist(),
+            self.outputs.TORQUE_VALUES: group_mean(torque),
+            self.outputs.ANGLE_VALUES: group_mean(angle),
+            self.outputs.GRADIENT_VALUES: group_mean(gradient),
+            self.outputs.STEP_VALUES: group_mean(steps),
+        }
+
     def fit(self, dataset: ScrewDataset, y=None) -> "HandleDuplicatesTransformer":
         """Validate handling method and data structure.
 
@@ -317,50 +451,54 @@ class HandleDuplicatesTransformer(BaseEstimator, TransformerMixin):
         for field in metadata_fields:
             if field in dataset.processed_data:
                 processed_data[field] = dataset.processed_data[field]
-                logger.debug(f"Preserved metadata field: {field}")
+                logger.debug("Preserved metadata field: %s", field)
 
         try:
+            # Bind the input columns once instead of looking them up per run
+            input_data = dataset.processed_data
+            times = input_data[self.outputs.TIME_VALUES]
+            torques = input_data[self.outputs.TORQUE_VALUES]
+            angles = input_data[self.outputs.ANGLE_VALUES]
+            gradients = input_data[self.outputs.GRADIENT_VALUES]
+            # Handle steps if they exist in processed_data
+            step_lists = input_data.get(self.outputs.STEP_VALUES)
+
+            measurement_fields = [
+                self.outputs.TIME_VALUES,
+                self.outputs.TORQUE_VALUES,
+                self.outputs.ANGLE_VALUES,
+                self.outputs.GRADIENT_VALUES,
+                self.outputs.STEP_VALUES,
+            ]
+            output_lists = [processed_data[field] for field in measurement_fields]
+
+            # Resolve the handling method once for all runs
+            process_method = self._get_process_method()
+
             # Process each run
-            self._stats.total_series = len(
-                dataset.processed_data[self.outputs.TIME_VALUES]
-            )
+            self._stats.total_series = len(times)
 
             for idx in range(self._stats.total_series):
                 # Get measurements from processed_data as numpy arrays
-                time = np.array(dataset.processed_data[self.outputs.TIME_VALUES][idx])
-                torque = np.array(
-                    dataset.processed_data[self.outputs.TORQUE_VALUES][idx]
-                )
-                angle = np.array(dataset.processed_data[self.outputs.ANGLE_VALUES][idx])
-                gradient = np.array(
-                    dataset.processed_data[self.outputs.GRADIENT_VALUES][idx]
-                )
-
-                # Handle steps if they exist in processed_data
-                if self.outputs.STEP_VALUES in dataset.processed_data:
-                    steps = np.array(
-                        dataset.processed_data[self.outputs.STEP_VALUES][idx]
-                    )
+                time = np.array(times[idx])
+                torque = np.array(torques[idx])
+                angle = np.array(angles[idx])
+                gradient = np.array(gradients[idx])
+                if step_lists is not None:
+                    steps = np.array(step_lists[idx])
                 else:
                     steps = np.zeros_like(time)  # Use zeros if no steps
 
                 self._stats.total_points += len(time)
 
                 # Process the series
-                result = self._process_series(time, torque, angle, gradient, steps)
+                result = self._process_series(
+                    time, torque, angle, gradient, steps, process_method
+                )
 
                 # Store processed results
-                measurement_fields = [
-                    self.outputs.TIME_VALUES,
-                    self.outputs.TORQUE_VALUES,
-                    self.outputs.ANGLE_VALUES,
-                    self.outputs.GRADIENT_VALUES,
-                    self.outputs.STEP_VALUES,
-                ]
-
-                for field in measurement_fields:
-                    if field in result:
-                        processed_data[field].append(result[field])
+                for field, values in zip(measurement_fields, output_lists, strict=True):
+                    values.append(result[field])
 
             # Log summary statistics
             self._log_summary()
@@ -380,60 +380,42 @@ class HandleLengthsTransformer(BaseEstimator, TransformerMixin):
                         f"reference={length_reference}"
                     )
 
-        # Initialize result storage
-        transformed_data = {}
+        processed_data = dataset.processed_data
 
-        # Copy all fields from the original dataset to preserve structure
-        for key in dataset.processed_data.keys():
-            transformed_data[key] = []
+        # Determine the reference measurement field for sequence lengths
+        for reference_field in [
+            self.outputs.TIME_VALUES,
+            self.outputs.TORQUE_VALUES,
+            self.outputs.ANGLE_VALUES,
+            self.outputs.GRADIENT_VALUES,
+        ]:
+            if processed_data.get(reference_field):
+                break
+        else:
+            # No valid fields found
+            logger.warning("No valid data found for length normalization")
+            return dataset
 
-        initial_lengths = []
-        final_lengths = []
+        number_of_screw_runs = len(processed_data[reference_field])
+        initial_lengths = [len(run) for run in processed_data[reference_field]]
 
-        # Determine number of runs from a metadata field
-        if self.outputs.CLASS_VALUES in dataset.processed_data:
-            number_of_screw_runs = len(
-                dataset.processed_data[self.outputs.CLASS_VALUES]
-            )
-        else:
-            # Fall back to a measurement field
-            for field in [
-                self.outputs.TIME_VALUES,
-                self.outputs.TORQUE_VALUES,
-                self.outputs.ANGLE_VALUES,
-                self.outputs.GRADIENT_VALUES,
-            ]:
-                if field in dataset.processed_data and dataset.processed_data[field]:
-                    number_of_screw_runs = len(dataset.processed_data[field])
-                    break
-            else:
-                # No valid fields found
-                logger.warning("No valid data found for length normalization")
-                return dataset
-
-        # Process each screw cycle
-        for i in range(number_of_screw_runs):
-            # Extract single cycle data
-            screw_run_at_index = {
-                key: lst[i] if i < len(lst) else []
-                for key, lst in dataset.processed_data.items()
-                if isinstance(lst, list) and lst
-            }
-
-            # Apply length normalization
-            equal_length_values, initial_len, final_len = self.apply_equal_length(
-                screw_run_at_index
-            )
+        # Metadata and any other fields are preserved unchanged
+        transformed_data = dict(processed_data)
 
-            # Store results
-            for k, v in equal_length_values.items():
-                if k in transformed_data:
-                    transformed_data[k].append(v)
-                else:
-                    transformed_data[k] = [v]
+        # Normalize each sequence field into a preallocated 2-D array
+        for field in [
+            self.outputs.TIME_VALUES,
+            self.outputs.TORQUE_VALUES,
+            self.outputs.ANGLE_VALUES,
+            self.outputs.GRADIENT_VALUES,
+            self.outputs.STEP_VALUES,
+        ]:
+            if processed_data.get(field):
+                transformed_data[field] = self._normalize_field(
+                    field, processed_data[field]
+                ).tolist()
 
-            initial_lengths.append(initial_len)
-            final_lengths.append(final_len)
+        final_lengths = [self.config.target_length] * number_of_screw_runs
 
         # Update statistics
         self._stats.total_series = number_of_screw_runs
@@ -448,6 +430,60 @@ class HandleLengthsTransformer(BaseEstimator, TransformerMixin):
         dataset.processed_data = transformed_data
         return dataset
 
+    def _normalize_field(self, field: str, runs: List[List[Any]]) -> np.ndarray:
+        """
+        Pad or truncate all runs of one field into a (runs, target_length) array.
+
+        The array is prefilled with the padding value, so padding only requires
+        copying each run into its slice. Time is padded with values continuing
+        in 0.0012s increments and steps are padded with -1, matching
+        apply_padding().
+
+        Step indicators are normalized into an int64 array, all measurements
+        into float64, so tolist() returns ints for steps and floats otherwise
+        (integer measurement values become the equal floats).
+
+        Args:
+            field: Output field name of the sequences
+            runs: List of sequences, one per screw run
+
+        Returns:
+            Array holding the length-normalized sequences
+        """
+        target_length = self.config.target_length
+        pad_pre = self.config.padding_position == "pre"
+        cut_pre = self.config.cutoff_position == "pre"
+        is_time = field == self.outputs.TIME_VALUES
+        fill = -1 if field == self.outputs.STEP_VALUES else self.config.padding_value
+
+        dtype = np.int64 if field == self.outputs.STEP_VALUES else np.float64
+        normalized = np.full((len(runs), target_length), fill, dtype=dtype)
+
+        for i, run in enumerate(runs):
+            run_length = len(run)
+
+            if run_length > target_length:
+                # Truncate based on cutoff position
+                normalized[i] = run[-target_length:] if cut_pre else run[:target_length]
+                continue
+
+            pad_len = target_length - run_length
+            start = pad_len if pad_pre else 0
+            normalized[i, start : start + run_length] = run
+
+            if is_time and pad_len > 0:
+                # Time gets padded with incrementing values
+                last_time = run[-1]
+                padding = [
+                    round(last_time + (j + 1) * 0.0012, 4) for j in range(pad_len)
+                ]
+                if pad_pre:
+                    normalized[i, :pad_len] = padding
+                else:
+                    normalized[i, run_length:] = padding
+
+        return normalized
+
     def _log_summary(self) -> None:
         """Log summary statistics of length normalization processing."""
         stats = self._stats
@@ -14,7 +14,7 @@ Key Features:
 """
 
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import numpy as np
 from numpy.typing import NDArray
@@ -160,44 +160,64 @@ class HandleMissingsTransformer(BaseEstimator, TransformerMixin):
             # Simply perform linear interpolation for all cases
             return np.interp(time_target_arr, time_original_arr, values_arr)
 
-        elif self.config.handle_missings == "zero":
-            result = np.zeros_like(time_target_arr)
-
-            # Use isclose() with appropriate tolerances
-            matches = np.isclose(
-                time_target_arr.reshape(-1, 1),
-                time_original_arr,
-                rtol=1e-09,  # Relative tolerance
-                atol=1e-12,  # Absolute tolerance
-            )
-            match_indices = np.where(matches.any(axis=1))[0]
-            orig_indices = np.where(matches[match_indices])[1]
-
-            result[match_indices] = values_arr[orig_indices]
-            return result
-
+        # Fill every target point without an original measurement with a constant
+        if self.config.handle_missings == "zero":
+            fill_value = 0.0
         else:
             try:
                 fill_value = float(self.config.handle_missings)
-                result = np.full_like(time_target_arr, fill_value)
-
-                matches = np.isclose(
-                    time_target_arr.reshape(-1, 1),
-                    time_original_arr,
-                    rtol=1e-09,
-                    atol=1e-12,
-                )
-                match_indices = np.where(matches.any(axis=1))[0]
-                orig_indices = np.where(matches[match_indices])[1]
-
-                result[match_indices] = values_arr[orig_indices]
-                return result
-
             except (TypeError, ValueError) as e:
                 raise ProcessingError(
                     f"Invalid handle_missings value: {self.config.handle_missings}"
                 ) from e
 
+        result = np.full_like(time_target_arr, fill_value, dtype=np.float64)
+        match_indices, orig_indices = self._match_time_points(
+            time_original_arr, time_target_arr
+        )
+        result[match_indices] = values_arr[orig_indices]
+        return result
+
+    def _match_time_points(
+        self,
+        time_original: NDArray[np.float64],
+        time_target: NDArray[np.float64],
+    ) -> Tuple[NDArray[np.intp], NDArray[np.intp]]:
+        """Find target time points that coincide with an original time point.
+
+        Since the original time values are sorted, only the two neighbours found
+        by binary search can match a target point. This avoids building the full
+        (target x original) comparison matrix.
+
+        Args:
+            time_original: Sorted original time measurements
+            time_target: Target time points
+
+        Returns:
+            Tuple of (target indices, matching original indices)
+        """
+        n = len(time_original)
+        if n == 0:
+            empty = np.empty(0, dtype=np.intp)
+            return empty, empty
+
+        right = np.searchsorted(time_original, time_target, side="left")
+        left = np.clip(right - 1, 0, n - 1)
+        right = np.clip(right, 0, n - 1)
+
+        # Same tolerances as np.isclose(target, original, rtol=1e-09, atol=1e-12)
+        def is_close(candidates: NDArray[np.intp]) -> NDArray[np.bool_]:
+            original = time_original[candidates]
+            return np.abs(time_target - original) <= 1e-12 + 1e-09 * np.abs(original)
+
+        left_close = is_close(left)
+        right_close = is_close(right)
+
+        # Prefer the earlier original point if both neighbours match
+        orig_indices = np.where(left_close, left, right)
+        match_indices = np.flatnonzero(left_close | right_close)
+        return match_indices, orig_indices[match_indices]
+
     def _to_float_list(self, values: NDArray[np.float64]) -> List[float]:
         """Convert numpy array to list of Python floats with rounding.
 
@@ -207,7 +227,8 @@ class HandleMissingsTransformer(BaseEstimator, TransformerMixin):
         Returns:
             List of rounded float values
         """
-        return [float(round(x, self.decimal_places)) for x in values]
+        rounded: List[float] = np.round(values, self.decimal_places).tolist()
+        return rounded
 
     def fit(self, dataset: ScrewDataset, y=None) -> "HandleMissingsTransformer":
         """Validate interpolation parameters and data structure.
@@ -287,7 +308,7 @@ class HandleMissingsTransformer(BaseEstimator, TransformerMixin):
         for field in metadata_fields:
             if field in dataset.processed_data:
                 processed_data[field] = dataset.processed_data[field]
-                logger.debug(f"Preserved metadata field: {field}")
+                logger.debug("Preserved metadata field: %s", field)
 
         try:
             # Process each run
@@ -307,9 +328,7 @@ class HandleMissingsTransformer(BaseEstimator, TransformerMixin):
                     end_time + self.target_interval,
                     self.target_interval,
                 )
-                time_values_ideal = [
-                    round(x, self.decimal_places) for x in time_values_ideal
-                ]
+                time_values_ideal = time_values_ideal.round(self.decimal_places)
 
                 # Prepare measurement arrays
                 measurements = {
@@ -353,7 +372,7 @@ class HandleMissingsTransformer(BaseEstimator, TransformerMixin):
                         time_values_ideal, time_values, step_values
                     )
                     processed_data[self.outputs.STEP_VALUES].append(
-                        [int(x) for x in np.round(interpolated)]
+                        np.round(interpolated).astype(np.int64).tolist()
                     )
 
             # Log summary statistics
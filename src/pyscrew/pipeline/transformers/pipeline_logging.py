@@ -16,6 +16,8 @@ The transformer is passive (does not modify data) and is primarily used for:
 - Confirming metadata preservation
 """
 
+import logging
+
 from sklearn.base import BaseEstimator, TransformerMixin
 
 from pyscrew.config import PipelineConfig
@@ -129,19 +131,17 @@ class PipelineLoggingTransformer(BaseEstimator, TransformerMixin):
                         logger.info(f"{field}: Present (not list type)")
                 else:
                     logger.info(f"{field}: Not present")
-        else:
-            # Log measurement info using get_values for raw dataset
+        elif logger.isEnabledFor(logging.INFO):
+            # Log measurement info for the raw dataset. get_values returns one
+            # list per run, so the run count is used instead of concatenating
+            # the step values of every run just to take the length
             for measurement in [
                 "time values",
                 "torque values",
                 "angle values",
                 "gradient values",
             ]:
-                try:
-                    values = dataset.get_values(measurement)
-                    logger.info(f"{measurement}: {len(values)} runs")
-                except Exception as e:
-                    logger.warning(f"Could not get values for {measurement}: {str(e)}")
+                logger.info(f"{measurement}: {len(dataset.screw_runs)} runs")
 
         # Log relevant configuration parameters
         if self.config.measurements:
@@ -185,9 +185,10 @@ class PipelineLoggingTransformer(BaseEstimator, TransformerMixin):
 
             # Log measurement dimensions if available
             for field in measurement_fields:
-                if field in dataset.processed_data and dataset.processed_data[field]:
-                    field_data = dataset.processed_data[field]
-                    if isinstance(field_data, list) and field_data:
+                # len() instead of truth testing, which fails for NumPy arrays
+                field_data = dataset.processed_data[field]
+                if len(field_data):
+                    if isinstance(field_data, list):
                         first_item = field_data[0]
                         if isinstance(first_item, list):
                             avg_length = sum(len(item) for item in field_data) / len(
@@ -165,66 +165,71 @@ class UnpackStepsTransformer(BaseEstimator, TransformerMixin):
         dataset.processed_data[self.outputs.SCENARIO_CONDITION] = []
         dataset.processed_data[self.outputs.SCENARIO_EXCEPTION] = []
 
+        # Build the phase filter once as a set (None means all phases)
+        screw_phases = (
+            frozenset(self.config.screw_phases) if self.config.screw_phases else None
+        )
+
+        # Resolve field names once instead of per run and step
+        processed_data = dataset.processed_data
+        output_fields = [
+            self._get_output_field_for_measurement(m) for m in selected_measurements
+        ]
+        time_field = self.measurements.TIME
+        # Time is always read, since it defines the length of each step
+        read_measurements = list(dict.fromkeys([*selected_measurements, time_field]))
+
         # Process each run in the dataset (already filtered by scenario_classes)
         for run in dataset.screw_runs:
-            # Initialize data structures for this run using output field names
-            run_data = {
-                self._get_output_field_for_measurement(m): []
-                for m in selected_measurements
-            }
+            # Filter by phase if specified (phases are 1-based, indices 0-based)
+            steps = [
+                (step_idx, step)
+                for step_idx, step in enumerate(run.steps)
+                if screw_phases is None or step_idx + 1 in screw_phases
+            ]
+
+            # Read each measurement of a step exactly once
+            step_values = [
+                {m: step.get_values(m) for m in read_measurements} for _, step in steps
+            ]
+
+            # Concatenate the steps of each measurement
+            run_data = {}
+            for measurement, output_field in zip(
+                selected_measurements, output_fields, strict=True
+            ):
+                run_values = []
+                for step_data in step_values:
+                    run_values.extend(step_data[measurement])
+                run_data[output_field] = run_values
+
+            # Record step origins
             run_steps = []
-
-            # Process each step in the run
-            for step_idx, step in enumerate(run.steps):
-                # Filter by phase if specified
-                phase_num = step_idx + 1  # Convert 0-based to 1-based
-                if (
-                    self.config.screw_phases
-                    and phase_num not in self.config.screw_phases
-                ):
-                    continue
-
-                # Get step length once for efficiency
-                step_length = len(step.get_values(self.measurements.TIME))
-
-                # Extract and append measurements for this step
-                for measurement in selected_measurements:
-                    values = step.get_values(measurement)
-                    output_field = self._get_output_field_for_measurement(measurement)
-                    run_data[output_field].extend(values)
-
-                # Record step origins
-                run_steps.extend([step_idx] * step_length)
+            for (step_idx, _), step_data in zip(steps, step_values, strict=True):
+                run_steps.extend([step_idx] * len(step_data[time_field]))
 
             # Only include the run if it has data after filtering
-            if run_data[
-                self._get_output_field_for_measurement(selected_measurements[0])
-            ]:
+            if run_data[output_fields[0]]:
                 # Add the run's data to the dataset
-                for measurement in selected_measurements:
-                    output_field = self._get_output_field_for_measurement(measurement)
-                    dataset.processed_data[output_field].append(run_data[output_field])
+                for output_field in output_fields:
+                    processed_data[output_field].append(run_data[output_field])
 
                 # Add step values and class value
-                dataset.processed_data[self.outputs.STEP_VALUES].append(run_steps)
-                dataset.processed_data[self.outputs.CLASS_VALUES].append(
-                    run.class_value
-                )
+                processed_data[self.outputs.STEP_VALUES].append(run_steps)
+                processed_data[self.outputs.CLASS_VALUES].append(run.class_value)
 
                 # Add metadata fields
-                dataset.processed_data[self.outputs.WORKPIECE_LOCATION].append(
+                processed_data[self.outputs.WORKPIECE_LOCATION].append(
                     run.workpiece_location
                 )
-                dataset.processed_data[self.outputs.WORKPIECE_USAGE].append(
-                    run.workpiece_usage
-                )
-                dataset.processed_data[self.outputs.WORKPIECE_RESULT].append(
+                processed_data[self.outputs.WORKPIECE_USAGE].append(run.workpiece_usage)
+                processed_data[self.outputs.WORKPIECE_RESULT].append(
                     run.workpiece_result
                 )
-                dataset.processed_data[self.outputs.SCENARIO_CONDITION].append(
+                processed_data[self.outputs.SCENARIO_CONDITION].append(
                     run.scenario_condition
                 )
-                dataset.processed_data[self.outputs.SCENARIO_EXCEPTION].append(
+                processed_data[self.outputs.SCENARIO_EXCEPTION].append(
                     run.scenario_exception
                 )
 
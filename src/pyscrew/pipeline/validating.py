@@ -14,7 +14,9 @@ Key features:
 """
 
 from math import isfinite
-from typing import Dict, List
+from typing import Any, Dict, List, Mapping, Union
+
+import numpy as np
 
 from pyscrew.config import PipelineConfig
 from pyscrew.core import OutputFields
@@ -29,7 +31,7 @@ class ValidationError(Exception):
     pass
 
 
-def validate_data(data: Dict[str, List[float]], config: PipelineConfig) -> bool:
+def validate_data(data: Dict[str, Any], config: PipelineConfig) -> bool:
     """
     Validate processed data against configuration constraints.
 
@@ -41,6 +43,10 @@ def validate_data(data: Dict[str, List[float]], config: PipelineConfig) -> bool:
     4. Metadata field presence and consistency
     5. Format-specific requirements
 
+    The checks work on the lists of the processed fields. Outputs in other
+    formats (numpy, dataframe, arrow, polars, ...) are validated on these
+    lists by DatasetConversionTransformer, before they are converted.
+
     Args:
         data: Dictionary containing processed measurements
         config: Pipeline configuration with validation parameters
@@ -51,6 +57,13 @@ def validate_data(data: Dict[str, List[float]], config: PipelineConfig) -> bool:
     Raises:
         ValidationError: If validation fails with detailed reason
     """
+    # The checks below work on a mapping of measurement fields
+    if not isinstance(data, Mapping):
+        raise ValidationError(
+            f"Expected a mapping of processed fields, got {type(data).__name__} "
+            f"(converted outputs are validated before conversion)"
+        )
+
     logger.info(f"Validating processed data for scenario '{config.scenario_name}'")
     outputs = OutputFields()
 
@@ -64,14 +77,18 @@ def validate_data(data: Dict[str, List[float]], config: PipelineConfig) -> bool:
         # Step 3: Verify physical value ranges
         _validate_value_ranges(data, outputs)
 
+        # Convert each measurement run to an array once; the consistency and
+        # format checks below reuse these instead of re-walking the lists
+        arrays = _to_measurement_arrays(data, outputs)
+
         # Step 4: Verify consistency between measurements
-        _validate_measurement_consistency(data, outputs)
+        _validate_measurement_consistency(data, outputs, arrays)
 
         # Step 5: Verify metadata fields
         _validate_metadata_fields(data, outputs)
 
         # Step 6: Verify format-specific requirements
-        _validate_format_requirements(data, config)
+        _validate_format_requirements(data, config, arrays)
 
         # Log successful validation
         measurement_keys = [
@@ -129,12 +146,7 @@ def _validate_data_structure(
         ]
     else:
         # Otherwise, include only requested measurements
-        measurement_mapping = {
-            "time": outputs.TIME_VALUES,
-            "torque": outputs.TORQUE_VALUES,
-            "angle": outputs.ANGLE_VALUES,
-            "gradient": outputs.GRADIENT_VALUES,
-        }
+        measurement_mapping = outputs.MEASUREMENT_FIELDS
         required_keys = [
             measurement_mapping[m]
             for m in config.measurements
@@ -256,14 +268,70 @@ def _validate_value_ranges(data: Dict[str, List[float]], outputs: OutputFields)
     )
 
 
-def _validate_measurement_consistency(
+def _to_measurement_arrays(
     data: Dict[str, List[float]], outputs: OutputFields
+) -> Dict[str, Union[np.ndarray, List[np.ndarray]]]:
+    """
+    Convert the runs of each measurement field to float64 arrays (once).
+
+    Fields whose runs all have the same length (e.g. after length
+    normalization) become a single 2-D array with one row per run, so the
+    checks can run as one vectorized reduction over the whole field. Other
+    fields become a list of 1-D arrays.
+    """
+    measurement_keys = [
+        outputs.TIME_VALUES,
+        outputs.TORQUE_VALUES,
+        outputs.ANGLE_VALUES,
+        outputs.GRADIENT_VALUES,
+    ]
+    arrays: Dict[str, Union[np.ndarray, List[np.ndarray]]] = {}
+    for key in measurement_keys:
+        if key not in data or not isinstance(data[key], list):
+            continue
+        runs: list = data[key]
+        if runs and len(set(map(len, runs))) == 1:
+            arrays[key] = np.array(runs, dtype=np.float64)
+        else:
+            arrays[key] = [np.asarray(run, dtype=np.float64) for run in runs]
+    return arrays
+
+
+def _count_decreasing(
+    runs: Union[np.ndarray, List[np.ndarray]], strict: bool
+) -> np.ndarray:
+    """
+    Count the points of each run that are smaller than their predecessor.
+
+    Args:
+        runs: 2-D array or list of 1-D arrays, one per run
+        strict: If True, also count points equal to their predecessor
+
+    Returns:
+        Array with one count per run
+    """
+    compare = np.less_equal if strict else np.less
+    if isinstance(runs, np.ndarray):
+        counts: np.ndarray = np.count_nonzero(
+            compare(runs[:, 1:], runs[:, :-1]), axis=1
+        )
+        return counts
+    return np.array(
+        [np.count_nonzero(compare(run[1:], run[:-1])) for run in runs],
+        dtype=np.intp,
+    )
+
+
+def _validate_measurement_consistency(
+    data: Dict[str, List[float]],
+    outputs: OutputFields,
+    arrays: Dict[str, Union[np.ndarray, List[np.ndarray]]],
 ) -> None:
     """Validate consistency across measurements based on physical relationships."""
     # Check if both torque and angle are present to validate their relationship
-    if outputs.TORQUE_VALUES in data and outputs.ANGLE_VALUES in data:
-        torque_runs = data[outputs.TORQUE_VALUES]
-        angle_runs = data[outputs.ANGLE_VALUES]
+    if outputs.TORQUE_VALUES in arrays and outputs.ANGLE_VALUES in arrays:
+        torque_runs = arrays[outputs.TORQUE_VALUES]
+        angle_runs = arrays[outputs.ANGLE_VALUES]
 
         # Make sure they have the same number of runs
         if len(torque_runs) != len(angle_runs):
@@ -272,48 +340,38 @@ def _validate_measurement_consistency(
                 f"{outputs.ANGLE_VALUES}={len(angle_runs)}"
             )
 
-        # Check each run
-        for i, (torque, angle) in enumerate(zip(torque_runs, angle_runs)):
+        # Simple validation: Check that angle is monotonically increasing
+        # This is a basic physical constraint in screw driving
+        decreasing = _count_decreasing(angle_runs, strict=False)
+
+        # Only runs with decreasing values need a closer look
+        for i in np.flatnonzero(decreasing):
+            torque, angle = torque_runs[i], angle_runs[i]
+
             # Skip empty runs
-            if not angle or not torque:
+            if not angle.size or not torque.size:
                 continue
 
-            # Simple validation: Check that angle is monotonically increasing
-            # This is a basic physical constraint in screw driving
-            if len(angle) > 1:
-                non_increasing = sum(
-                    1 for j in range(1, len(angle)) if angle[j] < angle[j - 1]
+            # Allow for a small percentage of non-increasing values due to sensor noise
+            non_increasing_percent = (int(decreasing[i]) / angle.size) * 100
+            if non_increasing_percent > 5:  # Allow up to 5% non-monotonic points
+                raise ValidationError(
+                    f"Angle values in run {i} are not consistently increasing "
+                    f"({non_increasing_percent:.1f}% decreasing values)"
                 )
-                if non_increasing > 0:
-                    # Allow for a small percentage of non-increasing values due to sensor noise
-                    non_increasing_percent = (non_increasing / len(angle)) * 100
-                    if (
-                        non_increasing_percent > 5
-                    ):  # Allow up to 5% non-monotonic points
-                        raise ValidationError(
-                            f"Angle values in run {i} are not consistently increasing "
-                            f"({non_increasing_percent:.1f}% decreasing values)"
-                        )
 
     # Check time values for monotonicity if present
-    if outputs.TIME_VALUES in data:
-        time_runs = data[outputs.TIME_VALUES]
-
-        # Check each run
-        for i, time in enumerate(time_runs):
-            # Skip empty runs
-            if not time:
-                continue
+    if outputs.TIME_VALUES in arrays:
+        non_increasing = _count_decreasing(arrays[outputs.TIME_VALUES], strict=True)
 
-            if len(time) > 1:
-                non_increasing = sum(
-                    1 for j in range(1, len(time)) if time[j] <= time[j - 1]
-                )
-                if non_increasing > 0:
-                    raise ValidationError(
-                        f"Time values in run {i} are not strictly increasing "
-                        f"({non_increasing} non-increasing points)"
-                    )
+        # Report the first run with non-increasing points
+        failed_runs = np.flatnonzero(non_increasing)
+        if failed_runs.size:
+            i = failed_runs[0]
+            raise ValidationError(
+                f"Time values in run {i} are not strictly increasing "
+                f"({non_increasing[i]} non-increasing points)"
+            )
 
     logger.debug(
         "Consistency validation passed: measurement relationships are physically plausible"
@@ -377,7 +435,9 @@ def _validate_metadata_fields(
 
 
 def _validate_format_requirements(
-    data: Dict[str, List[float]], config: PipelineConfig
+    data: Dict[str, List[float]],
+    config: PipelineConfig,
+    arrays: Dict[str, Union[np.ndarray, List[np.ndarray]]],
 ) -> None:
     """Validate format-specific requirements for the output format."""
     output_format = config.output_format
@@ -387,60 +447,66 @@ def _validate_format_requirements(
         # List format is most lenient, basic validation already done
         pass
 
-    elif output_format == "numpy":
-        # For numpy, check that there are no NaN or infinite values
-        for key, values_list in data.items():
-            if not isinstance(values_list, list):
-                continue
-
-            for i, values in enumerate(values_list):
-                if not isinstance(values, list):
-                    continue
-
-                # Check each individual value for NaN or infinity
-                invalid_indices = [
-                    j
-                    for j, val in enumerate(values)
-                    if not isinstance(val, (int, float))
-                    or (isinstance(val, float) and not isfinite(val))
-                ]
-                if invalid_indices:
-                    raise ValidationError(
-                        f"{key} in run {i} contains NaN or infinite values at indices: "
-                        f"{invalid_indices[:5]}{'...' if len(invalid_indices) > 5 else ''}"
-                    )
+    elif output_format in ("numpy", "tensor"):
+        # For numpy and tensor, check that there are no NaN or infinite values
+        _validate_finite_values(data, arrays)
 
     elif output_format == "dataframe":
         # For dataframe, check that all measurement collections have consistent length
         # This is already checked in _validate_data_lengths
         pass
 
-    elif output_format == "tensor":
-        # For tensor format, same requirements as numpy
-        for key, values_list in data.items():
-            if not isinstance(values_list, list):
-                continue
+    else:
+        logger.warning(
+            f"Unknown output format: {output_format}, skipping format-specific validation"
+        )
+
+    logger.debug(f"Format validation passed for output format: {output_format}")
+
 
-            for i, values in enumerate(values_list):
-                if not isinstance(values, list):
-                    continue
-
-                # Check each individual value for NaN or infinity
-                invalid_indices = [
-                    j
-                    for j, val in enumerate(values)
-                    if not isinstance(val, (int, float))
-                    or (isinstance(val, float) and not isfinite(val))
-                ]
+def _validate_finite_values(
+    data: Dict[str, List[float]],
+    arrays: Dict[str, Union[np.ndarray, List[np.ndarray]]],
+) -> None:
+    """Check that no run contains NaN or infinite values."""
+    for key, values_list in data.items():
+        if not isinstance(values_list, list):
+            continue
+
+        # Measurement fields were already converted to arrays
+        if key in arrays:
+            runs = arrays[key]
+
+            # A single reduction over a 2-D field finds the failing runs
+            if isinstance(runs, np.ndarray):
+                failed_runs = np.flatnonzero(~np.isfinite(runs).all(axis=1))
+                runs = [runs[i] for i in failed_runs[:1]]
+                run_ids = failed_runs[:1]
+            else:
+                run_ids = np.arange(len(runs))
+
+            for i, run in zip(run_ids, runs, strict=True):
+                invalid_indices = np.flatnonzero(~np.isfinite(run)).tolist()
                 if invalid_indices:
                     raise ValidationError(
                         f"{key} in run {i} contains NaN or infinite values at indices: "
                         f"{invalid_indices[:5]}{'...' if len(invalid_indices) > 5 else ''}"
                     )
+            continue
 
-    else:
-        logger.warning(
-            f"Unknown output format: {output_format}, skipping format-specific validation"
-        )
+        for i, values in enumerate(values_list):
+            if not isinstance(values, list):
+                continue
 
-    logger.debug(f"Format validation passed for output format: {output_format}")
+            # Check each individual value for NaN or infinity
+            invalid_indices = [
+                j
+                for j, val in enumerate(values)
+                if not isinstance(val, (int, float))
+                or (isinstance(val, float) and not isfinite(val))
+            ]
+            if invalid_indices:
+                raise ValidationError(
+                    f"{key} in run {i} contains NaN or infinite values at indices: "
+                    f"{invalid_indices[:5]}{'...' if len(invalid_indices) > 5 else ''}"
+                )
@@ -15,7 +15,13 @@ Repository: https://github.com/nikolaiwest/pyscrew
 """
 
 import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from tqdm import tqdm
 
 from pyscrew.config import ScenarioConfig
 from pyscrew.utils.logger import get_logger
@@ -42,6 +48,9 @@ RENAME_FILES = True
 # This step takes more time and does nothing after the first run.
 COMPRESS_FILES = True
 
+# Files are minimized on a thread pool since the work is IO-bound
+MAX_WORKERS = min(32, 4 * (os.cpu_count() or 1))
+
 # Path configuration
 # -----------------
 # Hardcoded project root
@@ -60,23 +69,109 @@ class DataPreparationError(Exception):
     pass
 
 
-def minimize_json_files(dir_json_data: Path) -> None:
+def _bytes_to_human_readable(bytes_size):
+    units = ["B", "KB", "MB", "GB", "TB", "PB"]
+    unit_index = 0
+    while bytes_size >= 1024 and unit_index < len(units) - 1:
+        bytes_size /= 1024
+        unit_index += 1
+    return f"{bytes_size:.2f} {units[unit_index]}"
+
+
+def _list_json_files(dir_json_data: Path) -> Dict[str, List[Path]]:
     """
-    Load and resave JSON files without whitespace to reduce file size.
-    Only processes files in class-specific directories (e.g., json/001_control-group).
+    List the JSON files of every class directory in a single pass.
 
     Args:
         dir_json_data: Path to JSON root directory containing class subdirectories
+
+    Returns:
+        Dictionary mapping each class directory name to its JSON file paths
+    """
+    json_files_by_class = {}
+    with os.scandir(dir_json_data) as class_entries:
+        for class_entry in class_entries:
+            if class_entry.is_dir():
+                with os.scandir(class_entry.path) as file_entries:
+                    json_files_by_class[class_entry.name] = [
+                        Path(entry.path)
+                        for entry in file_entries
+                        if entry.name.endswith(".json") and entry.is_file()
+                    ]
+    return json_files_by_class
+
+
+def _minimize_one(json_file: Path) -> Tuple[int, int]:
+    """
+    Minimize a single JSON file in place.
+
+    Args:
+        json_file: Path to the JSON file to minimize
+
+    Returns:
+        Tuple of (original size, new size) in bytes. Both are equal if the
+        file was already minimized and therefore left untouched.
+
+    Raises:
+        json.JSONDecodeError: If the file content is not valid JSON
+    """
+    # Read the raw bytes once; their length is the file size
+    raw_content = json_file.read_bytes()
+    original_size = len(raw_content)
+
+    # First try to decode the file content as UTF-8
+    try:
+        file_content = raw_content.decode("utf-8")
+    except UnicodeDecodeError:
+        # Try with a different encoding if UTF-8 fails
+        file_content = raw_content.decode("latin-1")
+
+    # Try to parse the JSON and identify problematic sections
+    try:
+        data = json.loads(file_content)
+    except json.JSONDecodeError as je:
+        # Get context around the error
+        error_context = file_content[
+            max(0, je.pos - 50) : min(len(file_content), je.pos + 50)
+        ]
+        logger.error(
+            f"JSON parse error in {json_file.name} (class {json_file.parent.name}):\n"
+            f"Error: {str(je)}\n"
+            f"Context: ...{error_context}..."
+        )
+        raise
+
+    minimized_content = json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+    # Already minimized files are left untouched
+    if minimized_content == raw_content:
+        return original_size, original_size
+
+    # Write to temporary file in same directory
+    temp_file = json_file.with_suffix(".tmp")
+    temp_file.write_bytes(minimized_content)
+
+    # Atomic replace
+    temp_file.replace(json_file)
+    return original_size, len(minimized_content)
+
+
+def minimize_json_files(
+    dir_json_data: Path,
+    json_files_by_class: Optional[Dict[str, List[Path]]] = None,
+) -> None:
     """
+    Load and resave JSON files without whitespace to reduce file size.
+    Only processes files in class-specific directories (e.g., json/001_control-group).
 
-    def _bytes_to_human_readable(bytes_size):
-        units = ["B", "KB", "MB", "GB", "TB", "PB"]
-        unit_index = 0
-        while bytes_size >= 1024 and unit_index < len(units) - 1:
-            bytes_size /= 1024
-            unit_index += 1
-        return f"{bytes_size:.2f} {units[unit_index]}"
+    Files are processed on a thread pool since the work is dominated by
+    file IO; totals are aggregated in the calling thread.
 
+    Args:
+        dir_json_data: Path to JSON root directory containing class subdirectories
+        json_files_by_class: Optional precomputed listing from _list_json_files,
+            used to avoid enumerating the class directories again
+    """
     try:
         # Clean up any leftover .tmp files from interrupted runs
         tmp_files = list(dir_json_data.rglob("*.tmp"))
@@ -91,85 +186,76 @@ def minimize_json_files(dir_json_data: Path) -> None:
                 except Exception as e:
                     logger.warning(f"Failed to clean up temp file {tmp_file}: {e}")
 
-        # Find all class directories
-        class_dirs = [d for d in dir_json_data.iterdir() if d.is_dir()]
+        if json_files_by_class is None:
+            json_files_by_class = _list_json_files(dir_json_data)
         total_minimized = 0
+        total_unchanged = 0
         total_saved = 0
         problematic_files = []
 
-        total_files = sum(len(list(d.glob("*.json"))) for d in class_dirs)
+        total_files = sum(len(files) for files in json_files_by_class.values())
         if total_files == 0:
             logger.info("No JSON files found to minimize")
             return
 
         logger.info(f"Starting JSON minimization of {total_files} files...")
 
-        for class_dir in class_dirs:
-            class_name = class_dir.name
-            json_files = list(class_dir.glob("*.json"))
-            class_saved = 0
-
-            for json_file in json_files:
-                try:
-                    original_size = json_file.stat().st_size
-
-                    # First try to read the file content
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor, tqdm(
+            total=total_files, desc="Minimizing JSON files", disable=None
+        ) as pbar:
+            # Submit everything up front so the pool stays busy across classes
+            futures_by_class = {
+                class_name: [
+                    (json_file, executor.submit(_minimize_one, json_file))
+                    for json_file in json_files
+                ]
+                for class_name, json_files in json_files_by_class.items()
+            }
+
+            for class_name, futures in futures_by_class.items():
+                class_saved = 0
+
+                for json_file, future in futures:
                     try:
-                        with open(json_file, "r", encoding="utf-8") as f:
-                            file_content = f.read()
-                    except UnicodeDecodeError:
-                        # Try with a different encoding if UTF-8 fails
-                        with open(json_file, "r", encoding="latin-1") as f:
-                            file_content = f.read()
-
-                    # Try to parse the JSON and identify problematic sections
-                    try:
-                        data = json.loads(file_content)
-                    except json.JSONDecodeError as je:
-                        # Get context around the error
-                        error_context = file_content[
-                            max(0, je.pos - 50) : min(len(file_content), je.pos + 50)
-                        ]
-                        logger.error(
-                            f"JSON parse error in {json_file.name} (class {class_name}):\n"
-                            f"Error: {str(je)}\n"
-                            f"Context: ...{error_context}..."
-                        )
-                        problematic_files.append((json_file, je))
+                        original_size, new_size = future.result()
+                    except Exception as e:
+                        if not isinstance(e, json.JSONDecodeError):
+                            logger.error(
+                                f"Failed to process {json_file} in class {class_name}: {e}"
+                            )
+                        problematic_files.append((json_file, e))
                         continue
+                    finally:
+                        pbar.update(1)
 
-                    # Write to temporary file in same directory
-                    temp_file = json_file.with_suffix(".tmp")
-                    with open(temp_file, "w", encoding="utf-8") as f:
-                        json.dump(data, f, separators=(",", ":"))
+                    if original_size == new_size:
+                        total_unchanged += 1
+                        continue
 
-                    # Atomic replace
-                    temp_file.replace(json_file)
-                    new_size = json_file.stat().st_size
                     space_saved = original_size - new_size
                     class_saved += space_saved
                     total_minimized += 1
 
-                    logger.debug(
-                        f"Minimized {json_file.name} in class {class_name}: saved {_bytes_to_human_readable(space_saved)}"
-                    )
+                    # Skip formatting the per-file message unless it is logged
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            f"Minimized {json_file.name} in class {class_name}: saved {_bytes_to_human_readable(space_saved)}"
+                        )
 
-                except Exception as e:
-                    logger.error(
-                        f"Failed to process {json_file} in class {class_name}: {e}"
+                total_saved += class_saved
+                if class_saved > 0:
+                    logger.info(
+                        f"Class {class_name}: saved {_bytes_to_human_readable(class_saved)} across {len(futures)} files"
                     )
-                    problematic_files.append((json_file, e))
-
-            total_saved += class_saved
-            if class_saved > 0:
-                logger.info(
-                    f"Class {class_name}: saved {_bytes_to_human_readable(class_saved)} across {len(json_files)} files"
-                )
 
         if total_minimized > 0:
             logger.info(
                 f"Successfully minimized {total_minimized} JSON files, total space saved: {_bytes_to_human_readable(total_saved)}"
             )
+        if total_unchanged > 0:
+            logger.info(
+                f"Skipped {total_unchanged} JSON files that were already minimized"
+            )
 
         if problematic_files:
             logger.warning(f"Found {len(problematic_files)} problematic files:")
@@ -227,6 +313,7 @@ def rename_txt_to_json(dir_json_data: Path) -> None:
 def validate_directory_structure(
     dir_json_data: Path,
     scenario_config: ScenarioConfig,
+    json_files_by_class: Optional[Dict[str, List[Path]]] = None,
 ) -> None:
     """
     Validate that directory structure matches scenario configuration.
@@ -234,6 +321,8 @@ def validate_directory_structure(
     Args:
         dir_json_data: Path to JSON root directory
         scenario_config: ScenarioConfig object with class information
+        json_files_by_class: Optional precomputed listing from _list_json_files,
+            used to avoid enumerating the class directories again
 
     Raises:
         DataPreparationError: If directory structure doesn't match expectations
@@ -248,14 +337,14 @@ def validate_directory_structure(
             )
 
         # Get actual directories and file counts
-        class_dirs = [d for d in dir_json_data.iterdir() if d.is_dir()]
+        if json_files_by_class is None:
+            json_files_by_class = _list_json_files(dir_json_data)
 
         # Create a dictionary of {class_name: file_count}
-        found_classes = {}
-        for class_dir in class_dirs:
-            class_name = class_dir.name
-            file_count = len(list(class_dir.glob("*.json")))
-            found_classes[class_name] = file_count
+        found_classes = {
+            class_name: len(json_files)
+            for class_name, json_files in json_files_by_class.items()
+        }
 
         # Check if all expected classes are present with the correct number of files
         missing_classes = []
@@ -314,14 +403,20 @@ def compress_json_data(
             logger.info("Renaming .txt files to .json...")
             rename_txt_to_json(dir_json_data)
 
+        # List the class directories once after renaming; minimizing rewrites
+        # files in place, so the listing stays valid for the validation
+        json_files_by_class = _list_json_files(dir_json_data)
+
         # Optional file compression
         if compress_files:
             logger.info("Compressing JSON files...")
-            minimize_json_files(dir_json_data)
+            minimize_json_files(dir_json_data, json_files_by_class)
 
         # Validate structure after processing
         logger.info("Validating dataset structure...")
-        validate_directory_structure(dir_json_data, scenario_config)
+        validate_directory_structure(
+            dir_json_data, scenario_config, json_files_by_class
+        )
 
         logger.info("Data processing complete")
 
@@ -15,16 +15,24 @@ Repository: https://github.com/nikolaiwest/pyscrew
 """
 
 import json
-from itertools import cycle
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Generator
+from typing import Dict, Iterator
 
+import numpy as np
 import pandas as pd
 
 from pyscrew.core import CsvFields, JsonFields
 from pyscrew.config import ScenarioConfig
 from pyscrew.utils.logger import get_logger
 
+# orjson is an optional, faster drop-in for parsing the measurement files
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # Configuration for the published dataset version
 # ----------------------------------------------
 
@@ -43,6 +51,16 @@ PROJECT_ROOT = Path("C:/repo/pyscrew/")
 # Use your cached data if you want to reproduce the label creation
 DEFAULT_CACHE_DIR = None  # e.g. ".cache/pyscrew/extracted"
 
+# Processing configuration
+# ------------------------
+# Number of worker processes used to parse the JSON files (1 = sequential).
+# Uses the CPUs this process may run on, which can be fewer than the machine has
+N_JOBS = (
+    len(os.sched_getaffinity(0))
+    if hasattr(os, "sched_getaffinity")
+    else os.cpu_count() or 1
+)
+
 # Logging setup
 # ------------
 logger = get_logger(__name__, level="INFO")
@@ -54,20 +72,31 @@ class LabelGenerationError(Exception):
     pass
 
 
-def position_usage_generator() -> Generator[tuple[int, int], None, None]:
+def _assign_position_and_usage(df: pd.DataFrame, is_s04: bool = False) -> None:
     """
-    Generate position and usage count for workpieces.
+    Assign workpiece positions and usage counts from the file order.
+
+    Every workpiece is used alternately in the left and right position,
+    and its usage count increments after each right position. For the
+    k-th run of a workpiece (in file order) this gives position k % 2
+    and usage k // 2, which is computed with a single groupby instead
+    of stepping one generator per workpiece.
+
+    Only rows without a location from the experiment notes are assigned.
+    The DataFrame is modified in place.
 
-    Yields:
-        Tuple of (position, usage_count) where:
-        - position alternates between "left" and "right"
-        - usage_count increments after each right position
+    Args:
+        df: Labels DataFrame in file order (sorted by class, then file name)
+        is_s04: Whether this is scenario s04 (no usage tracking)
     """
-    usage = 0
-    for position in cycle(["left", "right"]):
-        yield position, usage
-        if position == "right":  # After right position (use the string here...)
-            usage += 1
+    pending = df[CsvFields.WORKPIECE_LOCATION].isna()
+    workpiece_ids = df.loc[pending, CsvFields.WORKPIECE_ID]
+    rank = workpiece_ids.groupby(workpiece_ids, sort=False).cumcount().to_numpy()
+
+    df.loc[pending, CsvFields.WORKPIECE_LOCATION] = np.where(rank & 1, "right", "left")
+    # No usage tracking for s04; all other scenarios assign every row here
+    if not is_s04:
+        df[CsvFields.WORKPIECE_USAGE] = rank >> 1
 
 
 def generate_csv_labels(
@@ -94,18 +123,18 @@ def generate_csv_labels(
         # Load metadata from experiment notes (for s04 we load more fields)
         metadata_dict = _load_metadata_from_notes(scenario_config.scenario_id, is_s04)
 
-        # Process JSON files to create DataFrame rows
-        rows = _process_json_files(
+        # Process JSON files to create the DataFrame columns
+        columns = _process_json_files(
             dir_json_data, scenario_config, metadata_dict, is_s04
         )
 
         # Create DataFrame with explicit column order
-        columns = _get_csv_column_order()
-        df = pd.DataFrame(rows, columns=columns)
+        df = pd.DataFrame(columns, columns=_get_csv_column_order())
+        _assign_position_and_usage(df, is_s04)
 
         # Log statistics about exceptions
         exception_count = df[df[CsvFields.SCENARIO_EXCEPTION] == 1].shape[0]
-        workpiece_count = len(_get_unique_workpieces(rows))
+        workpiece_count = len(_get_unique_workpieces(columns))
 
         logger.info(f"Applied {exception_count} exceptions from notes")
         logger.info(
@@ -190,9 +219,12 @@ def _process_json_files(
     scenario_config: ScenarioConfig,
     metadata_dict: dict,
     is_s04: bool = False,
-) -> list:
+) -> Dict[str, list]:
     """
-    Process JSON files and create data rows.
+    Process JSON files and create the label columns.
+
+    Row values are appended to one list per column, so the DataFrame is
+    built from columns instead of transposing a list of row dictionaries.
 
     Args:
         dir_json_data: Directory containing class-specific JSON subdirectories
@@ -201,42 +233,121 @@ def _process_json_files(
         is_s04: Whether this is scenario s04 which requires special handling
 
     Returns:
-        List of dictionaries containing row data for DataFrame
+        Dictionary mapping each CSV column to its list of values
     """
-    rows = []
-    workpiece_generators = {}
+    columns: Dict[str, list] = {column: [] for column in _get_csv_column_order()}
+    seen_workpieces: set = set()
     class_conditions = scenario_config.get_class_conditions()
 
-    for class_dir in dir_json_data.iterdir():
-        if not class_dir.is_dir():
-            logger.error(f"{class_dir} is not a valid file directory.")
-            raise LabelGenerationError(f"Found invalid file in {class_dir}")
-
-        all_json_paths = sorted(class_dir.glob("*.json"))
-
+    # Collect the files of all classes first, so they can be parsed in parallel.
+    # os.scandir provides the entry types from the directory listing itself,
+    # so no separate stat call is needed per file
+    class_paths = []
+    with os.scandir(dir_json_data) as class_entries:
+        for class_entry in class_entries:
+            if not class_entry.is_dir():
+                logger.error(f"{class_entry.path} is not a valid file directory.")
+                raise LabelGenerationError(f"Found invalid file in {class_entry.path}")
+            with os.scandir(class_entry.path) as file_entries:
+                json_names = [
+                    entry.name
+                    for entry in file_entries
+                    if entry.name.endswith(".json") and entry.is_file()
+                ]
+            # Sort the names in place; normcase keeps the case-insensitive
+            # order of Windows paths while comparing plain strings
+            json_names.sort(key=os.path.normcase)
+            class_dir = Path(class_entry.path)
+            json_paths = [class_dir / name for name in json_names]
+            class_paths.append((class_entry.name, json_paths))
+
+    all_json_paths = [path for _, paths in class_paths for path in paths]
+    run_headers = _read_run_headers(all_json_paths)
+
+    # Bind the column appenders and keys once instead of looking them up per row
+    column_appenders = [(column, values.append) for column, values in columns.items()]
+    workpiece_id_key = CsvFields.WORKPIECE_ID
+
+    # Rows are built in the original file order, since positions and usage
+    # counts are later derived from the order of each workpiece's runs
+    for class_name, json_paths in class_paths:
         logger.info(
-            f"- Processing class {class_dir.name}: {len(all_json_paths)} files ({len(workpiece_generators)})"
+            f"- Processing class {class_name}: {len(json_paths)} files ({len(seen_workpieces)})"
         )
 
-        for json_path in all_json_paths:
+        for json_path in json_paths:
             row = _create_row_from_json(
                 json_path,
-                class_dir.name,
+                next(run_headers),
+                class_name,
                 class_conditions,
-                workpiece_generators,
                 metadata_dict,
                 is_s04,
             )
-            rows.append(row)
+            seen_workpieces.add(row[workpiece_id_key])
+            for column, append in column_appenders:
+                append(row[column])
+
+    return columns
+
+
+# Run-level fields read from each JSON file for the labels
+_RUN_HEADER_FIELDS = (
+    JsonFields.Run.ID,
+    JsonFields.Run.WORKPIECE_ID,
+    JsonFields.Run.DATE,
+    JsonFields.Run.WORKPIECE_RESULT,
+)
+
+
+def _read_run_header(json_path: Path) -> dict:
+    """
+    Read the run-level fields needed for the labels from a JSON file.
+
+    Defined at module level so it can be dispatched to worker processes.
+    Only the run-level fields are returned, so the measurement arrays are
+    not sent back to the parent process.
 
-    return rows
+    Args:
+        json_path: Path to the JSON file
+
+    Returns:
+        Dictionary with the run ID, workpiece ID, date and result (if present)
+    """
+    # Read in a single call and parsed from bytes
+    json_data = _json_loads(json_path.read_bytes())
+    return {
+        field: json_data[field] for field in _RUN_HEADER_FIELDS if field in json_data
+    }
+
+
+def _read_run_headers(json_paths: list) -> Iterator[dict]:
+    """
+    Read the run headers of all files, in parallel if N_JOBS > 1.
+
+    Args:
+        json_paths: Paths of the JSON files
+
+    Returns:
+        Iterator over the run headers in input order
+    """
+    n_jobs = min(N_JOBS, len(json_paths))
+    if n_jobs <= 1:
+        return map(_read_run_header, json_paths)
+
+    logger.info(f"Parsing {len(json_paths)} JSON files with {n_jobs} processes")
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        chunksize = max(1, len(json_paths) // (n_jobs * 4))
+        return iter(
+            list(executor.map(_read_run_header, json_paths, chunksize=chunksize))
+        )
 
 
 def _create_row_from_json(
     json_path: Path,
+    json_data: dict,
     class_name: str,
     class_conditions: dict,
-    workpiece_generators: dict,
     metadata_dict: dict,
     is_s04: bool = False,
 ) -> dict:
@@ -245,19 +356,17 @@ def _create_row_from_json(
 
     Args:
         json_path: Path to the JSON file
+        json_data: Run-level fields read from the JSON file
         class_name: Name of the class directory
         class_conditions: Dictionary mapping class names to conditions
-        workpiece_generators: Dictionary of workpiece generators
         metadata_dict: Dictionary containing metadata by file name
         is_s04: Whether this is scenario s04 which requires special handling
 
     Returns:
-        Dictionary containing row data
+        Dictionary containing row data. Rows without a location from the
+        experiment notes are left without location and usage, both are
+        assigned afterwards by _assign_position_and_usage.
     """
-    # Load JSON data
-    with open(json_path) as file:
-        json_data = json.load(file)
-
     # Extract workpiece ID
     try:
         workpiece_id = str(json_data[JsonFields.Run.WORKPIECE_ID])
@@ -285,10 +394,8 @@ def _create_row_from_json(
         # For other scenarios, use normal logic
         class_value = class_name
 
-        # Get position and usage from generator
-        if workpiece_id not in workpiece_generators:
-            workpiece_generators[workpiece_id] = position_usage_generator()
-        workpiece_location, workpiece_usage = next(workpiece_generators[workpiece_id])
+        # Position and usage are assigned once all rows are known
+        workpiece_location = None
 
         # Get scenario condition
         scenario_condition = class_conditions[class_name]
@@ -306,7 +413,7 @@ def _create_row_from_json(
         CsvFields.WORKPIECE_ID: workpiece_id,
         CsvFields.WORKPIECE_DATE: json_data[JsonFields.Run.DATE],
         # No usage tracking for s04
-        CsvFields.WORKPIECE_USAGE: (0 if is_s04 else workpiece_usage),
+        CsvFields.WORKPIECE_USAGE: (0 if is_s04 else None),
         CsvFields.WORKPIECE_RESULT: json_data[JsonFields.Run.WORKPIECE_RESULT],
         CsvFields.WORKPIECE_LOCATION: workpiece_location,
         CsvFields.SCENARIO_CONDITION: scenario_condition,
@@ -332,9 +439,9 @@ def _get_csv_column_order() -> list:
     ]
 
 
-def _get_unique_workpieces(rows: list) -> set:
-    """Extract unique workpiece IDs from the row data."""
-    return {row[CsvFields.WORKPIECE_ID] for row in rows}
+def _get_unique_workpieces(columns: Dict[str, list]) -> set:
+    """Extract unique workpiece IDs from the label columns."""
+    return set(columns[CsvFields.WORKPIECE_ID])
 
 
 def main():
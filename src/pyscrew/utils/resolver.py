@@ -4,7 +4,10 @@ This module provides functionality to resolve different scenario name formats
 (short codes, long names, and full names) to standardized name tuples.
 """
 
-from typing import Dict, List, Tuple
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple, Union
 
 from pyscrew.utils.logger import get_logger
 
@@ -26,56 +29,93 @@ TEST_SCENARIO_MAPPINGS = {
     99: ["s0X", "mock-data", "mock-data"],
 }
 
-# Build a flattened dictionary for direct name lookup
-_NAME_TO_TUPLE: Dict[str, List[str]] = {}
 
-# Add production scenarios
-for _, name_tuple in SCENARIO_MAPPINGS.items():
-    short_name, long_name, full_name = name_tuple
-    _NAME_TO_TUPLE[short_name.lower()] = name_tuple
-    _NAME_TO_TUPLE[long_name.lower()] = name_tuple
-    _NAME_TO_TUPLE[full_name.lower()] = name_tuple
+def _build_name_lookup(
+    *mappings: Dict[int, list]
+) -> Mapping[str, Tuple[str, str, str]]:
+    """Flatten scenario mappings into an immutable name -> name tuple lookup."""
+    lookup: Dict[str, Tuple[str, str, str]] = {}
+    for mapping in mappings:
+        for name_list in mapping.values():
+            name_tuple = tuple(name_list)
+            for name in name_tuple:
+                # Interned keys allow pointer-equality hits during dict probing
+                lookup[sys.intern(name.lower())] = name_tuple
+    return MappingProxyType(lookup)
 
-# Add test scenarios
-for _, name_tuple in TEST_SCENARIO_MAPPINGS.items():
-    short_name, long_name, full_name = name_tuple
-    _NAME_TO_TUPLE[short_name.lower()] = name_tuple
-    _NAME_TO_TUPLE[long_name.lower()] = name_tuple
-    _NAME_TO_TUPLE[full_name.lower()] = name_tuple
 
+# Flattened lookup for direct name resolution, built once at import time
+_NAME_TO_TUPLE = _build_name_lookup(SCENARIO_MAPPINGS, TEST_SCENARIO_MAPPINGS)
 
-def resolve_scenario_name(scenario: str) -> Tuple[str, str, str]:
+# Integer scenario IDs resolve directly to their name tuples
+_ID_TO_TUPLE = MappingProxyType(
+    {
+        scenario_id: tuple(names)
+        for mapping in (SCENARIO_MAPPINGS, TEST_SCENARIO_MAPPINGS)
+        for scenario_id, names in mapping.items()
+    }
+)
+
+# Valid identifiers for error messages (production scenarios only)
+_VALID_NAMES = ", ".join(sorted({names[0] for names in SCENARIO_MAPPINGS.values()}))
+
+
+def resolve_scenario_name(scenario: Union[str, int]) -> Tuple[str, str, str]:
     """
     Resolve any scenario identifier to standardized set of names.
 
     Args:
-        scenario: A scenario identifier (short code, long name, or full name)
+        scenario: A scenario identifier (short code, long name, full name,
+            or integer scenario ID such as 1 for 's01')
 
     Returns:
         Tuple of (short_name, long_name, full_name)
 
     Raises:
         ValueError: If the scenario identifier is not recognized
-    """
-    # Normalize input
-    scenario_str = str(scenario).lower().strip()
-
-    # Direct lookup in the mapping
-    if scenario_str in _NAME_TO_TUPLE:
-        result = _NAME_TO_TUPLE[scenario_str]
 
+    Note:
+        Results are memoized, since the mappings are fixed at import time.
+        Unhashable input cannot be cached and is resolved directly.
+    """
+    try:
+        return _resolve_cached(scenario)
+    except TypeError:
+        return _resolve(scenario)
+
+
+def _resolve(scenario: Union[str, int]) -> Tuple[str, str, str]:
+    """Look up the name tuple of a scenario identifier."""
+    # Integer IDs map directly to the scenario without any string handling
+    if isinstance(scenario, int) and not isinstance(scenario, bool):
+        result = _ID_TO_TUPLE.get(scenario)
+        if result is not None:
+            return result
+
+    # Try the input as-is first, since canonical names are already lowercase;
+    # only normalize (allocating a new string) on a miss
+    scenario_str = scenario if isinstance(scenario, str) else str(scenario)
+    result = _NAME_TO_TUPLE.get(scenario_str)
+    if result is None:
+        scenario_str = scenario_str.lower().strip()
+        result = _NAME_TO_TUPLE.get(scenario_str)
+
+    if result is not None:
         # Log if input wasn't the short name
         if scenario_str != result[0].lower():
             logger.debug(
                 f"Resolved scenario '{scenario}' to standard identifier '{result[0]}'"
             )
 
-        return tuple(result)
+        return result
 
     # If not found, provide helpful error message
     # Only show production scenario names in error message
-    valid_names = sorted(set([v[0] for _, v in SCENARIO_MAPPINGS.items()]))
     raise ValueError(
         f"Unknown scenario identifier: '{scenario}'. "
-        f"Valid identifiers include: {', '.join(valid_names)}"
+        f"Valid identifiers include: {_VALID_NAMES}"
     )
+
+
+# Memoized resolution; typed, so that True is not served the entry for 1
+_resolve_cached = lru_cache(maxsize=256, typed=True)(_resolve)
@@ -1,10 +1,21 @@
+import os
+import tempfile
 from pathlib import Path
 
 import pytest
 
+# Log to a temporary file instead of the package directory; must be set
+# before pyscrew is imported, since loggers are created at import time
+os.environ.setdefault(
+    "PYSCREW_LOG_FILE", os.path.join(tempfile.gettempdir(), "pyscrew-tests.log")
+)
+
 from pyscrew.config import PipelineConfig
 from pyscrew.core import ScrewDataset
-from pyscrew.pipeline.transformers import UnpackStepsTransformer
+from pyscrew.pipeline.transformers import (
+    HandleDuplicatesTransformer,
+    UnpackStepsTransformer,
+)
 
 # Constants for test data
 TEST_DATA_DIR = Path("tests/data/")
@@ -30,6 +41,13 @@ def unpacked_test_dataset(raw_test_dataset, test_config):
     return transformer.transform(raw_test_dataset)
 
 
+@pytest.fixture
+def deduplicated_test_dataset(unpacked_test_dataset, test_config):
+    """Test dataset after unpacking and duplicate handling, passes validation."""
+    transformer = HandleDuplicatesTransformer(test_config)
+    return transformer.transform(unpacked_test_dataset)
+
+
 # Optionally mark integration tests
 def pytest_configure(config):
     config.addinivalue_line("markers", "integration: mark tests that require downloads")
@@ -0,0 +1,89 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+from pyscrew.config import PipelineConfig, ScenarioConfig
+
+SCENARIOS_DIR = Path(__file__).parent.parent / "src" / "pyscrew" / "scenarios"
+
+
+def test_pipeline_config_to_dict_is_independent():
+    """Test to_dict returns a fresh dictionary that follows the settings."""
+    config = PipelineConfig(scenario_name="s05", measurements=["torque"])
+
+    # Changes to a returned dictionary do not leak into later calls
+    config.to_dict()["processing"]["target_length"] = 5
+    assert config.to_dict()["processing"]["target_length"] == 1000
+
+    # In-place changes of settings are reflected
+    config.measurements.append("angle")
+    assert config.to_dict()["filtering"]["measurements"] == ["torque", "angle"]
+
+
+def test_pipeline_config_without_validation_matches_validated():
+    """Test skipping validation yields the same config for valid settings."""
+    settings = dict(
+        scenario_classes=["001_control-group"],
+        measurements=["torque", "time"],
+        screw_phases=[1, 2],
+        screw_positions="left",
+        handle_duplicates="mean",
+        handle_missings=0.5,
+        target_length=500,
+        padding_position="pre",
+        cutoff_position="pre",
+        output_format="numpy",
+        cache_dir="cache",
+    )
+    validated = PipelineConfig("s05", **settings)
+    unvalidated = PipelineConfig("s05", validate=False, **settings)
+
+    assert unvalidated.to_dict() == validated.to_dict()
+
+
+def test_pipeline_config_from_dict_round_trip():
+    """Test from_dict recreates a config from its to_dict output."""
+    config = PipelineConfig(
+        scenario_name="s05",
+        measurements=["torque"],
+        handle_missings="zero",
+        target_length=250,
+        cache_dir="cache",
+        force_download=True,
+        n_jobs=4,
+    )
+    restored = PipelineConfig.from_dict(config.to_dict())
+
+    assert restored.to_dict() == config.to_dict()
+    assert restored.cache_dir == config.cache_dir
+    assert restored.n_jobs == 4
+
+
+@pytest.mark.parametrize("n_jobs", [0, -1, 1.5, "2", True])
+def test_pipeline_config_rejects_invalid_n_jobs(n_jobs):
+    """Test n_jobs must be a positive integer."""
+    with pytest.raises(ValueError, match="Invalid n_jobs"):
+        PipelineConfig(scenario_name="s05", n_jobs=n_jobs)
+
+
+def test_scenario_config_instances_do_not_share_parsed_yaml():
+    """Test changes to one ScenarioConfig do not leak into the next one."""
+    config = ScenarioConfig("s05")
+    config.names["short"] = "changed"
+    next(iter(config.classes.values()))["count"] = -1
+
+    fresh = ScenarioConfig("s05")
+    assert fresh.names["short"] == "s05"
+    assert -1 not in fresh.get_class_counts().values()
+
+
+def test_scenario_config_reloads_edited_yaml(tmp_path):
+    """Test an edited scenario file is parsed again."""
+    config_path = tmp_path / "s05.yml"
+    shutil.copy(SCENARIOS_DIR / "s05.yml", config_path)
+    long_name = ScenarioConfig("s05", base_dir=tmp_path).get_name("long")
+
+    config_path.write_text(config_path.read_text().replace(long_name, "edited-name", 1))
+
+    assert ScenarioConfig("s05", base_dir=tmp_path).get_name("long") == "edited-name"
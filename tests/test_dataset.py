@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 
 import pytest
@@ -36,3 +37,78 @@ def test_dataset_filtering(test_config):
     for run in dataset.screw_runs:
         assert run.class_value == "001_test-class-1"
         assert run.workpiece_location == "left"
+
+
+@pytest.fixture
+def json_files(tmp_path):
+    """Enough JSON files in a temporary directory to use a process pool."""
+    from pyscrew.core.dataset import MIN_FILES_PER_JOB
+
+    paths = []
+    for i in range(2 * MIN_FILES_PER_JOB + 7):
+        path = tmp_path / f"run_{i:03d}.json"
+        path.write_text(json.dumps({"id": i, "values": [i * 0.5, i * 1.5]}))
+        paths.append(path)
+    return paths
+
+
+def test_parse_json_files_parallel_matches_sequential(
+    raw_test_dataset, json_files, monkeypatch
+):
+    """Worker processes yield the same parsed files in the same order."""
+    from pyscrew.core import dataset
+
+    monkeypatch.setattr(dataset, "DEFAULT_N_JOBS", 2)
+    parallel_dataset = dataset.ScrewDataset(
+        data_path=Path("tests/data/extracted/s0X_mock-data")
+    )
+    assert parallel_dataset.n_jobs == 2
+
+    raw_test_dataset.n_jobs = 1
+    sequential = list(raw_test_dataset._parse_json_files(json_files))
+    parallel = list(parallel_dataset._parse_json_files(json_files))
+
+    assert parallel == sequential
+    assert [data["id"] for data in parallel] == list(range(len(json_files)))
+
+
+def test_parse_json_files_small_datasets_stay_sequential(
+    raw_test_dataset, json_files, monkeypatch
+):
+    """Too few files per worker fall back to parsing in this process."""
+    from pyscrew.core import dataset
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool used for a small dataset")
+
+    monkeypatch.setattr(dataset, "ProcessPoolExecutor", no_pool)
+    raw_test_dataset.n_jobs = 4
+    files = json_files[: dataset.MIN_FILES_PER_JOB]
+
+    parsed = list(raw_test_dataset._parse_json_files(files))
+
+    assert [data["id"] for data in parsed] == list(range(len(files)))
+
+
+def test_dataset_from_config_uses_n_jobs(test_config):
+    """Test the number of parsing processes is taken from the config."""
+    from pyscrew.config import PipelineConfig
+    from pyscrew.core import ScrewDataset
+
+    config = PipelineConfig(
+        scenario_name=test_config.scenario_name,
+        cache_dir=test_config.cache_dir,
+        n_jobs=3,
+    )
+    assert ScrewDataset.from_config(config).n_jobs == 3
+
+
+@pytest.mark.parametrize(
+    "value, expected", [("4", 4), ("1", 1), ("0", 1), ("-2", 1), ("four", 1)]
+)
+def test_read_n_jobs_env(monkeypatch, value, expected):
+    """Test malformed PYSCREW_N_JOBS values fall back to sequential parsing."""
+    from pyscrew.core.dataset import _read_n_jobs_env
+
+    monkeypatch.setenv("PYSCREW_N_JOBS", value)
+    assert _read_n_jobs_env() == expected
@@ -0,0 +1,31 @@
+import pytest
+
+from pyscrew import list_scenarios, main
+
+
+@pytest.fixture(autouse=True)
+def clear_scenario_rows():
+    """Start every test without cached scenario rows."""
+    main._scenario_row.cache_clear()
+    yield
+    main._scenario_row.cache_clear()
+
+
+def test_list_scenarios_retries_failed_configs(monkeypatch, capsys):
+    """A scenario that failed to load is listed once it can be loaded."""
+    scenario_config = main.ScenarioConfig
+
+    def failing_config(scenario_id):
+        if scenario_id == "s01":
+            raise OSError("unreadable")
+        return scenario_config(scenario_id)
+
+    monkeypatch.setattr(main, "ScenarioConfig", failing_config)
+    list_scenarios()
+    assert "s01    ERROR: Could not load configuration" in capsys.readouterr().out
+
+    monkeypatch.setattr(main, "ScenarioConfig", scenario_config)
+    list_scenarios()
+    output = capsys.readouterr().out
+    assert "ERROR" not in output
+    assert "s01    thread-degradation" in output
@@ -0,0 +1,48 @@
+from types import MappingProxyType
+
+import pytest
+
+from pyscrew.config import PipelineConfig, ScenarioConfig
+
+
+@pytest.fixture(scope="session")
+def scenario_config(scenario_name):
+    """Scenario config for the parametrized scenario, shared across the session."""
+    return ScenarioConfig(scenario_name)
+
+
+@pytest.fixture(scope="session")
+def pipeline_config(scenario_name):
+    """Pipeline config for the parametrized scenario, shared across the session."""
+    return PipelineConfig(
+        scenario_name=scenario_name,
+        scenario_classes=None,
+        measurements=None,
+        screw_phases=None,
+        screw_cycles=None,
+        screw_positions="both",
+        handle_duplicates="first",
+        handle_missings="mean",
+        target_length=1000,
+        padding_value=0.0,
+        padding_position="post",
+        cutoff_position="post",
+        output_format="list",
+        cache_dir=None,
+        force_download=False,
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_nested_processed_data():
+    """Read-only processed data with three nested runs, shared across the session."""
+    return MappingProxyType(
+        {
+            "time_values": [[0.0, 0.1, 0.2], [0.0, 0.1, 0.2], [0.0, 0.1, 0.2]],
+            "torque_values": [[1.0, 2.0, 3.0], [1.0, 2.0, 3.0], [1.0, 2.0, 3.0]],
+            "angle_values": [[0.5, 1.0, 1.5], [0.5, 1.0, 1.5], [0.5, 1.0, 1.5]],
+            "gradient_values": [[0.1, 0.2, 0.3], [0.1, 0.2, 0.3], [0.1, 0.2, 0.3]],
+            "step_values": [[0, 0, 0], [0, 0, 0], [0, 0, 0]],
+            "class_values": ["normal", "normal", "normal"],
+        }
+    )
@@ -0,0 +1,246 @@
+import hashlib
+import io
+import os
+import time
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from pyscrew.config import ScenarioConfig
+from pyscrew.pipeline import loading
+from pyscrew.pipeline.loading import ChecksumError, DataLoader
+
+
+def _write_archive(path: Path, members: dict) -> str:
+    """Write a ZIP archive with the given members and return its MD5."""
+    with zipfile.ZipFile(path, "w") as zip:
+        for name, content in members.items():
+            zip.writestr(name, content)
+    return hashlib.md5(path.read_bytes()).hexdigest()
+
+
+class _FakeRaw(io.BytesIO):
+    """Body stream that accepts the urllib3 read() arguments."""
+
+    def read(self, size=-1, decode_content=False):
+        return super().read(size)
+
+
+class _FakeResponse:
+    """Streaming response with the parts of the requests API the loader uses."""
+
+    def __init__(self, status_code: int, body: bytes = b""):
+        self.status_code = status_code
+        self.headers = {"content-length": str(len(body))}
+        self.raw = _FakeRaw(body)
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _FakeSession:
+    """HTTP session serving one archive, optionally honouring range requests."""
+
+    def __init__(self, content: bytes, ranges: bool = True):
+        self.content = content
+        self.ranges = ranges
+        self.requested_ranges = []
+
+    def head(self, url, **kwargs):
+        response = _FakeResponse(200)
+        response.headers["content-length"] = str(len(self.content))
+        if self.ranges:
+            response.headers["accept-ranges"] = "bytes"
+        return response
+
+    def get(self, url, headers=None, **kwargs):
+        byte_range = (headers or {}).get("Range")
+        self.requested_ranges.append(byte_range)
+        if not byte_range or not self.ranges:
+            return _FakeResponse(200, self.content)
+        start, _, end = byte_range.removeprefix("bytes=").partition("-")
+        start, end = int(start), int(end) if end else len(self.content) - 1
+        if start >= len(self.content):
+            return _FakeResponse(416)
+        return _FakeResponse(206, self.content[start : end + 1])
+
+
+@pytest.fixture
+def loader(tmp_path):
+    """Data loader for s05 that uses a temporary cache directory."""
+    return DataLoader(ScenarioConfig("s05", cache_dir=tmp_path))
+
+
+@pytest.fixture
+def cached_archive(loader):
+    """Archive in the loader's cache whose checksum the loader expects."""
+    archive_path = loader.archive_cache / loader.file_name
+    loader.md5_checksum = _write_archive(archive_path, {"json/new.json": "{}"})
+    return archive_path
+
+
+def test_stale_extraction_marker_forces_reextraction(loader, cached_archive):
+    """Data extracted from a different archive is replaced."""
+    data_path = loader.data_cache / Path(loader.file_name).stem
+    (data_path / "json").mkdir(parents=True)
+    (data_path / "json" / "old.json").write_text("{}")
+    (data_path / DataLoader.EXTRACTION_MARKER).write_text("outdated-checksum")
+
+    assert loader.extract_data() == data_path
+    assert (data_path / "json" / "new.json").exists()
+    assert not (data_path / "json" / "old.json").exists()
+    assert (data_path / DataLoader.EXTRACTION_MARKER).read_text() == (
+        loader.md5_checksum
+    )
+
+
+def test_missing_extraction_marker_adopts_existing_data(loader, cached_archive):
+    """Data extracted before markers existed is kept and gets a marker."""
+    data_path = loader.data_cache / Path(loader.file_name).stem
+    (data_path / "json").mkdir(parents=True)
+    (data_path / "json" / "old.json").write_text("{}")
+
+    assert loader.extract_data() == data_path
+    assert (data_path / "json" / "old.json").exists()
+    assert not (data_path / "json" / "new.json").exists()
+    assert (data_path / DataLoader.EXTRACTION_MARKER).read_text() == (
+        loader.md5_checksum
+    )
+
+
+def test_sweep_keeps_partial_extractions_in_progress(loader):
+    """Only partial directories older than the age limit are removed."""
+    scenario_name = Path(loader.file_name).stem
+    abandoned = loader.data_cache / f"{scenario_name}{DataLoader.PARTIAL_SUFFIX}old"
+    in_progress = loader.data_cache / f"{scenario_name}{DataLoader.PARTIAL_SUFFIX}new"
+    for path in (abandoned, in_progress):
+        (path / "json").mkdir(parents=True)
+    expired = time.time() - DataLoader.PARTIAL_MAX_AGE - 60
+    os.utime(abandoned, (expired, expired))
+
+    loader._sweep_partial_extractions(scenario_name)
+
+    assert not abandoned.exists()
+    assert (in_progress / "json").exists()
+
+
+@pytest.fixture
+def archive_content(loader):
+    """Archive bytes whose checksum the loader expects."""
+    content = os.urandom(256 * 1024)
+    loader.md5_checksum = hashlib.md5(content).hexdigest()
+    return content
+
+
+def test_download_resumes_partial_file(loader, archive_content, monkeypatch):
+    """A partial download is continued with a range request."""
+    session = _FakeSession(archive_content)
+    monkeypatch.setattr(loading, "_SESSION", session)
+    archive_path = loader.archive_cache / loader.file_name
+    archive_path.with_suffix(".part").write_bytes(archive_content[:1000])
+
+    assert loader._download_file() == archive_path
+    assert archive_path.read_bytes() == archive_content
+    assert session.requested_ranges == ["bytes=1000-"]
+
+
+def test_download_restarts_if_range_is_ignored(loader, archive_content, monkeypatch):
+    """A full response to a range request replaces the partial file."""
+    monkeypatch.setattr(loading, "_SESSION", _FakeSession(archive_content, False))
+    archive_path = loader.archive_cache / loader.file_name
+    archive_path.with_suffix(".part").write_bytes(b"x" * 1000)
+
+    assert loader._download_file() == archive_path
+    assert archive_path.read_bytes() == archive_content
+
+
+def test_download_restarts_if_partial_file_is_complete(
+    loader, archive_content, monkeypatch
+):
+    """A partial file that cannot be resumed (HTTP 416) is downloaded again."""
+    session = _FakeSession(archive_content)
+    monkeypatch.setattr(loading, "_SESSION", session)
+    archive_path = loader.archive_cache / loader.file_name
+    archive_path.with_suffix(".part").write_bytes(b"x" * len(archive_content))
+
+    assert loader._download_file() == archive_path
+    assert archive_path.read_bytes() == archive_content
+    assert session.requested_ranges == [f"bytes={len(archive_content)}-", None]
+
+
+def test_parallel_download(loader, archive_content, monkeypatch):
+    """Large archives are assembled from concurrent range requests."""
+    session = _FakeSession(archive_content)
+    monkeypatch.setattr(loading, "_SESSION", session)
+    monkeypatch.setattr(loader, "PARALLEL_DOWNLOAD_MIN_SIZE", 1)
+    monkeypatch.setattr(loader, "DOWNLOAD_CHUNK_SIZE", 4096)
+
+    archive_path = loader._download_file()
+
+    assert archive_path.read_bytes() == archive_content
+    assert len(session.requested_ranges) == DataLoader.PARALLEL_DOWNLOAD_WORKERS
+
+
+def test_parallel_download_checksum_mismatch(loader, archive_content, monkeypatch):
+    """A parallel download with a wrong checksum leaves no files behind."""
+    monkeypatch.setattr(loading, "_SESSION", _FakeSession(archive_content))
+    monkeypatch.setattr(loader, "PARALLEL_DOWNLOAD_MIN_SIZE", 1)
+    loader.md5_checksum = "0" * 32
+    archive_path = loader.archive_cache / loader.file_name
+
+    with pytest.raises(ChecksumError):
+        loader._download_file()
+    assert not archive_path.exists()
+    assert not archive_path.with_suffix(".part").exists()
+
+
+def test_preallocate_falls_back_to_truncate(tmp_path, monkeypatch):
+    """Files are still extended if the file system cannot allocate blocks."""
+
+    def unsupported(fd, offset, size):
+        raise OSError("not supported")
+
+    monkeypatch.setattr(os, "posix_fallocate", unsupported, raising=False)
+    with open(tmp_path / "file", "wb") as f:
+        loading._preallocate(f.fileno(), 4096)
+    assert (tmp_path / "file").stat().st_size == 4096
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "../x",
+        "a/../../x",
+        "a/..",
+        "..",
+        "/etc/passwd",
+        "\\x",
+        "..\\x",
+        "a\\..\\..\\x",
+        "C:x",
+        "C:\\x",
+        "c:/x",
+    ],
+)
+def test_path_traversal_is_rejected(loader, name):
+    """Parent references, absolute paths and drive letters are rejected."""
+    assert not loader._check_path_traversal(name)
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["json/run.json", "json/", "a/b/c.json", "..json", "a/..b/c", "file..json"],
+)
+def test_normal_members_pass_path_traversal_check(loader, name):
+    """Regular member names, including names containing dots, are accepted."""
+    assert loader._check_path_traversal(name)
@@ -1,80 +1,78 @@
-def test_process_data(scenario_name="s05"):
+from pathlib import Path
+
+import pytest
+
+from pyscrew.config import PipelineConfig
+from pyscrew.core.fields import OutputFields
+from pyscrew.pipeline.processing import process_data
+
+# Length the series are normalized to; the mock runs are shorter and longer
+TARGET_LENGTH = 1000
+PADDING_VALUE = -5.0
+
+
+def _mock_config(**kwargs):
+    """Config for the s0X mock scenario in tests/data."""
+    return PipelineConfig(scenario_name="s0X", cache_dir=Path("tests/data"), **kwargs)
+
+
+@pytest.fixture(scope="module")
+def unnormalized_data():
+    """Mock data processed without length normalization, as a reference."""
+    return process_data(_mock_config(target_length=0, output_format="list"))
+
+
+@pytest.mark.parametrize("position", ["pre", "post"])
+def test_process_data(unnormalized_data, position):
     """
-    Test process_data with a minimal approach that mocks dataset creation.
+    Test process_data runs the transformers on the mock scenario.
 
     Args:
-        scenario_name: Short name of the scenario to test
-
-    Returns:
-        True if test passes, False otherwise
+        unnormalized_data: Reference output without length normalization
+        position: Padding and cutoff position to test
     """
-    import unittest.mock as mock
-
-    from pyscrew.config import PipelineConfig
-    from pyscrew.pipeline.processing import process_data
-
-    # Create a minimal pipeline config
-    pipeline_config = PipelineConfig(
-        scenario_name=scenario_name,
-        scenario_classes=None,
-        measurements=None,
-        screw_phases=None,
-        screw_cycles=None,
-        screw_positions="both",
-        handle_duplicates="first",
-        handle_missings="mean",
-        target_length=1000,
-        padding_value=0.0,
-        padding_position="post",
-        cutoff_position="post",
+    config = _mock_config(
+        target_length=TARGET_LENGTH,
+        padding_value=PADDING_VALUE,
+        padding_position=position,
+        cutoff_position=position,
         output_format="list",
-        cache_dir=None,
-        force_download=False,
     )
+    result = process_data(config)
 
-    try:
-        # Create mock dataset with dummy data
-        with mock.patch("pyscrew.core.ScrewDataset.from_config") as mock_from_config:
-            # Create a mock dataset that will be returned
-            mock_dataset = mock.MagicMock()
-            mock_dataset.processed_data = {
-                "time_values": [0.0, 0.1, 0.2],
-                "torque_values": [1.0, 2.0, 3.0],
-                "angle_values": [0.5, 1.0, 1.5],
-                "gradient_values": [0.1, 0.2, 0.3],
-                "step_values": [1, 1, 1],
-                "class_labels": ["normal", "normal", "normal"],
-            }
-            mock_from_config.return_value = mock_dataset
-
-            # Also mock the pipeline's fit_transform to return the same mock dataset
-            with mock.patch(
-                "sklearn.pipeline.Pipeline.fit_transform", return_value=mock_dataset
-            ):
-                # Call the function under test
-                result = process_data(pipeline_config)
-
-                if result == mock_dataset.processed_data:
-                    return True
-                else:
-                    return False
-
-    except Exception as e:
-        print(f"❌ Test failed with error: {str(e)}")
-        return False
+    outputs = OutputFields()
+    assert result[outputs.CLASS_VALUES] == unnormalized_data[outputs.CLASS_VALUES]
 
+    lengths = [len(run) for run in unnormalized_data[outputs.TORQUE_VALUES]]
+    assert min(lengths) < TARGET_LENGTH < max(lengths)
 
-if __name__ == "__main__":
-    # Fix imports for running as a standalone script
-    import os
-    import sys
+    for i, length in enumerate(lengths):
+        torque = result[outputs.TORQUE_VALUES][i]
+        steps = result[outputs.STEP_VALUES][i]
+        reference = unnormalized_data[outputs.TORQUE_VALUES][i]
+        assert len(torque) == len(steps) == TARGET_LENGTH
+
+        if length > TARGET_LENGTH:
+            # Truncated at the cutoff position
+            kept = reference[-TARGET_LENGTH:] if position == "pre" else reference
+            assert torque == kept[:TARGET_LENGTH]
+            continue
 
-    # Ensure the pyscrew package is importable
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.abspath(os.path.join(script_dir, "..", ".."))
+        # Padded at the padding position with the padding value (-1 for steps)
+        pad = TARGET_LENGTH - length
+        if position == "pre":
+            values, padding, step_padding = torque[pad:], torque[:pad], steps[:pad]
+        else:
+            values, padding, step_padding = (
+                torque[:length],
+                torque[length:],
+                steps[length:],
+            )
+        assert values == reference
+        assert padding == [PADDING_VALUE] * pad
+        assert step_padding == [-1] * pad
 
-    if project_root not in sys.path:
-        sys.path.insert(0, project_root)
 
-    # Run the test
-    test_process_data()
+if __name__ == "__main__":
+    # Run the test through pytest, which provides the fixtures
+    pytest.main([__file__])
@@ -1,68 +1,65 @@
-def test_validate_data(scenario_name="s05"):
+import copy
+
+import pytest
+
+from pyscrew.pipeline.validating import ValidationError, validate_data
+
+# Scenarios to run the test for; the data itself is mocked
+SCENARIOS = ("s01", "s02", "s03", "s04", "s05", "s06")
+
+
+@pytest.mark.parametrize("scenario_name", SCENARIOS, scope="session")
+def test_validate_data(pipeline_config, mock_nested_processed_data):
     """
     Test validate_data with a minimal approach that mocks the data structure.
 
     Args:
-        scenario_name: Short name of the scenario to test
+        pipeline_config: Shared PipelineConfig for the test scenario
+        mock_nested_processed_data: Shared processed data with nested runs
+    """
+    # Call the function under test on a dict, as returned by the pipeline
+    assert validate_data(dict(mock_nested_processed_data), pipeline_config) is True
+
+
+@pytest.mark.parametrize("scenario_name", SCENARIOS[:1], scope="session")
+def test_validate_data_rejects_non_increasing_time(
+    pipeline_config, mock_nested_processed_data
+):
+    """
+    Test validate_data raises for time values that do not strictly increase.
 
-    Returns:
-        True if test passes, False otherwise
+    Args:
+        pipeline_config: Shared PipelineConfig for the test scenario
+        mock_nested_processed_data: Shared processed data with nested runs
     """
-    from pyscrew.config import PipelineConfig
-    from pyscrew.pipeline.validating import validate_data
-
-    # Create a minimal pipeline config
-    pipeline_config = PipelineConfig(
-        scenario_name=scenario_name,
-        scenario_classes=None,
-        measurements=None,
-        screw_phases=None,
-        screw_cycles=None,
-        screw_positions="both",
-        handle_duplicates="first",
-        handle_missings="mean",
-        target_length=1000,
-        padding_value=0.0,
-        padding_position="post",
-        cutoff_position="post",
-        output_format="list",
-        cache_dir=None,
-        force_download=False,
-    )
-
-    try:
-        # Create mock data with dummy values using nested lists
-        mock_data = {
-            "time_values": [[0.0, 0.1, 0.2], [0.0, 0.1, 0.2], [0.0, 0.1, 0.2]],
-            "torque_values": [[1.0, 2.0, 3.0], [1.0, 2.0, 3.0], [1.0, 2.0, 3.0]],
-            "angle_values": [[0.5, 1.0, 1.5], [0.5, 1.0, 1.5], [0.5, 1.0, 1.5]],
-            "gradient_values": [[0.1, 0.2, 0.3], [0.1, 0.2, 0.3], [0.1, 0.2, 0.3]],
-            "step_values": [1, 1, 1],
-            "class_labels": ["normal", "normal", "normal"],
-        }
-
-        # Call the function under test
-        validate_data(mock_data, pipeline_config)
-        return True
-
-    except Exception as e:
-        print(f"❌ Test failed with error: {str(e)}")
-        return False
+    data = dict(mock_nested_processed_data)
+    data["time_values"] = [[0.0, 0.1, 0.2], [0.0, 0.1, 0.1], [0.0, 0.1, 0.2]]
 
+    with pytest.raises(ValidationError, match="Time values in run 1"):
+        validate_data(data, pipeline_config)
 
-if __name__ == "__main__":
-    # Fix imports for running as a standalone script
-    import os
-    import sys
 
-    # Ensure the pyscrew package is importable
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.abspath(os.path.join(script_dir, "..", ".."))
+@pytest.mark.parametrize("scenario_name", SCENARIOS[:1], scope="session")
+def test_validate_data_checks_lengths_before_values(
+    pipeline_config, mock_nested_processed_data
+):
+    """
+    Test inconsistent field lengths are reported before value conversion.
+
+    Args:
+        pipeline_config: Shared PipelineConfig for the test scenario
+        mock_nested_processed_data: Shared processed data with nested runs
+    """
+    data = dict(mock_nested_processed_data)
+    data["class_values"] = ["normal", "normal"]
+    data["gradient_values"] = [[0.1, "x", 0.3], [0.1, 0.2, 0.3]]
 
-    if project_root not in sys.path:
-        sys.path.insert(0, project_root)
+    config = copy.copy(pipeline_config)
+    config.measurements = ["torque"]
+    with pytest.raises(ValidationError, match="Inconsistent field lengths"):
+        validate_data(data, config)
 
-    # Now we can import pyscrew modules
 
-    # Run the test
-    test_validate_data()
+if __name__ == "__main__":
+    # Run the test through pytest, which provides the config fixtures
+    pytest.main([__file__])
@@ -0,0 +1,36 @@
+import pytest
+
+from pyscrew.utils import resolve_scenario_name
+
+S01 = ("s01", "thread-degradation", "variations-in-thread-degradation")
+
+
+@pytest.mark.parametrize(
+    "scenario",
+    ["s01", "S01", " s01 ", "thread-degradation", "variations-in-thread-degradation"],
+)
+def test_resolve_scenario_names(scenario):
+    """Short, long and full names resolve regardless of case and whitespace."""
+    assert resolve_scenario_name(scenario) == S01
+
+
+@pytest.mark.parametrize("scenario_id", [1, 2, 3, 4, 5, 6])
+def test_resolve_scenario_ids(scenario_id):
+    """Integer IDs resolve to the scenario of the same number."""
+    assert resolve_scenario_name(scenario_id)[0] == f"s0{scenario_id}"
+
+
+@pytest.mark.parametrize("scenario", ["1", "01", "7"])
+def test_numeric_strings_are_not_ids(scenario):
+    """Only integers are treated as scenario IDs."""
+    with pytest.raises(ValueError, match="Unknown scenario identifier"):
+        resolve_scenario_name(scenario)
+
+
+@pytest.mark.parametrize(
+    "scenario", [7, 0, True, 1.0, "s07", "", None, ["s01"], {"s01": 1}]
+)
+def test_invalid_scenarios_raise_value_error(scenario):
+    """Unknown and unhashable identifiers raise ValueError, not TypeError."""
+    with pytest.raises(ValueError, match="Unknown scenario identifier"):
+        resolve_scenario_name(scenario)
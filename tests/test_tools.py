@@ -0,0 +1,91 @@
+import random
+from itertools import cycle
+
+import pandas as pd
+import pytest
+
+from pyscrew.core import CsvFields
+from pyscrew.tools.generate_csv_labels import (
+    _assign_position_and_usage,
+    _get_csv_column_order,
+)
+
+
+def _labels(workpiece_ids, locations=None, usage=None):
+    """Labels DataFrame with the given workpieces, in file order."""
+    rows = len(workpiece_ids)
+    df = pd.DataFrame(columns=_get_csv_column_order(), index=range(rows))
+    df[CsvFields.WORKPIECE_ID] = workpiece_ids
+    df[CsvFields.WORKPIECE_LOCATION] = locations or [None] * rows
+    df[CsvFields.WORKPIECE_USAGE] = usage or [None] * rows
+    return df
+
+
+def _assign_with_generators(workpiece_ids, locations):
+    """Positions and usage counts as assigned by the per-workpiece generators."""
+
+    def position_usage_generator():
+        usage = 0
+        for position in cycle(["left", "right"]):
+            yield position, usage
+            if position == "right":
+                usage += 1
+
+    generators = {}
+    assigned = []
+    for workpiece_id, location in zip(workpiece_ids, locations, strict=True):
+        if location is not None:
+            # Location from the experiment notes, the generator does not advance
+            assigned.append((location, 0))
+            continue
+        if workpiece_id not in generators:
+            generators[workpiece_id] = position_usage_generator()
+        assigned.append(next(generators[workpiece_id]))
+    return assigned
+
+
+def test_assign_position_and_usage():
+    """Runs alternate left and right, usage increments after each right."""
+    df = _labels(["a", "b", "a", "a", "b", "c", "a"])
+
+    _assign_position_and_usage(df)
+
+    assert df[CsvFields.WORKPIECE_LOCATION].tolist() == [
+        "left",
+        "left",
+        "right",
+        "left",
+        "right",
+        "left",
+        "right",
+    ]
+    assert df[CsvFields.WORKPIECE_USAGE].tolist() == [0, 0, 0, 1, 0, 0, 1]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_assign_position_and_usage_matches_generators(seed):
+    """Positions and usage counts match the previous generator assignment."""
+    rng = random.Random(seed)
+    workpiece_ids = [f"wp{rng.randrange(20)}" for _ in range(500)]
+    df = _labels(workpiece_ids)
+
+    _assign_position_and_usage(df)
+
+    expected = _assign_with_generators(workpiece_ids, [None] * len(workpiece_ids))
+    locations = df[CsvFields.WORKPIECE_LOCATION].tolist()
+    usage = df[CsvFields.WORKPIECE_USAGE].tolist()
+    assert list(zip(locations, usage, strict=True)) == expected
+
+
+def test_assign_position_and_usage_s04_keeps_noted_locations():
+    """For s04, noted locations are kept and skipped, usage is not tracked."""
+    rng = random.Random(0)
+    workpiece_ids = [f"wp{rng.randrange(10)}" for _ in range(200)]
+    locations = [rng.choice([None, None, "left", "right"]) for _ in workpiece_ids]
+    df = _labels(workpiece_ids, locations, usage=[0] * len(workpiece_ids))
+
+    _assign_position_and_usage(df, is_s04=True)
+
+    expected = _assign_with_generators(workpiece_ids, locations)
+    assert df[CsvFields.WORKPIECE_LOCATION].tolist() == [loc for loc, _ in expected]
+    assert df[CsvFields.WORKPIECE_USAGE].tolist() == [0] * len(workpiece_ids)
@@ -1,16 +1,22 @@
+import copy
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
 from pyscrew.config import PipelineConfig
 from pyscrew.core.fields import OutputFields
+from pyscrew.pipeline import validate_data
 from pyscrew.pipeline.transformers import (
     DatasetConversionTransformer,
     HandleDuplicatesTransformer,
     HandleLengthsTransformer,
     HandleMissingsTransformer,
+    PipelineLoggingTransformer,
     UnpackStepsTransformer,
 )
+from pyscrew.pipeline.transformers.convert_dataset import ConversionError
+from pyscrew.pipeline.validating import ValidationError
 
 
 def test_unpack_steps_transformer(raw_test_dataset, test_config):
@@ -167,3 +173,155 @@ def test_dataset_conversion_transformer(unpacked_test_dataset, test_config):
 
     # Time values should be included by default
     assert outputs.TIME_VALUES in result.processed_data
+
+
+@pytest.mark.parametrize("padding_position", ["pre", "post"])
+@pytest.mark.parametrize("cutoff_position", ["pre", "post"])
+def test_handle_lengths_matches_list_padding(padding_position, cutoff_position):
+    """Test HandleLengthsTransformer keeps the values of apply_equal_length."""
+    # One run to pad and one to truncate, with int, float and mixed values
+    processed_data = {
+        "time_values": [[0.0, 0.0012, 0.0024], [0.0, 0.0012, 0.0024, 0.0036] * 2],
+        "torque_values": [[1, 2, 3], [1, 2, 3, 4, 5, 6, 7, 8]],
+        "angle_values": [[0, 0.25, 0.5], [0, 0.25, 0.5, 0.75, 1, 1.25, 1.5, 1.75]],
+        "gradient_values": [[0.1, 0.2, 0.3], [0.1] * 8],
+        "step_values": [[0, 1, 1], [0, 0, 1, 1, 2, 2, 3, 3]],
+        "class_values": ["a", "b"],
+    }
+    config = PipelineConfig(
+        scenario_name="s0X",
+        target_length=5,
+        padding_position=padding_position,
+        cutoff_position=cutoff_position,
+    )
+    transformer = HandleLengthsTransformer(config)
+
+    # Expected output of the per-run, list-based implementation
+    expected = {key: [] for key in processed_data}
+    for i in range(len(processed_data["class_values"])):
+        run = {key: values[i] for key, values in processed_data.items()}
+        normalized, _, _ = transformer.apply_equal_length(run)
+        for key in processed_data:
+            expected[key].append(normalized[key])
+
+    dataset = SimpleNamespace(processed_data=copy.deepcopy(processed_data))
+    result = transformer.transform(dataset).processed_data
+
+    for key, runs in expected.items():
+        assert result[key] == runs
+
+    # Steps stay integers, measurements are normalized to floats
+    for key in ("time_values", "torque_values", "angle_values", "gradient_values"):
+        assert all(type(value) is float for run in result[key] for value in run)
+    assert all(type(value) is int for run in result["step_values"] for value in run)
+
+
+def test_dataset_conversion_numpy_rejects_ragged_series(
+    deduplicated_test_dataset, test_config
+):
+    """Test NumPy conversion fails for series of different lengths."""
+    config = PipelineConfig(
+        scenario_name=test_config.scenario_name,
+        cache_dir=test_config.cache_dir,
+        output_format="numpy",
+    )
+    transformer = DatasetConversionTransformer(config)
+
+    with pytest.raises(ConversionError, match="differ in length"):
+        transformer.transform(deduplicated_test_dataset)
+
+
+def test_dataset_conversion_numpy_output_can_be_logged(
+    deduplicated_test_dataset, test_config
+):
+    """Test equal-length NumPy output passes through the output logging step."""
+    config = PipelineConfig(
+        scenario_name=test_config.scenario_name,
+        cache_dir=test_config.cache_dir,
+        target_length=100,
+        output_format="numpy",
+    )
+    dataset = HandleLengthsTransformer(config).transform(deduplicated_test_dataset)
+    dataset = DatasetConversionTransformer(config).transform(dataset)
+    dataset = PipelineLoggingTransformer(config, "Output").transform(dataset)
+
+    outputs = OutputFields()
+    num_runs = len(dataset.processed_data[outputs.CLASS_VALUES])
+    assert dataset.processed_data[outputs.TIME_VALUES].shape == (num_runs, 100)
+    assert not any(key.endswith("_offsets") for key in dataset.processed_data)
+
+
+def test_dataset_conversion_arrow(deduplicated_test_dataset, test_config):
+    """Test Arrow conversion keeps one row per run at full precision."""
+    pa = pytest.importorskip("pyarrow")
+
+    config = PipelineConfig(
+        scenario_name=test_config.scenario_name,
+        cache_dir=test_config.cache_dir,
+        output_format="arrow",
+    )
+    outputs = OutputFields()
+    expected_torque = copy.deepcopy(
+        deduplicated_test_dataset.processed_data[outputs.TORQUE_VALUES]
+    )
+    transformer = DatasetConversionTransformer(config).fit(deduplicated_test_dataset)
+    table = transformer.transform(deduplicated_test_dataset).processed_data
+
+    assert isinstance(table, pa.Table)
+    assert table.num_rows == len(expected_torque)
+    assert table.schema.field(outputs.TORQUE_VALUES).type == pa.list_(pa.float64())
+    assert table.column(outputs.TORQUE_VALUES).to_pylist() == expected_torque
+
+
+def test_dataset_conversion_polars(deduplicated_test_dataset, test_config):
+    """Test Polars conversion keeps one row per run at full precision."""
+    pl = pytest.importorskip("polars")
+
+    config = PipelineConfig(
+        scenario_name=test_config.scenario_name,
+        cache_dir=test_config.cache_dir,
+        output_format="polars",
+    )
+    outputs = OutputFields()
+    expected_torque = copy.deepcopy(
+        deduplicated_test_dataset.processed_data[outputs.TORQUE_VALUES]
+    )
+    transformer = DatasetConversionTransformer(config).fit(deduplicated_test_dataset)
+    df = transformer.transform(deduplicated_test_dataset).processed_data
+
+    assert isinstance(df, pl.DataFrame)
+    assert df.height == len(expected_torque)
+    assert df.schema[outputs.TORQUE_VALUES] == pl.List(pl.Float64)
+    assert df[outputs.TORQUE_VALUES].to_list() == expected_torque
+
+
+def test_dataset_conversion_validates_before_conversion(
+    unpacked_test_dataset, test_config
+):
+    """Test converted outputs are validated on the lists they are built from."""
+    config = PipelineConfig(
+        scenario_name=test_config.scenario_name,
+        cache_dir=test_config.cache_dir,
+        target_length=100,
+        output_format="dataframe",
+    )
+    # Without duplicate handling, the mock time values are not increasing
+    dataset = HandleLengthsTransformer(config).transform(unpacked_test_dataset)
+
+    with pytest.raises(ValidationError, match="not strictly increasing"):
+        DatasetConversionTransformer(config).transform(dataset)
+
+
+def test_validate_data_rejects_table_outputs(deduplicated_test_dataset, test_config):
+    """Test validate_data does not accept outputs it cannot check."""
+    config = PipelineConfig(
+        scenario_name=test_config.scenario_name,
+        cache_dir=test_config.cache_dir,
+        target_length=100,
+        output_format="dataframe",
+    )
+    dataset = HandleLengthsTransformer(config).transform(deduplicated_test_dataset)
+    df = DatasetConversionTransformer(config).transform(dataset).processed_data
+
+    with pytest.raises(ValidationError, match="Expected a mapping"):
+        validate_data(df, config)